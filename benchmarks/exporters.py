@@ -0,0 +1,158 @@
+"""Compares the in-memory and streaming exporters on the test suite's stressor.
+
+The content mirrors the one used to generate `tests/_exporter_targets.py`: a
+densely colored pixel matrix followed by some styled text.
+
+Running this file also measures how `export_many` scales with its worker count, by
+exporting a batch of markup-heavy reports.
+
+Run with `python benchmarks/exporters.py`, or as part of the benchmark suite with
+`ptg --bench exporters --bench-path benchmarks`.
+"""
+
+from __future__ import annotations
+
+import io
+from random import Random
+from time import perf_counter
+from timeit import repeat
+from typing import Callable
+
+import pytermgui as ptg
+from pytermgui.bench import benchmark
+from pytermgui.exporters import export_many, to_html, to_svg
+from pytermgui.stream_exporters import stream_html, stream_svg
+
+SIZE = 30
+REPEAT = 5
+
+REPORTS = 400
+WORKER_COUNTS = (1, 2, 4, 8)
+
+
+def _create_content() -> str:
+    """Renders a `SIZE`x`SIZE` dense pixel matrix of random colors, and some text."""
+
+    rand = Random(0)
+    matrix = ptg.DensePixelMatrix(SIZE, SIZE)
+
+    for row in range(SIZE):
+        for col in range(SIZE):
+            matrix[row, col] = str(rand.randint(16, 255))
+
+    matrix.build()
+
+    lines = matrix.get_lines()
+    lines.append(ptg.tim.parse("[@141 61]Hello[inverse]There"))
+
+    return "\n".join(lines)
+
+
+def _create_reports() -> list[str]:
+    """Creates `REPORTS` markup-heavy reports, using aliases & macros."""
+
+    ptg.tim.alias("report-title", "bold !upper 141")
+    ptg.tim.alias("report-key", "italic 245")
+
+    rand = Random(0)
+    reports = []
+
+    for i in range(REPORTS):
+        lines = [f"[report-title]Report {i}[/]", ""]
+
+        for row in range(20):
+            value = rand.randint(0, 100)
+
+            lines.append(
+                f"[report-key]{row:>3}[/] [!gradient(#ff0000:#ffff00:#00ff00)]"
+                + f"{'█' * (value // 2):<50}[/] [{rand.randint(16, 231)}]{value}%"
+            )
+
+        reports.append("\n".join(lines))
+
+    return reports
+
+
+def _measure_scaling() -> None:
+    """Prints the throughput of `export_many` for each of `WORKER_COUNTS`."""
+
+    reports = _create_reports()
+    baseline = None
+
+    print(f"{'workers':>12} {'time':>12} {'reports/s':>12} {'speedup':>12}")
+
+    for workers in WORKER_COUNTS:
+        ptg.tim.clear_cache()
+
+        start = perf_counter()
+        for _ in export_many(reports, workers=workers):
+            pass
+        elapsed = perf_counter() - start
+
+        baseline = baseline or elapsed
+
+        print(
+            f"{workers:>12} {elapsed * 1000:>9.0f} ms {REPORTS / elapsed:>12.1f}"
+            + f" {baseline / elapsed:>11.2f}x"
+        )
+
+
+def _measure(export: Callable[[], str]) -> tuple[float, int]:
+    """Returns the best runtime of the export, and the size of its output."""
+
+    output = export()
+    best = min(repeat(export, number=1, repeat=REPEAT))
+
+    return best, len(output)
+
+
+def _streamed(exporter: Callable[..., int], content: str) -> Callable[[], str]:
+    """Wraps a streaming exporter so it returns the written document."""
+
+    def _export() -> str:
+        file = io.StringIO()
+        exporter(content, file)
+
+        return file.getvalue()
+
+    return _export
+
+
+@benchmark("exporters: stream_html")
+def _bench_stream_html() -> Callable[[], str]:
+    return _streamed(stream_html, _create_content())
+
+
+@benchmark("exporters: stream_svg")
+def _bench_stream_svg() -> Callable[[], str]:
+    return _streamed(stream_svg, _create_content())
+
+
+def main() -> None:
+    """Prints the runtime & output size of each exporter."""
+
+    ptg.Color.default_background = ptg.str_to_color("#000000")
+    ptg.Color.default_foreground = ptg.str_to_color("#ffffff")
+
+    content = _create_content()
+
+    exporters = {
+        "to_html": lambda: to_html(content),
+        "stream_html": _streamed(stream_html, content),
+        "to_svg": lambda: to_svg(content),
+        "stream_svg": _streamed(stream_svg, content),
+    }
+
+    print(f"{'exporter':>12} {'time':>12} {'size':>12}")
+
+    for name, export in exporters.items():
+        best, size = _measure(export)
+
+        print(f"{name:>12} {best * 1000:>9.3f} ms {size:>10} B")
+
+    print()
+    _measure_scaling()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Measures the time `import pytermgui` spends in the library's own modules.
+
+Heavy submodules are imported lazily (see `pytermgui._LAZY_EXPORTS`), so only the
+core modules should show up here. The self time of each module is read from
+`python -X importtime`, and the best of `REPEAT` runs is kept.
+
+Run with `python benchmarks/import_time.py`, or as part of the benchmark suite with
+`ptg --bench import --bench-path benchmarks`.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+from typing import Callable
+
+from pytermgui.bench import benchmark
+
+ROOT = Path(__file__).parents[1]
+
+REPEAT = 5
+
+IMPORT_BUDGET = 0.1
+"""The maximum time, in seconds, that should be spent in pytermgui's own modules."""
+
+
+def _import() -> subprocess.CompletedProcess:
+    """Imports pytermgui in a fresh interpreter, with import timing enabled."""
+
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import pytermgui"],
+        capture_output=True,
+        check=True,
+        cwd=ROOT,
+        text=True,
+    )
+
+
+def _get_module_times() -> dict[str, float]:
+    """Returns the self time, in seconds, of each pytermgui module imported."""
+
+    times = {}
+
+    for line in _import().stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        self_time, _, name = line[len("import time:") :].split("|")
+        name = name.strip()
+
+        if name.startswith("pytermgui"):
+            times[name] = int(self_time) / 1_000_000
+
+    return times
+
+
+@benchmark("import pytermgui")
+def _bench_import() -> Callable[[], subprocess.CompletedProcess]:
+    return _import
+
+
+def main() -> None:
+    """Prints the slowest modules of the best run, and the total against the budget."""
+
+    runs = [_get_module_times() for _ in range(REPEAT)]
+    best = min(runs, key=lambda times: sum(times.values()))
+    total = sum(best.values())
+
+    print(f"{'module':<40} {'self time':>12}")
+
+    for name, self_time in sorted(best.items(), key=lambda item: -item[1])[:10]:
+        print(f"{name:<40} {self_time * 1000:>9.2f} ms")
+
+    status = "within" if total < IMPORT_BUDGET else "over"
+    print(f"\n{'total':<40} {total * 1000:>9.2f} ms ({status} the budget)")
+
+
+if __name__ == "__main__":
+    main()
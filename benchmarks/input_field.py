@@ -0,0 +1,59 @@
+"""Measures `InputField` keystroke latency against document size.
+
+Run with `python benchmarks/input_field.py`, or as part of the benchmark suite with
+`ptg --bench InputField --bench-path benchmarks`.
+"""
+
+from __future__ import annotations
+
+from timeit import repeat
+from typing import Callable
+
+import pytermgui as ptg
+from pytermgui.bench import benchmark
+
+SIZES = [10, 100, 1000, 5000]
+KEYSTROKES = 50
+
+
+def _create_field(size: int) -> ptg.InputField:
+    """Creates a multiline field with `size` lines of text, cursor in the middle."""
+
+    document = "\n".join(f"{i:>5}: The quick brown fox jumps over" for i in range(size))
+
+    field = ptg.InputField(document, multiline=True, width=80)
+    field.move_cursor((size // 2, 5), absolute=True)
+    field.get_lines()
+
+    return field
+
+
+def _type(field: ptg.InputField) -> None:
+    """Types & renders `KEYSTROKES` characters."""
+
+    for _ in range(KEYSTROKES):
+        field.handle_key("a")
+        field.get_lines()
+
+
+@benchmark("InputField.handle_key: 1000 lines")
+def _bench_keystrokes() -> Callable[[], None]:
+    field = _create_field(1000)
+
+    return lambda: _type(field)
+
+
+def main() -> None:
+    """Prints the best per-keystroke latency for every document size."""
+
+    print(f"{'lines':>8} {'per keystroke':>16}")
+
+    for size in SIZES:
+        field = _create_field(size)
+        best = min(repeat(lambda: _type(field), number=1, repeat=5))
+
+        print(f"{size:>8} {best / KEYSTROKES * 1000:>13.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Measures how many bytes the compositor emits for each cell it changes.
+
+A `ScreenEmulator` is used as the terminal's stream, so the numbers reflect what
+an actual terminal would have to parse & display.
+
+Run with `python benchmarks/rendering.py`, or as part of the benchmark suite with
+`ptg --bench Compositor --bench-path benchmarks`.
+"""
+
+from __future__ import annotations
+
+from timeit import repeat
+from typing import Callable
+
+import pytermgui as ptg
+from pytermgui.bench import benchmark
+from pytermgui.window_manager.compositor import Compositor
+
+SIZE = (120, 40)
+FRAMES = 20
+
+
+def _create_windows(counter: ptg.Label) -> list[ptg.Window]:
+    """Creates a handful of windows, one of which contains `counter`."""
+
+    windows = []
+
+    for i in range(4):
+        window = ptg.Window(
+            f"[bold]Window {i}",
+            "",
+            ptg.Splitter("[@60] Left ", "[141]Center", "[@57 bold]Right"),
+            ptg.InputField(f"Some value {i}", prompt="Input: "),
+            ptg.Checkbox(),
+            width=50,
+        )
+        window.pos = (2 + (i % 2) * 60, 2 + (i // 2) * 18)
+        windows.append(window)
+
+    windows[0] += counter
+
+    return windows
+
+
+@benchmark("Compositor.draw: single label change")
+def _bench_draw() -> Callable[[], None]:
+    screen = ptg.ScreenEmulator(SIZE)
+    terminal = ptg.Terminal(screen, size=screen.size)
+    terminal.forced_colorsystem = ptg.get_terminal().colorsystem
+
+    counter = ptg.Label("Frame 0", parent_align=0)
+    compositor = Compositor(_create_windows(counter), framerate=60)
+    frame = 0
+
+    def _draw() -> None:
+        nonlocal frame
+
+        previous = ptg.get_terminal()
+        ptg.set_global_terminal(terminal)
+
+        frame += 1
+        counter.value = f"Frame {frame}"
+
+        try:
+            compositor.draw()
+        finally:
+            ptg.set_global_terminal(previous)
+
+    return _draw
+
+
+def _measure(encode: bool, force: bool) -> None:
+    """Draws `FRAMES` frames that each change a single label, and prints stats.
+
+    Args:
+        encode: Whether the compositor should minimize its SGR sequences.
+        force: Whether every frame should be a full redraw.
+    """
+
+    screen = ptg.ScreenEmulator(SIZE)
+    terminal = ptg.Terminal(screen, size=screen.size)
+    ptg.set_global_terminal(terminal)
+
+    counter = ptg.Label("Frame 0", parent_align=0)
+    compositor = Compositor(_create_windows(counter), framerate=60)
+
+    if not encode:
+        compositor.encoder = None
+
+    compositor.draw()
+
+    screen.reset_stats()
+    frame = 0
+
+    def _draw() -> None:
+        nonlocal frame
+
+        frame += 1
+        counter.value = f"Frame {frame}"
+        compositor.draw(force=force)
+
+    best = min(repeat(_draw, number=1, repeat=FRAMES))
+
+    per_frame = screen.bytes_written / screen.frames
+    changed = screen.cells_changed / screen.frames
+
+    print(f"{'frames':>16}: {screen.frames}")
+    print(f"{'best frame time':>16}: {best * 1000:.3f} ms")
+    print(f"{'bytes / frame':>16}: {per_frame:.0f}")
+    print(f"{'cells / frame':>16}: {changed:.0f}")
+    print(f"{'bytes / cell':>16}: {per_frame / max(changed, 1):.2f}")
+
+
+def main() -> None:
+    """Prints stats for full & partial redraws, with and without the SGR encoder."""
+
+    for force in (False, True):
+        for encode in (False, True):
+            redraw = "full redraw" if force else "label change"
+            encoder = "SGREncoder" if encode else "raw"
+
+            print(f"{redraw}, {encoder}:")
+            _measure(encode, force)
+            print()
+
+
+if __name__ == "__main__":
+    main()
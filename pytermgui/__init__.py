@@ -7,32 +7,42 @@ more!
 # https://github.com/python/mypy/issues/4930
 # mypy: ignore-errors
 
+# The lazy export table repeats the `__all__` of the modules it loads
+# pylint: disable=duplicate-code
+
 from __future__ import annotations
 
 import sys
-from typing import Any, Optional
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-from .animations import *
 from .ansi_interface import *
 from .colors import *
 from .context_managers import alt_buffer, cursor_at, mouse_handler
 from .enums import *
 from .exceptions import *
-from .exporters import *
-from .fancy_repr import *
-from .file_loaders import *
 from .helpers import *
-from .highlighters import *
 from .input import *
-from .inspector import *
 from .markup import *
 from .palettes import *
-from .prettifiers import *
 from .regex import *
-from .serialization import *
-from .term import *
-from .widgets import *
-from .window_manager import *
+from .term import ColorSystem, Recorder, Terminal, get_terminal, set_global_terminal
+
+if TYPE_CHECKING:
+    from .animations import *
+    from .asciicast import *
+    from .emulator import *
+    from .exporters import *
+    from .fancy_repr import *
+    from .file_loaders import *
+    from .highlighters import *
+    from .inspector import *
+    from .prettifiers import *
+    from .serialization import *
+    from .stream_exporters import *
+    from .term import terminal
+    from .widgets import *
+    from .window_manager import *
 
 # Silence warning if running as standalone module
 if "-m" in sys.argv:  # pragma: no cover
@@ -42,95 +52,165 @@ if "-m" in sys.argv:  # pragma: no cover
 
 __version__ = "7.7.2"
 
+_LAZY_EXPORTS = {
+    "animations": (
+        "Animator",
+        "FloatAnimation",
+        "AttrAnimation",
+        "EASINGS",
+        "animator",
+        "is_animated",
+        "linear",
+        "ease_in",
+        "ease_out",
+        "ease_in_out",
+    ),
+    "asciicast": ("AsciicastRecorder", "AsciicastReader"),
+    "emulator": ("Cell", "ScreenEmulator"),
+    "exporters": ("token_to_css", "to_html", "to_svg", "export_many"),
+    "fancy_repr": ("SupportsFancyRepr", "supports_fancy_repr", "build_fancy_repr"),
+    "file_loaders": ("WidgetNamespace", "FileLoader", "YamlLoader", "JsonLoader"),
+    "highlighters": (
+        "Highlighter",
+        "RegexHighlighter",
+        "highlight_tim",
+        "highlight_python",
+    ),
+    "inspector": ("Inspector", "inspect"),
+    "prettifiers": ("prettify",),
+    "serialization": ("serializer", "Serializer"),
+    "sgr": ("SGREncoder", "minimize_sgr"),
+    "stream_exporters": ("stream_html", "stream_svg"),
+    "widgets": (
+        "auto",
+        "boxes",
+        "find_widgets",
+        "get_id",
+        "get_widget",
+        "inline",
+        "parse_selector",
+        "Selector",
+        "Widget",
+        "WidgetType",
+        "Label",
+        "ScrollableWidget",
+        "Button",
+        "Checkbox",
+        "Collapsible",
+        "ColorPicker",
+        "Container",
+        "Splitter",
+        "FancyReprWidget",
+        "Frame",
+        "ASCII",
+        "ASCII_X",
+        "ASCII_O",
+        "Light",
+        "Heavy",
+        "Double",
+        "Rounded",
+        "Frameless",
+        "Padded",
+        "InputField",
+        "KeyboardButton",
+        "PixelMatrix",
+        "DensePixelMatrix",
+        "RGBPixelMatrix",
+        "DenseRGBPixelMatrix",
+        "Slider",
+        "MarkupFormatter",
+        "HighlighterStyle",
+        "StyleCall",
+        "StyleType",
+        "StyleManager",
+        "DepthlessStyleType",
+        "CharType",
+        "Toggle",
+    ),
+    "window_manager": (
+        "Compositor",
+        "Layout",
+        "WindowManager",
+        "Window",
+        "FrameProfiler",
+        "FrameStats",
+        "ProfilerOverlay",
+        "WidgetStats",
+    ),
+}
+"""The submodules only imported once one of their exported names are accessed."""
+
+_LEGACY_EXPORTS = {
+    "widgets": (
+        "WidgetChange",
+        "w_styles",
+        "styles",
+        "base",
+        "button",
+        "checkbox",
+        "collapsible",
+        "color_picker",
+        "containers",
+        "frames",
+        "input_field",
+        "keyboard_button",
+        "pixel_matrix",
+        "slider",
+        "toggle",
+        "Callable",
+        "Iterator",
+        "Optional",
+        "Type",
+        "Union",
+        "cast",
+        "zip_longest",
+    ),
+    "window_manager": ("compositor", "layouts", "manager", "window"),
+}
+"""Names that leaked into the package namespace through the star-imports of modules
+without an `__all__`. They are still resolved lazily, so code using them keeps working.
+"""
 
-def auto(data: Any, **widget_args: Any) -> Optional[Widget | list[Splitter]]:
-    """Creates a widget from specific data structures.
-
-    This conversion includes various widget classes, as well as some shorthands for
-    more complex objects.  This method is called implicitly whenever a non-widget is
-    attempted to be added to a Widget.
-
-    You can read up on the syntacies for each builtin widget within the widget
-    [documentation](/widgets/builtins).
+_LAZY_SUBMODULES = (*_LAZY_EXPORTS, "win32console")
 
-    Args:
-        data: The structure to convert. See below for formats.
-        **widget_args: Arguments passed straight to the widget constructor.
+_LAZY_NAMES = {
+    name: module
+    for exports in (_LAZY_EXPORTS, _LEGACY_EXPORTS)
+    for module, names in exports.items()
+    for name in names
+}
 
-    Returns:
-        The widget or list of widgets created, or None if the passed structure could
-        not be converted.
 
-    Example:
+def __getattr__(name: str) -> Any:
+    """Imports the submodule providing `name` on first access.
 
-    ```python3
-    from pytermgui import Container
-    form = (
-        Container(id="form")
-        + "[157 bold]This is a title"
-        + ""
-        + {"[72 italic]Label1": "[210]Button1"}
-        + {"[72 italic]Label2": "[210]Button2"}
-        + {"[72 italic]Label3": "[210]Button3"}
-        + ""
-        + ["Submit", lambda _, button, your_submit_handler(button.parent)]
-    )
-    ```
+    `terminal` is never cached, so it always refers to the current global terminal.
     """
-    # In my opinion, returning immediately after construction is much more readable.
-    # pylint: disable=too-many-return-statements
-
-    # Nothing to do.
-    if isinstance(data, Widget):
-        # Set all **widget_args
-        for key, value in widget_args.items():
-            setattr(data, key, value)
-
-        return data
-
-    # Label
-    if isinstance(data, str):
-        return Label(data, **widget_args)
-
-    # Splitter
-    if isinstance(data, tuple):
-        return Splitter(*data, **widget_args)
-
-    # buttons
-    if isinstance(data, list):
-        label = data[0]
-        onclick = None
-        if len(data) > 1:
-            onclick = data[1]
 
-        # Checkbox
-        if isinstance(label, bool):
-            return Checkbox(onclick, checked=label, **widget_args)
+    if name == "terminal":
+        return get_terminal()
 
-        # Toggle
-        if isinstance(label, tuple):
-            assert len(label) == 2
-            return Toggle(label, onclick, **widget_args)
+    if name in _LAZY_SUBMODULES:
+        return import_module(f".{name}", __name__)
 
-        return Button(label, onclick, **widget_args)
+    module = _LAZY_NAMES.get(name)
 
-    # prompt splitter
-    if isinstance(data, dict):
-        rows: list[Splitter] = []
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-        for key, value in data.items():
-            left = auto(key, parent_align=HorizontalAlignment.LEFT)
-            right = auto(value, parent_align=HorizontalAlignment.RIGHT)
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
 
-            rows.append(Splitter(left, right, **widget_args))
+    return value
 
-        if len(rows) == 1:
-            return rows[0]
 
-        return rows
+def __dir__() -> list[str]:
+    """Lists the lazily imported names alongside the already imported ones."""
 
-    return None
+    return sorted({*globals(), *_LAZY_NAMES, *_LAZY_SUBMODULES, "terminal"})
 
 
-# Alternative binding for the `auto` method
-Widget.from_data = staticmethod(auto)
+__all__ = [
+    name for name in globals() if not name.startswith("_") and name != "annotations"
+]
+__all__ += [*_LAZY_NAMES, "terminal"]
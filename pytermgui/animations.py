@@ -5,27 +5,59 @@ global instance of `Animator` is also exported, under the `animator` name.
 
 These can be used both within a WindowManager context (where stepping is done
 automatically by the `pytermgui.window_manager.Compositor` on every frame, or manually,
-by calling `animator.step` with an elapsed time argument.
+by calling `animator.step` with an elapsed time argument, or `animator.update` with
+a timestamp. The timestamps come from the animator's `clock`, which can be replaced by
+a virtual one to step animations deterministically.
 
 You can register animations to the Animator using either its `schedule` method, with
 an already constructed `Animation` subclass, or either `Animator.animate_attr` or
 `Animator.animate_float` for an in-place construction of the animation instance.
+
+Animations progress linearly by default. An easing curve, either one of the functions
+in `EASINGS` or any callable mapping `[0, 1]` onto itself, can be given as `easing`.
+`AttrAnimation` can also go through a list of keyframes instead of a start & end value:
+
+```python3
+animator.animate_attr(
+    target=window,
+    attr="width",
+    keyframes=[(0.0, 20), (0.7, 80), (1.0, 60)],
+    easing="ease_out",
+    duration=500,
+)
+```
 """
 
 # pylint: disable=too-many-arguments, too-many-instance-attributes
 
 from __future__ import annotations
 
+import time
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, List, Sequence, Tuple
 
 if TYPE_CHECKING:
     from .widgets import Widget
 else:
     Widget = Any
 
-__all__ = ["Animator", "FloatAnimation", "AttrAnimation", "animator", "is_animated"]
+__all__ = [
+    "Animator",
+    "FloatAnimation",
+    "AttrAnimation",
+    "EASINGS",
+    "animator",
+    "is_animated",
+    "linear",
+    "ease_in",
+    "ease_out",
+    "ease_in_out",
+]
+
+Easing = Callable[[float], float]
+Keyframes = Tuple[List[float], List[float]]
 
 
 def _add_flag(target: object, attribute: str) -> None:
@@ -70,6 +102,108 @@ def is_animated(target: object, attribute: str) -> bool:
     return attribute in animated
 
 
+def linear(progress: float) -> float:
+    """Returns the progress unchanged."""
+
+    return progress
+
+
+def ease_in(progress: float) -> float:
+    """Starts slow, and accelerates towards the end."""
+
+    return progress * progress * progress
+
+
+def ease_out(progress: float) -> float:
+    """Starts fast, and decelerates towards the end."""
+
+    inverse = 1.0 - progress
+
+    return 1.0 - inverse * inverse * inverse
+
+
+def ease_in_out(progress: float) -> float:
+    """Accelerates until the halfway point, and decelerates after it."""
+
+    if progress < 0.5:
+        return 4.0 * progress * progress * progress
+
+    inverse = 2.0 - 2.0 * progress
+
+    return 1.0 - inverse * inverse * inverse / 2.0
+
+
+EASINGS: dict[str, Easing] = {
+    "linear": linear,
+    "ease_in": ease_in,
+    "ease_out": ease_out,
+    "ease_in_out": ease_in_out,
+}
+"""The easing curves that can be given to animations by name."""
+
+
+def _get_easing(easing: Easing | str) -> Easing:
+    """Returns the easing function of the given name, or the given function."""
+
+    if not isinstance(easing, str):
+        return easing
+
+    if easing not in EASINGS:
+        raise ValueError(
+            f"Unknown easing {easing!r}, expected one of {list(EASINGS)}."
+        )
+
+    return EASINGS[easing]
+
+
+def _get_keyframes(keyframes: Sequence[tuple[float, float]]) -> Keyframes:
+    """Splits a sequence of (position, value) keyframes into sorted positions & values.
+
+    Raises:
+        ValueError: No keyframes were given, or a position is outside of `[0, 1]`.
+    """
+
+    if len(keyframes) == 0:
+        raise ValueError("At least one keyframe is required.")
+
+    ordered = sorted(keyframes, key=lambda keyframe: keyframe[0])
+
+    if not 0.0 <= ordered[0][0] <= ordered[-1][0] <= 1.0:
+        raise ValueError(f"Keyframe positions must be within [0, 1], got {keyframes}.")
+
+    return [float(pos) for pos, _ in ordered], [value for _, value in ordered]
+
+
+def _carry_over(remaining: float, duration: float) -> float:
+    """Returns the time remaining of a looping animation after it turns around.
+
+    Time elapsed past the end is carried over into the next run, so loops don't drift.
+    """
+
+    if duration <= 0:
+        return 0.0
+
+    return duration - (-remaining) % duration
+
+
+def _interpolate(keyframes: Keyframes, state: float) -> float:
+    """Returns the value at the given state of some keyframes."""
+
+    positions, values = keyframes
+    index = bisect_right(positions, state)
+
+    if index == 0:
+        return values[0]
+
+    if index == len(positions):
+        return values[-1]
+
+    start, end = positions[index - 1], positions[index]
+    previous = values[index - 1]
+
+    return previous + (values[index] - previous) * (state - start) / (end - start)
+
+
 class Direction(Enum):
     """Animation directions."""
 
@@ -79,7 +213,18 @@ class Direction(Enum):
 
 @dataclass
 class Animation:
-    """The baseclass for all animations."""
+    """The baseclass for all animations.
+
+    `state` goes from 0.0 to 1.0 (or the other way around when going backwards) over
+    `duration` milliseconds, shaped by `easing`. This can either be a function from
+    `EASINGS`, its name, or any other function mapping `[0, 1]` onto itself.
+    Subclasses that don't define an `easing` field progress linearly.
+
+    `on_step` is called after every step, and finishes the animation when it returns
+    True. Once a looping animation reaches the end of a run, its `direction` is
+    flipped before `on_step` is called. It then already refers to the next run,
+    while `state` is still at the end of the current one.
+    """
 
     duration: int
     direction: Direction
@@ -93,6 +238,7 @@ class Animation:
 
     def __post_init__(self) -> None:
         self.state = 0.0 if self.direction is Direction.FORWARD else 1.0
+        self.easing: Easing | str = _get_easing(getattr(self, "easing", linear))
         self._remaining = self.duration
         self._is_paused = False
 
@@ -111,18 +257,22 @@ class Animation:
 
         self._remaining -= elapsed * 1000
 
-        self.state = (self.duration - self._remaining) / self.duration
+        progress = 1.0
+        if self.duration > 0:
+            progress = (self.duration - self._remaining) / self.duration
+            progress = min(max(progress, 0.0), 1.0)
+
+        assert callable(self.easing)
+        self.state = self.easing(progress)
 
         if self.direction is Direction.BACKWARD:
             self.state = 1 - self.state
 
-        self.state = min(self.state, 1.0)
-
-        if not 0.0 <= self.state < 1.0:
+        if progress == 1.0:
             if not self.loop:
                 return True
 
-            self._remaining = self.duration
+            self._remaining = _carry_over(self._remaining, self.duration)
             self.direction = Direction(self.direction.value * -1)
 
         return False
@@ -181,6 +331,7 @@ class FloatAnimation(Animation):
 
     direction: Direction = Direction.FORWARD
     loop: bool = False
+    easing: Easing | str = linear
 
     state: float = field(init=False)
     _remaining: int = field(init=False)
@@ -188,19 +339,26 @@ class FloatAnimation(Animation):
 
 @dataclass
 class AttrAnimation(Animation):
-    """Animates an attribute going from one value to another."""
+    """Animates an attribute going from one value to another.
+
+    When `keyframes` are given as a sequence of `(position, value)` pairs, the
+    attribute goes through each of their values instead, reaching them at the given
+    position (within `[0, 1]`) of the animation. `start` and `end` are ignored.
+    """
 
     target: object = None
     attr: str = ""
     value_type: type = int
     end: int | float = 0
     start: int | float | None = None
+    keyframes: Sequence[tuple[float, float]] | None = None
 
     on_step: Callable[[Animation], bool] | None = None
     on_finish: Callable[[Animation], None] | None = None
 
     direction: Direction = Direction.FORWARD
     loop: bool = False
+    easing: Easing | str = linear
 
     state: float = field(init=False)
     _remaining: int = field(init=False)
@@ -208,10 +366,17 @@ class AttrAnimation(Animation):
     def __post_init__(self) -> None:
         super().__post_init__()
 
-        if self.start is None:
+        self._keyframes: Keyframes | None = None
+
+        if self.keyframes is not None:
+            self._keyframes = _get_keyframes(self.keyframes)
+            self.start = self._keyframes[1][0]
+            self.end = self._keyframes[1][-1]
+
+        elif self.start is None:
             self.start = getattr(self.target, self.attr)
 
-        if self.end < self.start:
+        if self._keyframes is None and self.end < self.start:
             self.start, self.end = self.end, self.start
             self.direction = Direction.BACKWARD
 
@@ -219,6 +384,16 @@ class AttrAnimation(Animation):
 
         _add_flag(self.target, self.attr)
 
+    def get_value(self) -> float:
+        """Returns the value of the attribute at the current state."""
+
+        assert self.start is not None
+
+        if self._keyframes is not None:
+            return _interpolate(self._keyframes, self.state)
+
+        return self.start + (self.end * self.state)
+
     def step(self, elapsed: float) -> bool:
         """Steps forward in the attribute animation."""
 
@@ -226,10 +401,7 @@ class AttrAnimation(Animation):
 
         step_finished = False
 
-        assert self.start is not None
-
-        updated = self.start + (self.end * self.state)
-        setattr(self.target, self.attr, self.value_type(updated))
+        setattr(self.target, self.attr, self.value_type(self.get_value()))
 
         if self.on_step is not None:
             step_finished = self.on_step(self)
@@ -246,44 +418,316 @@ class AttrAnimation(Animation):
         super().finish()
 
 
+_BATCHED_STEPS = (Animation.step, AttrAnimation.step)
+
+
 class Animator:
     """The Animator class
 
-    This class maintains a list of animations (self._animations), stepping
-    each of them forward as long as they return False. When they return
-    False, the animation is removed from the tracked animations.
+    This class maintains the active animations, stepping each of them forward until
+    they finish, at which point they are removed.
+
+    Active animations are stored as a struct of arrays: the numbers & targets needed to
+    advance them are kept in parallel lists, indexed by the animation's slot, so `step`
+    can advance all of them in a single loop without calling into each `Animation`.
+    The lists are filled from the animation when it gets scheduled, so changing its
+    duration, easing or target afterwards has no effect. Animations that override
+    `step` or `_update_state` are stepped by calling their `step` method instead.
+
+    Finished animations are removed by moving the last slot into their place, so the
+    order animations are stepped in is not preserved.
 
     This stepping is done when `step` is called.
     """
 
-    def __init__(self) -> None:
-        """Initializes an animator."""
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initializes an animator.
 
-        self._animations: list[Animation] = []
+        Args:
+            clock: The function returning the current time in seconds, used by
+                `update` & `next_deadline`. It should be monotonic.
+        """
+
+        self.clock = clock
+        """The function returning the current time in seconds."""
+
+        self.last_step_time = 0.0
+        """The time, in seconds, the most recent `step` call took."""
+
+        self._time: float | None = None
+
+        self.clear()
 
     def __contains__(self, item: object) -> bool:
-        """Returns whether the item is inside _animations."""
+        """Returns whether the item is an active or scheduled animation."""
 
-        return item in self._animations
+        return item in self._animations or item in self._pending
 
     @property
     def is_active(self) -> bool:
         """Determines whether there are any active animations."""
 
-        return len(self._animations) > 0
+        return len(self._animations) + len(self._pending) > 0
+
+    @property
+    def next_deadline(self) -> float | None:
+        """The clock time at which the next animation finishes or turns around.
+
+        This is the current time while there are animations waiting to start, and
+        None if there is nothing left to animate.
+        """
+
+        # pylint: disable=protected-access
+
+        if len(self._pending) > 0:
+            return self.clock()
+
+        soonest = min(
+            (
+                left
+                for left, animation in zip(self._remaining, self._animations)
+                if left > 0 and not animation._is_paused
+            ),
+            default=None,
+        )
+
+        if soonest is None:
+            return None
+
+        now = self.clock() if self._time is None else self._time
+
+        return now + soonest / 1000
+
+    def clear(self) -> None:
+        """Removes all animations, without finishing them."""
+
+        self._pending: list[Animation] = []
+
+        self._animations: list[Animation] = []
+        self._remaining: list[float] = []
+        self._durations: list[float] = []
+        self._forward: list[bool] = []
+        self._loops: list[bool] = []
+        self._easings: list[Easing | None] = []
+        self._batched: list[bool] = []
+
+        self._targets: list[object] = []
+        self._attrs: list[str | None] = []
+        self._types: list[type] = []
+        self._starts: list[float] = []
+        self._deltas: list[float] = []
+        self._keyframes: list[Keyframes | None] = []
+
+        self._columns = (
+            self._animations,
+            self._remaining,
+            self._durations,
+            self._forward,
+            self._loops,
+            self._easings,
+            self._batched,
+            self._targets,
+            self._attrs,
+            self._types,
+            self._starts,
+            self._deltas,
+            self._keyframes,
+        )
+
+    def _insert(self, animation: Animation) -> None:
+        """Fills a new slot with the given animation's data."""
+
+        # pylint: disable=protected-access
+
+        cls = type(animation)
+        easing = animation.easing
+        assert callable(easing)
+
+        self._animations.append(animation)
+        self._remaining.append(animation._remaining)
+        self._durations.append(animation.duration)
+        self._forward.append(animation.direction is Direction.FORWARD)
+        self._loops.append(animation.loop)
+        self._easings.append(None if easing is linear else easing)
+        self._batched.append(
+            cls.step in _BATCHED_STEPS
+            and cls._update_state is Animation._update_state
+        )
+
+        if not isinstance(animation, AttrAnimation):
+            self._targets.append(None)
+            self._attrs.append(None)
+            self._types.append(float)
+            self._starts.append(0.0)
+            self._deltas.append(0.0)
+            self._keyframes.append(None)
+            return
+
+        assert animation.start is not None
+
+        self._targets.append(animation.target)
+        self._attrs.append(animation.attr)
+        self._types.append(animation.value_type)
+        self._starts.append(animation.start)
+        self._deltas.append(animation.end)
+        self._keyframes.append(animation._keyframes)
+
+    def _remove(self, slot: int) -> None:
+        """Removes the given slot, by moving the last one into its place."""
+
+        for column in self._columns:
+            column[slot] = column[-1]
+            column.pop()
+
+    def _write_attr(self, slot: int, state: float) -> None:
+        """Sets the attribute animated in the given slot to its value at the state."""
+
+        frames = self._keyframes[slot]
+        value = (
+            self._starts[slot] + self._deltas[slot] * state
+            if frames is None
+            else _interpolate(frames, state)
+        )
+
+        setattr(self._targets[slot], str(self._attrs[slot]), self._types[slot](value))
+
+    def _advance(self, elapsed: float) -> list[int]:
+        """Advances every active animation by the given milliseconds.
+
+        Returns:
+            The slots of the animations that have finished.
+        """
+
+        # pylint: disable=too-many-locals, too-many-branches, protected-access
+
+        remaining = self._remaining
+        durations = self._durations
+        forward = self._forward
+        loops = self._loops
+        easings = self._easings
+        batched = self._batched
+        attrs = self._attrs
+
+        finished: list[int] = []
+
+        for i, animation in enumerate(self._animations):
+            if animation._is_paused:
+                continue
+
+            if not batched[i]:
+                if animation.step(elapsed / 1000):
+                    finished.append(i)
+
+                remaining[i] = animation._remaining
+                continue
+
+            left = remaining[i] - elapsed
+            duration = durations[i]
+
+            progress = 1.0
+            if duration > 0:
+                progress = (duration - left) / duration
+
+                if progress >= 1.0:
+                    progress = 1.0
+                elif progress < 0.0:
+                    progress = 0.0
+
+            easing = easings[i]
+            state = progress if easing is None else easing(progress)
+
+            if not forward[i]:
+                state = 1.0 - state
+
+            animation.state = state
+
+            if attrs[i] is not None:
+                self._write_attr(i, state)
+
+            is_finished = False
+
+            # Like `Animation.step`, on_step sees the direction of the next run
+            if progress == 1.0:
+                if loops[i]:
+                    left = _carry_over(left, duration)
+                    forward[i] = not forward[i]
+                    animation.direction = (
+                        Direction.FORWARD if forward[i] else Direction.BACKWARD
+                    )
+
+                else:
+                    is_finished = True
+
+            remaining[i] = animation._remaining = left
+
+            on_step = animation.on_step
+            if on_step is not None and on_step(animation):
+                is_finished = True
+
+            if is_finished:
+                finished.append(i)
+
+        return finished
 
     def step(self, elapsed: float) -> None:
-        """Steps the animation forward by the given elapsed time."""
+        """Steps the animation forward by the given elapsed time.
+
+        Animations scheduled since the last step are started first. Finished ones are
+        removed, and then get their `finish` method called.
+
+        Args:
+            elapsed: The time elapsed since the last step, in seconds.
+        """
 
-        for animation in self._animations.copy():
-            if animation.step(elapsed):
-                self._animations.remove(animation)
-                animation.finish()
+        start = time.perf_counter()
+
+        pending = self._pending
+        if len(pending) > 0:
+            self._pending = []
+
+            for animation in pending:
+                self._insert(animation)
+
+        slots = self._advance(elapsed * 1000)
+        animations = self._animations
+        finished = [animations[slot] for slot in slots]
+
+        # Removing from the back keeps the remaining slots valid
+        for slot in reversed(slots):
+            self._remove(slot)
+
+        for animation in finished:
+            animation.finish()
+
+        self.last_step_time = time.perf_counter() - start
+
+    def update(self, now: float | None = None) -> None:
+        """Steps the animations forward to the given time.
+
+        The time elapsed is measured from the previous `update`, or from this one if
+        nothing was animating since. Calling it at any rate moves animations along
+        at the same speed.
+
+        Args:
+            now: The current time, as given by `clock`. Defaults to calling it.
+        """
+
+        if now is None:
+            now = self.clock()
+
+        previous = self._time
+        self._time = now
+
+        if previous is None or len(self._animations) == 0:
+            self.step(0.0)
+            return
+
+        self.step(max(now - previous, 0.0))
 
     def schedule(self, animation: Animation) -> None:
         """Starts an animation on the next step."""
 
-        self._animations.append(animation)
+        self._pending.append(animation)
 
     def animate_attr(self, **animation_args: Any) -> AttrAnimation:
         """Creates and schedules an AttrAnimation.
@@ -0,0 +1,340 @@
+"""Streaming asciicast (v2) recording, and seekable replay.
+
+See https://docs.asciinema.org/manual/asciicast/v2/ for the format. Recordings are
+JSON lines; a header, followed by `[timestamp, kind, data]` events.
+
+Besides the output events, `AsciicastRecorder` periodically writes a `keyframe`
+marker, followed by an output event that redraws the screen as it is at that point.
+`AsciicastReader` seeks by starting from the last of these snapshots before the
+target time, so it never has to replay the whole recording.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import re
+import time
+from typing import IO, Any, Callable, Iterator, Union, cast
+
+from .emulator import ScreenEmulator
+
+__all__ = ["AsciicastRecorder", "AsciicastReader"]
+
+PathOrFile = Union[str, os.PathLike, IO[str]]
+
+KEYFRAME_LABEL = "keyframe"
+"""The label of the marker events that precede screen snapshots."""
+
+RE_STATEFUL_SEQUENCE = re.compile(r"\x1b(?:\[\?|\])")
+"""Matches the start of private mode (`CSI ?`) & OSC sequences.
+
+Output containing these changes terminal state beyond what a screen clear resets,
+so it can never be dropped when coalescing frames.
+"""
+
+RE_SGR_SEQUENCE = re.compile(r"\x1b\[([0-9;:]*)m")
+RE_POSITIONED_CLEAR = re.compile(r"\x1b\[2J(?:\x1b\[[0-9;:]*m)*\x1b\[[0-9;]*[Hf]")
+RE_TRAILING_POSITION = re.compile(r"(\x1b\[[0-9;]*[Hf])(?:\x1b\[[0-9;:]*m)*\Z")
+
+
+def _drop_cleared(data: str, clear: int) -> str:
+    """Drops the output before a screen clear, keeping what the clear doesn't reset.
+
+    The style sequences since the last full reset are kept. So is the cursor position
+    before the clear, unless the clear is directly followed by one. When that position
+    isn't known (e.g. text was written after the last one), nothing is dropped.
+
+    Args:
+        data: The output.
+        clear: The index of the screen clear within the output.
+
+    Returns:
+        The output, starting at the clear.
+    """
+
+    prefix = data[:clear]
+    styles = list(RE_SGR_SEQUENCE.finditer(prefix))
+
+    for i in range(len(styles) - 1, -1, -1):
+        if styles[i].group(1).split(";")[0] in ("", "0"):
+            styles = styles[i:]
+            break
+
+    kept = "".join(match.group() for match in styles)
+
+    if RE_POSITIONED_CLEAR.match(data, clear) is None:
+        position = RE_TRAILING_POSITION.search(prefix)
+
+        if position is None:
+            return data
+
+        kept += position.group(1)
+
+    return kept + data[clear:]
+
+
+class AsciicastRecorder:  # pylint: disable=too-many-instance-attributes
+    """Streams terminal output into an asciicast (v2) file.
+
+    Each write is stored as an output event as soon as it happens, so nothing but the
+    pending (coalesced) output and the current screen is kept in memory.
+
+    When a target `fps` is given, writes that arrive faster than it are coalesced
+    into a single event. If the coalesced output clears the screen, the frames
+    before the last clear are dropped, keeping the style and cursor position they
+    leave behind. Sequences that change terminal modes (e.g. the alternate buffer or
+    cursor visibility) are never dropped, so neither is anything after the first of
+    them.
+
+    The output is also written into a `ScreenEmulator`. Every `keyframe_interval`
+    seconds, a `keyframe` marker is written before the next event, followed by a
+    snapshot of the emulated screen (see `ScreenEmulator.get_snapshot`).
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        file: PathOrFile,
+        size: tuple[int, int],
+        *,
+        fps: float | None = None,
+        compress: bool | None = None,
+        keyframe_interval: float = 5.0,
+        title: str | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initializes the recorder, and writes the asciicast header.
+
+        Args:
+            file: The path or text file to write into. Files passed in directly are
+                not closed by the recorder.
+            size: The (width, height) of the recorded terminal.
+            fps: If set, output is coalesced to at most this many events a second.
+            compress: Whether to gzip the output. Defaults to whether the path ends
+                with `.gz`. Has no effect when a file object is given.
+            keyframe_interval: The number of seconds between two keyframes.
+            title: The title of the recording, stored in the header.
+            clock: The function returning the current time in seconds.
+        """
+
+        self._owns_file = isinstance(file, (str, os.PathLike))
+
+        if isinstance(file, (str, os.PathLike)):
+            if compress is None:
+                compress = os.fspath(file).endswith(".gz")
+
+            # The file is kept open until `close` is called
+            if compress:
+                # pylint: disable-next=consider-using-with
+                self._file: IO[str] = gzip.open(file, "wt", encoding="utf-8")
+            else:
+                # pylint: disable-next=consider-using-with
+                self._file = open(file, "w", encoding="utf-8")
+
+        else:
+            self._file = file
+
+        self._clock = clock
+        self._start = clock()
+
+        self._interval = None if fps is None else 1 / fps
+        self._keyframe_interval = keyframe_interval
+        self._screen = ScreenEmulator(size)
+
+        self._last_event: float | None = None
+        self._last_keyframe = 0.0
+        self._pending: list[str] = []
+        self._pending_time = 0.0
+
+        header: dict[str, Any] = {
+            "version": 2,
+            "width": size[0],
+            "height": size[1],
+            "timestamp": int(time.time()),
+        }
+
+        if title is not None:
+            header["title"] = title
+
+        self._file.write(json.dumps(header) + "\n")
+
+    def __enter__(self) -> AsciicastRecorder:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def _write_line(self, timestamp: float, kind: str, data: str) -> None:
+        """Writes a single event."""
+
+        self._file.write(json.dumps([timestamp, kind, data], ensure_ascii=False) + "\n")
+
+    def _write_event(self, timestamp: float, data: str) -> None:
+        """Writes an output event, preceded by a keyframe if one is due."""
+
+        if timestamp - self._last_keyframe >= self._keyframe_interval:
+            self._write_line(timestamp, "m", KEYFRAME_LABEL)
+            self._write_line(timestamp, "o", self._screen.get_snapshot())
+            self._last_keyframe = timestamp
+
+        self._write_line(timestamp, "o", data)
+        self._screen.write(data)
+        self._last_event = timestamp
+
+    def flush(self) -> None:
+        """Writes out any coalesced output, and flushes the file."""
+
+        if self._pending:
+            data = "".join(self._pending)
+            self._pending = []
+
+            stateful = RE_STATEFUL_SEQUENCE.search(data)
+            limit = len(data) if stateful is None else stateful.start()
+
+            clear = data.rfind("\x1b[2J", 0, limit)
+            if clear > 0:
+                data = _drop_cleared(data, clear)
+
+            self._write_event(self._pending_time, data)
+
+        self._file.flush()
+
+    def write(self, data: str) -> None:
+        """Records some output."""
+
+        timestamp = round(self._clock() - self._start, 6)
+
+        if self._interval is None:
+            self._write_event(timestamp, data)
+            return
+
+        if self._pending and timestamp - self._pending_time >= self._interval:
+            self.flush()
+
+        self._pending.append(data)
+        self._pending_time = timestamp
+
+        if self._last_event is None or timestamp - self._last_event >= self._interval:
+            self.flush()
+
+    def close(self) -> None:
+        """Flushes the recorder, and closes its file if it was opened by it."""
+
+        self.flush()
+
+        if self._owns_file:
+            self._file.close()
+
+
+class AsciicastReader:
+    """Reads asciicast (v2) files, optionally gzip compressed.
+
+    Seeking is done by finding the last keyframe (see `AsciicastRecorder`) before the
+    target time, and starting from its snapshot. The keyframe positions are indexed
+    the first time they are needed.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        """Initializes the reader, and reads the file's header.
+
+        Args:
+            path: The path to the file. Compression is detected from its contents.
+        """
+
+        self.path = path
+
+        with self._open() as file:
+            self.header: dict[str, Any] = json.loads(file.readline())
+
+        if self.header.get("version") != 2:
+            raise ValueError(f"Unsupported asciicast version in {path!r}.")
+
+        self._keyframes: list[tuple[float, int]] | None = None
+
+    def _open(self) -> IO[bytes]:
+        """Opens the file in binary mode, transparently decompressing it."""
+
+        with open(self.path, "rb") as file:
+            compressed = file.read(2) == b"\x1f\x8b"
+
+        if compressed:
+            return cast(IO[bytes], gzip.open(self.path, "rb"))
+
+        return open(self.path, "rb")
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """Returns the (width, height) of the recorded terminal."""
+
+        return self.header["width"], self.header["height"]
+
+    @property
+    def keyframes(self) -> list[tuple[float, int]]:
+        """Returns the (timestamp, file offset) pairs of all keyframes."""
+
+        if self._keyframes is None:
+            self._keyframes = []
+
+            with self._open() as file:
+                file.readline()
+
+                while True:
+                    offset = file.tell()
+                    line = file.readline()
+
+                    if line == b"":
+                        break
+
+                    if b'"m"' not in line:
+                        continue
+
+                    timestamp, kind, label = json.loads(line)
+                    if kind == "m" and label == KEYFRAME_LABEL:
+                        self._keyframes.append((timestamp, offset))
+
+        return self._keyframes
+
+    def events(self, start: float = 0.0) -> Iterator[tuple[float, str]]:
+        """Yields the (timestamp, data) pairs of output events.
+
+        Args:
+            start: The timestamp to seek to. Output from the last keyframe before it
+                is included, starting with its snapshot of the screen, as it is
+                needed to reconstruct the screen at `start`.
+        """
+
+        offset = None
+        for timestamp, position in self.keyframes:
+            if timestamp > start:
+                break
+
+            offset = position
+
+        with self._open() as file:
+            file.readline()
+
+            if offset is not None:
+                file.seek(offset)
+
+            # Snapshots redraw what is already on the screen, so only the one that
+            # was seeked to is needed
+            seeking = offset is not None
+            skip_snapshot = False
+
+            for line in file:
+                timestamp, kind, data = json.loads(line)
+
+                if kind == "m" and data == KEYFRAME_LABEL:
+                    skip_snapshot = not seeking
+                    seeking = False
+                    continue
+
+                if kind != "o":
+                    continue
+
+                if skip_snapshot:
+                    skip_snapshot = False
+                    continue
+
+                yield timestamp, data
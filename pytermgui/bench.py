@@ -0,0 +1,620 @@
+"""A small benchmarking harness, and workloads for the library's hot paths.
+
+Benchmarks are registered with the `benchmark` decorator. The decorated function
+does all the setup work and returns the operation to measure, so only the operation
+itself is timed:
+
+```python3
+from pytermgui.bench import benchmark
+
+@benchmark("my_widget.get_lines")
+def _bench_my_widget():
+    widget = MyWidget()
+    return widget.get_lines
+```
+
+Run them with `ptg --bench`. A filter can be given to only run benchmarks whose
+name contains it, `--bench-path` imports extra benchmark files (like the ones in the
+repository's `benchmarks/` directory), and results can be saved as a JSON baseline
+with `--bench-save` and compared against one with `--bench-compare`.
+
+For each benchmark, the following is reported:
+
+- `ops/sec`: The number of operations per second, based on the fastest round.
+- `peak`: The peak memory traced by `tracemalloc` while running one operation.
+- `retained`: The traced memory still held once that operation has returned, e.g.
+    by caches.
+"""
+
+from __future__ import annotations
+
+import gc
+import importlib.util
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from random import Random
+from typing import Any, Callable, Dict, Iterable
+
+from .animations import Animator, AttrAnimation, FloatAnimation
+from .colors import Color, clear_color_cache
+from .emulator import ScreenEmulator
+from .exporters import to_html, to_svg
+from .helpers import LineWrapper, break_line
+from .markup import MarkupLanguage, tim, tokenize_ansi
+from .markup.macros import macro_gradient, macro_rainbow
+from .palettes import Palette
+from .regex import real_length
+from .term import Terminal, get_terminal, set_global_terminal
+from .widgets import (
+    Checkbox,
+    Container,
+    DensePixelMatrix,
+    InputField,
+    Label,
+    RGBPixelMatrix,
+    Splitter,
+    Toggle,
+)
+from .window_manager import Compositor, Window
+
+__all__ = [
+    "BENCHMARKS",
+    "BenchmarkResult",
+    "benchmark",
+    "run_benchmarks",
+    "load_benchmarks",
+    "save_results",
+    "load_baseline",
+    "compare_results",
+]
+
+BenchmarkFactory = Callable[[], Callable[[], Any]]
+
+BENCHMARKS: Dict[str, BenchmarkFactory] = {}
+"""All registered benchmarks, by name."""
+
+ROUNDS = 5
+"""The number of timed rounds run for every benchmark."""
+
+MIN_ROUND_TIME = 0.05
+"""The minimum duration of a round, in seconds. Fast operations are looped."""
+
+REGRESSION_THRESHOLD = 0.1
+"""The relative slowdown at which a result is reported as a regression."""
+
+
+@dataclass
+class BenchmarkResult:
+    """The measurements of a single benchmark."""
+
+    name: str
+    ops_per_sec: float
+    peak_memory: int
+    retained_memory: int
+
+
+def benchmark(name: str) -> Callable[[BenchmarkFactory], BenchmarkFactory]:
+    """Registers a benchmark.
+
+    Args:
+        name: The name of the benchmark. By convention, it is made up of the measured
+            API and the workload, e.g. `tim.parse: long log`.
+
+    Returns:
+        A decorator for a function that sets up the workload, and returns the
+        callable to measure.
+    """
+
+    def _decorator(factory: BenchmarkFactory) -> BenchmarkFactory:
+        BENCHMARKS[name] = factory
+        return factory
+
+    return _decorator
+
+
+def _measure_memory(operation: Callable[[], Any]) -> tuple[int, int]:
+    """Returns the peak & retained traced memory of running the operation once."""
+
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        operation()
+        retained, peak = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    return peak, retained
+
+
+def _measure(name: str, factory: BenchmarkFactory) -> BenchmarkResult:
+    """Sets up & measures a benchmark."""
+
+    operation = factory()
+
+    # Warm up, and find how many loops a round needs
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            operation()
+
+        if time.perf_counter() - start >= MIN_ROUND_TIME:
+            break
+
+        number *= 2
+
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for _ in range(number):
+            operation()
+
+        best = min(best, (time.perf_counter() - start) / number)
+
+    peak, retained = _measure_memory(operation)
+
+    return BenchmarkResult(name, 1 / best, peak, retained)
+
+
+def run_benchmarks(
+    pattern: str = "", on_result: Callable[[BenchmarkResult], Any] | None = None
+) -> list[BenchmarkResult]:
+    """Runs all registered benchmarks whose name contains `pattern`.
+
+    Args:
+        pattern: The text to filter benchmark names by. Case insensitive.
+        on_result: Called with each result as soon as it is available.
+
+    Returns:
+        A list of all the results, in the order the benchmarks were registered.
+    """
+
+    results = []
+
+    for name, factory in BENCHMARKS.items():
+        if pattern.lower() not in name.lower():
+            continue
+
+        result = _measure(name, factory)
+        results.append(result)
+
+        if on_result is not None:
+            on_result(result)
+
+    return results
+
+
+def load_benchmarks(path: str | Path) -> None:
+    """Imports a benchmark file, or every Python file within a directory.
+
+    Their `benchmark`-decorated functions are registered on import.
+    """
+
+    path = Path(path)
+    files: Iterable[Path] = sorted(path.glob("*.py")) if path.is_dir() else [path]
+
+    for file in files:
+        spec = importlib.util.spec_from_file_location(f"_ptg_bench_{file.stem}", file)
+
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Could not load benchmarks from {file!r}.")
+
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+
+def save_results(results: list[BenchmarkResult], path: str | Path) -> None:
+    """Saves the results as a JSON baseline.
+
+    Results already in the file that weren't measured now are kept, so a baseline
+    can be built up by multiple, filtered runs.
+    """
+
+    path = Path(path)
+    data: dict[str, Any] = {"results": {}}
+
+    if path.exists():
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+
+    data["python"] = platform.python_version()
+    data["platform"] = platform.platform()
+
+    for result in results:
+        data["results"][result.name] = asdict(result)
+
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data, file, indent=4)
+
+
+def _get_change(result: BenchmarkResult, baseline: dict[str, Any]) -> float | None:
+    """Returns the relative change of a result's ops/sec compared to the baseline."""
+
+    if result.name not in baseline:
+        return None
+
+    return result.ops_per_sec / baseline[result.name]["ops_per_sec"] - 1
+
+
+def load_baseline(path: str | Path) -> dict[str, Any]:
+    """Loads the results of a JSON baseline, by benchmark name."""
+
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)["results"]
+
+
+def compare_results(
+    results: list[BenchmarkResult], path: str | Path
+) -> dict[str, float | None]:
+    """Compares results against a saved baseline.
+
+    Returns:
+        A mapping of benchmark names to the relative change in ops/sec, e.g. `-0.2`
+        for a 20% slowdown. Benchmarks missing from the baseline map to None.
+    """
+
+    baseline = load_baseline(path)
+
+    return {result.name: _get_change(result, baseline) for result in results}
+
+
+# Workloads
+
+
+def _long_log(count: int = 1000) -> list[str]:
+    """Generates `count` lines of a log file in markup."""
+
+    rand = Random(0)
+    levels = ["[bold 157]INFO", "[bold 214]WARN", "[bold 210]ERROR", "[dim]DEBUG"]
+
+    return [
+        f"[245]{i:>6}[/] {rand.choice(levels)}[/] [italic]worker-{rand.randint(1, 9)}"
+        + f"[/italic]: Request [@{rand.randint(16, 255)}]#{rand.getrandbits(32):08x}"
+        + "[/bg] finished in "
+        + f"[{rand.randint(16, 255)}]{rand.random() * 100:.2f}ms[/fg]"
+        + " with status [bold underline]OK[/]"
+        for i in range(count)
+    ]
+
+
+def _large_form(rows: int = 100) -> Container:
+    """Creates a container of `rows` labelled fields, checkboxes and toggles."""
+
+    form = Container(width=100)
+
+    for i in range(rows):
+        if i % 3 == 0:
+            field: Any = InputField(f"value {i}", prompt=f"Field {i}: ")
+        elif i % 3 == 1:
+            field = Checkbox()
+        else:
+            field = Toggle(("on", "off"))
+
+        form += Splitter(Label(f"[bold]Row {i}", parent_align=0), field)
+
+    return form
+
+
+def _nested(depth: int = 25) -> Container:
+    """Creates `depth` containers, each inside the previous one."""
+
+    inner = Container(Label("[bold]Deep[/] content"), "And [italic]another[/] line")
+
+    for _ in range(depth):
+        inner = Container(inner, "A line of text next to the nested container")
+
+    inner.width = depth * 4 + 40
+
+    return inner
+
+
+@benchmark("MarkupLanguage: default setup")
+def _bench_language() -> Callable[[], Any]:
+    return MarkupLanguage
+
+
+@benchmark("tim.parse: long log")
+def _bench_parse() -> Callable[[], Any]:
+    lines = _long_log()
+
+    def _operation() -> None:
+        tim.clear_cache()
+
+        for line in lines:
+            tim.parse(line)
+
+    return _operation
+
+
+@benchmark("!gradient & !rainbow: progress bars")
+def _bench_color_macros() -> Callable[[], Any]:
+    bars = [f"{'#' * i}{' ' * (40 - i)} {i / 40:.0%}" for i in range(41)]
+
+    def _operation() -> None:
+        for progress in bars:
+            macro_gradient("210", progress)
+            macro_gradient("#ff0000", "#0000ff", progress)
+            macro_rainbow(progress)
+
+    return _operation
+
+
+@benchmark("tokenize_ansi: long log")
+def _bench_tokenize() -> Callable[[], Any]:
+    text = "\n".join(tim.parse(line) for line in _long_log())
+
+    return lambda: list(tokenize_ansi(text))
+
+
+@benchmark("break_line: long log")
+def _bench_break_line() -> Callable[[], Any]:
+    lines = [tim.parse(line) for line in _long_log()]
+
+    def _operation() -> None:
+        for line in lines:
+            list(break_line(line, 40))
+
+    return _operation
+
+
+@benchmark("LineWrapper: re-wrap long log")
+def _bench_line_wrapper() -> Callable[[], Any]:
+    wrappers = [LineWrapper(tim.parse(line)) for line in _long_log()]
+    width = 20
+
+    def _operation() -> None:
+        nonlocal width
+
+        # Cycle through more widths than a wrapper keeps results for
+        width = 20 + (width - 19) % 30
+
+        for wrapper in wrappers:
+            wrapper.wrap(width, words=True)
+
+    return _operation
+
+
+@benchmark("real_length: long log")
+def _bench_real_length() -> Callable[[], Any]:
+    lines = [tim.parse(line) for line in _long_log()]
+
+    def _operation() -> None:
+        real_length.cache_clear()
+
+        for line in lines:
+            real_length(line)
+
+    return _operation
+
+
+@benchmark("Container.get_lines: large form")
+def _bench_large_form() -> Callable[[], Any]:
+    return _large_form().get_lines
+
+
+@benchmark("Container.get_lines: deep nesting")
+def _bench_deep_nesting() -> Callable[[], Any]:
+    return _nested().get_lines
+
+
+@benchmark("Container.get_lines: resize drag")
+def _bench_resize_drag() -> Callable[[], Any]:
+    form = _large_form(40)
+    form += Label(" ".join(_long_log(20)))
+    width = 60
+
+    def _operation() -> None:
+        nonlocal width
+
+        # Drag back & forth between 60 and 100 columns
+        width = 60 + (width - 58) % 40
+        form.width = width
+        form.get_lines()
+
+    return _operation
+
+
+@benchmark("Container.query: large form")
+def _bench_query() -> Callable[[], Any]:
+    form = _large_form(40)
+
+    return lambda: form.query("Container > Splitter Button, InputField")
+
+
+@benchmark("Compositor.draw: large form")
+def _bench_draw() -> Callable[[], Any]:
+    screen = ScreenEmulator((120, 50))
+    terminal = Terminal(screen, size=screen.size)
+    terminal.forced_colorsystem = get_terminal().colorsystem
+
+    window = Window(_large_form(40), width=110)
+    compositor = Compositor([window], framerate=60)
+
+    def _operation() -> None:
+        previous = get_terminal()
+        set_global_terminal(terminal)
+
+        try:
+            compositor.redraw()
+        finally:
+            set_global_terminal(previous)
+
+    return _operation
+
+
+@benchmark("DensePixelMatrix.build: 80x40")
+def _bench_dense_matrix() -> Callable[[], Any]:
+    rand = Random(0)
+    matrix = DensePixelMatrix(80, 40)
+
+    for row in range(40):
+        for col in range(80):
+            matrix[row, col] = str(rand.randint(16, 255))
+
+    return matrix.build
+
+
+@benchmark("RGBPixelMatrix.set_frame: 160x45")
+def _bench_rgb_matrix() -> Callable[[], Any]:
+    rand = Random(0)
+    frames = [
+        bytes(rand.getrandbits(8) for _ in range(160 * 45 * 3)) for _ in range(4)
+    ]
+    matrix = RGBPixelMatrix(160, 45)
+    index = 0
+
+    def _operation() -> None:
+        nonlocal index
+
+        matrix.set_frame(frames[index % len(frames)])
+        matrix.get_lines()
+        index += 1
+
+    return _operation
+
+
+@benchmark("to_html: large form")
+def _bench_html() -> Callable[[], Any]:
+    form = _large_form(40)
+    form.get_lines()
+
+    return lambda: to_html(form)
+
+
+@benchmark("to_svg: large form")
+def _bench_svg() -> Callable[[], Any]:
+    form = _large_form(40)
+    form.get_lines()
+
+    return lambda: to_svg(form)
+
+
+@benchmark("Color.parse: palette colors")
+def _bench_color_parse() -> Callable[[], Any]:
+    rand = Random(0)
+    values = [f"#{rand.getrandbits(24):06x}" for _ in range(200)]
+    values += [str(rand.randint(0, 255)) for _ in range(200)]
+    values += [f"{rand.randint(0, 255)};{rand.randint(0, 255)};0" for _ in range(200)]
+
+    def _operation() -> None:
+        clear_color_cache()
+
+        for value in values:
+            Color.parse(value)
+
+    return _operation
+
+
+@benchmark("Palette: generation")
+def _bench_palette() -> Callable[[], Any]:
+    rand = Random(0)
+    primaries = [f"#{rand.getrandbits(24):06x}" for _ in range(20)]
+
+    def _operation() -> None:
+        clear_color_cache()
+
+        for primary in primaries:
+            Palette(primary=primary)
+
+    return _operation
+
+
+@benchmark("Animator.step: 1000 animations")
+def _bench_animator() -> Callable[[], Any]:
+    now = 0.0
+    engine = Animator(clock=lambda: now)
+    window = Window()
+
+    for i in range(1000):
+        if i % 2:
+            engine.schedule(FloatAnimation(500 + i, loop=True))
+            continue
+
+        engine.schedule(
+            AttrAnimation(
+                target=window, attr="height", end=40, duration=500 + i, loop=True
+            )
+        )
+
+    def _operation() -> None:
+        nonlocal now
+
+        # Toast-like churn: short animations finishing every few frames
+        for _ in range(20):
+            engine.schedule(FloatAnimation(50))
+
+        now += 1 / 60
+        engine.update()
+
+    return _operation
+
+
+def _format_memory(size: int) -> str:
+    """Formats a memory size in KiB."""
+
+    return f"{size / 1024:.1f} KiB"
+
+
+def print_result(result: BenchmarkResult, change: float | None = None) -> None:
+    """Prints a single result as a table row, including its change if given."""
+
+    row = (
+        f"{result.name:<40} {result.ops_per_sec:>12.1f} "
+        + f"{_format_memory(result.peak_memory):>14} "
+        + f"{_format_memory(result.retained_memory):>14}"
+    )
+
+    if change is not None:
+        color = "210" if change < -REGRESSION_THRESHOLD else "157"
+        row += tim.parse(f" [{color}]{change * 100:>+8.1f}%")
+
+    print(row)
+
+
+def main(
+    pattern: str = "",
+    paths: Iterable[str] = (),
+    save: str | None = None,
+    compare: str | None = None,
+) -> bool:
+    """Runs benchmarks, and prints their results.
+
+    Args:
+        pattern: Only benchmarks containing this text in their name are run.
+        paths: Extra benchmark files or directories to load.
+        save: A JSON file to save the results into.
+        compare: A JSON baseline to compare the results against.
+
+    Returns:
+        False if any of the benchmarks regressed compared to the baseline.
+    """
+
+    for path in paths:
+        load_benchmarks(path)
+
+    baseline = load_baseline(compare) if compare is not None else {}
+    regressed = False
+
+    def _on_result(result: BenchmarkResult) -> None:
+        nonlocal regressed
+
+        change = _get_change(result, baseline)
+        regressed = regressed or (change or 0.0) < -REGRESSION_THRESHOLD
+
+        print_result(result, change)
+        sys.stdout.flush()
+
+    print(f"{'benchmark':<40} {'ops/sec':>12} {'peak':>14} {'retained':>14}")
+    results = run_benchmarks(pattern, on_result=_on_result)
+
+    if save is not None:
+        save_results(results, save)
+
+    return not regressed
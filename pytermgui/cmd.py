@@ -544,6 +544,36 @@ def process_args(argv: list[str] | None = None) -> Namespace:
         metavar="FILE",
     )
 
+    bench_group = parser.add_argument_group("Benchmarks")
+
+    bench_group.add_argument(
+        "--bench",
+        help=(
+            "Run the built-in benchmarks. If given, only benchmarks containing"
+            + " FILTER in their name are run."
+        ),
+        metavar="FILTER",
+        const="",
+        nargs="?",
+    )
+    bench_group.add_argument(
+        "--bench-path",
+        help="Load extra benchmarks from a file or directory. Can be repeated.",
+        metavar="PATH",
+        action="append",
+        default=[],
+    )
+    bench_group.add_argument(
+        "--bench-save",
+        help="Save the benchmark results as a JSON baseline.",
+        metavar="FILE",
+    )
+    bench_group.add_argument(
+        "--bench-compare",
+        help="Compare the results to a JSON baseline, failing on regressions.",
+        metavar="FILE",
+    )
+
     argv = argv or sys.argv[1:]
     args = parser.parse_args(args=argv)
 
@@ -912,6 +942,18 @@ def main(argv: list[str] | None = None) -> None:
 
         return
 
+    if args.bench is not None:
+        from . import bench  # pylint: disable=import-outside-toplevel
+
+        passed = bench.main(
+            args.bench,
+            paths=args.bench_path,
+            save=args.bench_save,
+            compare=args.bench_compare,
+        )
+
+        sys.exit(0 if passed else 1)
+
     with ptg.terminal.record() as recording:
         if args.size:
             ptg.tim.print(f"{ptg.terminal.width}x{ptg.terminal.height}")
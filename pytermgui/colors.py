@@ -16,14 +16,25 @@ import re
 import sys
 from dataclasses import dataclass, field
 from functools import cached_property, lru_cache
-from math import sqrt  # pylint: disable=no-name-in-module
-from typing import TYPE_CHECKING, Generator, Literal, Tuple, Type, Union, cast
+from typing import TYPE_CHECKING, Generator, Literal, Type, cast
 
 from .ansi_interface import reset as reset_style
 from .color_info import COLOR_TABLE, CSS_COLORS
 from .exceptions import ColorSyntaxError
 from .input import getch
-from .term import ColorSystem, terminal
+from .quantize import (
+    Number,
+    RGBTriplet,
+    _clamp_rgb,
+    _get_color_difference,
+    _get_greyscale_index,
+    _get_ramp_index,
+    _get_standard_index,
+    _linearize,
+    clear_lookup_tables,
+    quantize_rgb,
+)
+from .term import ColorSystem, get_terminal
 
 if TYPE_CHECKING:
     from .fancy_repr import FancyYield
@@ -33,6 +44,7 @@ __all__ = [
     "XTERM_NAMED_COLORS",
     "NAMED_COLORS",
     "clear_color_cache",
+    "quantize_rgb",
     "foreground",
     "background",
     "str_to_color",
@@ -78,18 +90,13 @@ NAMED_COLORS = {
     **{color: str(index) for index, color in XTERM_NAMED_COLORS.items()},
 }
 
-Number = Union[float, int]
-RGBTriplet = Tuple[Number, Number, Number]
-
 _COLOR_CACHE: dict[str, Color] = {}
-_COLOR_MATCH_CACHE: dict[RGBTriplet, Color] = {}
-
 
 def clear_color_cache() -> None:
-    """Clears `_COLOR_CACHE` and `_COLOR_MATCH_CACHE`."""
+    """Clears `_COLOR_CACHE` and the xterm-16 color lookup table."""
 
     _COLOR_CACHE.clear()
-    _COLOR_MATCH_CACHE.clear()
+    clear_lookup_tables()
 
 
 def _get_palette_color(color: Literal["10", "11"]) -> Color:
@@ -104,7 +111,7 @@ def _get_palette_color(color: Literal["10", "11"]) -> Color:
         "11": RGBColor.from_rgb((20, 20, 20)),
     }
 
-    if not terminal.isatty():
+    if not get_terminal().isatty():
         return defaults[color]
 
     sys.stdout.write(f"\x1b]{color};?\007")
@@ -305,14 +312,6 @@ class Color:  # pylint: disable=too-many-public-methods
         From https://stackoverflow.com/a/596243
         """
 
-        def _linearize(color: float) -> float:
-            """Converts sRGB color to linear value."""
-
-            if color <= 0.04045:
-                return color / 12.92
-
-            return ((color + 0.055) / 1.055) ** 2.4
-
         red, green, blue = float(self.rgb[0]), float(self.rgb[1]), float(self.rgb[2])
 
         red /= 255
@@ -506,7 +505,7 @@ class Color:  # pylint: disable=too-many-public-methods
         terminal.
         """
 
-        system = terminal.colorsystem
+        system = get_terminal().colorsystem
         if self.system <= system:
             return self
 
@@ -550,28 +549,12 @@ class IndexedColor(Color):
     def from_rgb(cls, rgb: RGBTriplet) -> IndexedColor:
         """Constructs an `IndexedColor` from the closest matching option."""
 
-        if rgb in _COLOR_MATCH_CACHE:
-            color = _COLOR_MATCH_CACHE[rgb]
-
-            assert isinstance(color, IndexedColor)
-            return color
-
-        if terminal.colorsystem == ColorSystem.STANDARD:
+        if get_terminal().colorsystem == ColorSystem.STANDARD:
             return StandardColor.from_rgb(rgb)
 
-        # Normalize the color values
-        red, green, blue = (x / 255 for x in rgb)
+        (color_num,) = quantize_rgb([_clamp_rgb(rgb)], ColorSystem.EIGHT_BIT)
 
-        # Calculate the eight-bit color index
-        color_num = 16
-        color_num += 36 * round(red * 5.0)
-        color_num += 6 * round(green * 5.0)
-        color_num += round(blue * 5.0)
-
-        color = cls(str(color_num))
-        _COLOR_MATCH_CACHE[rgb] = color
-
-        return color
+        return cls(str(color_num))
 
     @property
     def sequence(self) -> str:
@@ -648,26 +631,22 @@ class StandardColor(IndexedColor):
             rgb: The target color.
         """
 
-        if rgb in _COLOR_MATCH_CACHE:
-            color = _COLOR_MATCH_CACHE[rgb]
+        clamped = _clamp_rgb(rgb)
 
-            if color.system is ColorSystem.STANDARD:
-                assert isinstance(color, StandardColor)
-                return color
+        if clamped == tuple(rgb):
+            index = _get_standard_index(*clamped)
 
-        # Find the least-different color in the table
-        index = min(range(16), key=lambda i: _get_color_difference(rgb, COLOR_TABLE[i]))
+        else:
+            index = min(
+                range(16), key=lambda i: _get_color_difference(rgb, COLOR_TABLE[i])
+            )
 
         if index > 7:
             index += 82
         else:
             index += 30
 
-        color = cls(str(index))
-
-        _COLOR_MATCH_CACHE[rgb] = color
-
-        return color
+        return cls(str(index))
 
     @property
     def sequence(self) -> str:
@@ -707,11 +686,17 @@ class GreyscaleRampColor(IndexedColor):
     def from_rgb(cls, rgb: RGBTriplet) -> GreyscaleRampColor:
         """Gets a greyscale color based on the given color's luminance."""
 
-        color = cls("0")
-        setattr(color, "_rgb", rgb)
+        clamped = _clamp_rgb(rgb)
+
+        if clamped == tuple(rgb):
+            index = _get_greyscale_index(*clamped)
+
+        else:
+            red, green, blue = (_linearize(float(value) / 255) for value in rgb)
+            index = _get_ramp_index(0.2126 * red + 0.7152 * green + 0.0722 * blue)
 
-        index = int(232 + color.brightness * 23)
-        color.value = str(index)
+        color = cls(str(index))
+        setattr(color, "_rgb", rgb)
 
         return color
 
@@ -815,28 +800,6 @@ SYSTEM_TO_TYPE: dict[ColorSystem, Type[Color]] = {
 }
 
 
-def _get_color_difference(rgb1: RGBTriplet, rgb2: RGBTriplet) -> float:
-    """Gets the geometric difference of 2 RGB colors (0-255).
-
-    See https://en.wikipedia.org/wiki/Color_difference's Euclidian section.
-    """
-
-    red1, green1, blue1 = rgb1
-    red2, green2, blue2 = rgb2
-
-    redmean = (red1 + red2) // 2
-
-    delta_red = red1 - red2
-    delta_green = green1 - green2
-    delta_blue = blue1 - blue2
-
-    return sqrt(
-        (2 + (redmean / 256)) * (delta_red**2)
-        + 4 * (delta_green**2)
-        + (2 + (255 - redmean) / 256) * (delta_blue**2)
-    )
-
-
 @lru_cache(maxsize=1024)
 def str_to_color(
     text: str,
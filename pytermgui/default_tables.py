@@ -0,0 +1,190 @@
+"""The default alias & palette tables, loaded as-is on import.
+
+This file is generated by `utils/generate_tables.py`, don't edit it by hand.
+"""
+
+DEFAULT_ALIAS_TABLE = {
+    "code.str": "142",
+    "/code.str": "/fg",
+    "code.multiline_str": "142",
+    "/code.multiline_str": "/fg",
+    "code.keyword": "203",
+    "/code.keyword": "/fg",
+    "code.none": "167",
+    "/code.none": "/fg",
+    "code.global": "214",
+    "/code.global": "/fg",
+    "code.number": "175",
+    "/code.number": "/fg",
+    "code.identifier": "109",
+    "/code.identifier": "/fg",
+    "code.name": "214",
+    "/code.name": "/fg",
+    "code.comment": "240 italic",
+    "/code.comment": "/fg /italic",
+    "code.builtin": "214",
+    "/code.builtin": "/fg",
+    "code.file": "109",
+    "/code.file": "/fg",
+    "code.symbol": "code.file",
+    "/code.symbol": "/fg",
+    "background": "",
+    "/background": "",
+}
+
+DEFAULT_PALETTE_TABLE = {
+    "primary-3": "#313a53",
+    "@primary-3": "@#313a53",
+    "primary-2": "#4a587c",
+    "@primary-2": "@#4a587c",
+    "primary-1": "#6375a6",
+    "@primary-1": "@#6375a6",
+    "primary": "#7c93d0",
+    "@primary": "@#7c93d0",
+    "primary+1": "#96a8d9",
+    "@primary+1": "@#96a8d9",
+    "primary+2": "#b0bee2",
+    "@primary+2": "@#b0bee2",
+    "primary+3": "#cad3ec",
+    "@primary+3": "@#cad3ec",
+    "secondary-3": "#53313a",
+    "@secondary-3": "@#53313a",
+    "secondary-2": "#7c4957",
+    "@secondary-2": "@#7c4957",
+    "secondary-1": "#a66274",
+    "@secondary-1": "@#a66274",
+    "secondary": "#d07b92",
+    "@secondary": "@#d07b92",
+    "secondary+1": "#d995a7",
+    "@secondary+1": "@#d995a7",
+    "secondary+2": "#e2afbd",
+    "@secondary+2": "@#e2afbd",
+    "secondary+3": "#eccad3",
+    "@secondary+3": "@#eccad3",
+    "tertiary-3": "#3a5331",
+    "@tertiary-3": "@#3a5331",
+    "tertiary-2": "#587c49",
+    "@tertiary-2": "@#587c49",
+    "tertiary-1": "#75a662",
+    "@tertiary-1": "@#75a662",
+    "tertiary": "#93d07b",
+    "@tertiary": "@#93d07b",
+    "tertiary+1": "#a8d995",
+    "@tertiary+1": "@#a8d995",
+    "tertiary+2": "#bee2af",
+    "@tertiary+2": "@#bee2af",
+    "tertiary+3": "#d3ecca",
+    "@tertiary+3": "@#d3ecca",
+    "accent-3": "#534a31",
+    "@accent-3": "@#534a31",
+    "accent-2": "#7c6f49",
+    "@accent-2": "@#7c6f49",
+    "accent-1": "#a69462",
+    "@accent-1": "@#a69462",
+    "accent": "#d0b97b",
+    "@accent": "@#d0b97b",
+    "accent+1": "#d9c795",
+    "@accent+1": "@#d9c795",
+    "accent+2": "#e2d5af",
+    "@accent+2": "@#e2d5af",
+    "accent+3": "#ece3ca",
+    "@accent+3": "@#ece3ca",
+    "surface-3": "#24262b",
+    "@surface-3": "@#24262b",
+    "surface-2": "#373a41",
+    "@surface-2": "@#373a41",
+    "surface-1": "#494d57",
+    "@surface-1": "@#494d57",
+    "surface": "#5c616d",
+    "@surface": "@#5c616d",
+    "surface+1": "#7c808a",
+    "@surface+1": "@#7c808a",
+    "surface+2": "#9da0a7",
+    "@surface+2": "@#9da0a7",
+    "surface+3": "#bdbfc4",
+    "@surface+3": "@#bdbfc4",
+    "surface2-3": "#2b2426",
+    "@surface2-3": "@#2b2426",
+    "surface2-2": "#41373a",
+    "@surface2-2": "@#41373a",
+    "surface2-1": "#57494d",
+    "@surface2-1": "@#57494d",
+    "surface2": "#6d5c61",
+    "@surface2": "@#6d5c61",
+    "surface2+1": "#8a7c80",
+    "@surface2+1": "@#8a7c80",
+    "surface2+2": "#a79da0",
+    "@surface2+2": "@#a79da0",
+    "surface2+3": "#c4bdbf",
+    "@surface2+3": "@#c4bdbf",
+    "surface3-3": "#262b24",
+    "@surface3-3": "@#262b24",
+    "surface3-2": "#3a4137",
+    "@surface3-2": "@#3a4137",
+    "surface3-1": "#4d5749",
+    "@surface3-1": "@#4d5749",
+    "surface3": "#616d5c",
+    "@surface3": "@#616d5c",
+    "surface3+1": "#808a7c",
+    "@surface3+1": "@#808a7c",
+    "surface3+2": "#a0a79d",
+    "@surface3+2": "@#a0a79d",
+    "surface3+3": "#bfc4bd",
+    "@surface3+3": "@#bfc4bd",
+    "surface4-3": "#2b2a24",
+    "@surface4-3": "@#2b2a24",
+    "surface4-2": "#413f37",
+    "@surface4-2": "@#413f37",
+    "surface4-1": "#575449",
+    "@surface4-1": "@#575449",
+    "surface4": "#6d695c",
+    "@surface4": "@#6d695c",
+    "surface4+1": "#8a877c",
+    "@surface4+1": "@#8a877c",
+    "surface4+2": "#a7a59d",
+    "@surface4+2": "@#a7a59d",
+    "surface4+3": "#c4c3bd",
+    "@surface4+3": "@#c4c3bd",
+    "success-3": "#265830",
+    "@success-3": "@#265830",
+    "success-2": "#398548",
+    "@success-2": "@#398548",
+    "success-1": "#4cb160",
+    "@success-1": "@#4cb160",
+    "success": "#60de79",
+    "@success": "@#60de79",
+    "success+1": "#7fe493",
+    "@success+1": "@#7fe493",
+    "success+2": "#9febae",
+    "@success+2": "@#9febae",
+    "success+3": "#bff1c9",
+    "@success+3": "@#bff1c9",
+    "warning-3": "#565830",
+    "@warning-3": "@#565830",
+    "warning-2": "#818548",
+    "@warning-2": "@#818548",
+    "warning-1": "#acb160",
+    "@warning-1": "@#acb160",
+    "warning": "#d7de79",
+    "@warning": "@#d7de79",
+    "warning+1": "#dfe493",
+    "@warning+1": "@#dfe493",
+    "warning+2": "#e7ebae",
+    "@warning+2": "@#e7ebae",
+    "warning+3": "#eff1c9",
+    "@warning+3": "@#eff1c9",
+    "error-3": "#562930",
+    "@error-3": "@#562930",
+    "error-2": "#813d48",
+    "@error-2": "@#813d48",
+    "error-1": "#ac5260",
+    "@error-1": "@#ac5260",
+    "error": "#d76779",
+    "@error": "@#d76779",
+    "error+1": "#df8593",
+    "@error+1": "@#df8593",
+    "error+2": "#e7a3ae",
+    "@error+2": "@#e7a3ae",
+    "error+3": "#efc2c9",
+    "@error+3": "@#efc2c9",
+}
@@ -0,0 +1,691 @@
+"""A headless, in-memory terminal emulator.
+
+`ScreenEmulator` is a file-like object that interprets everything written into it
+as a (VT100/xterm-like) terminal would, and keeps the resulting screen as a grid of
+cells. Passing one as the stream of a `pytermgui.term.Terminal` makes it possible to
+inspect exactly what an application would display:
+
+```python3
+import pytermgui as ptg
+
+screen = ptg.ScreenEmulator((40, 10))
+terminal = ptg.Terminal(screen, size=screen.size)
+
+terminal.write("Hello", pos=(2, 1))
+assert screen.get_lines()[1] == "  Hello"
+```
+
+Only the subset of sequences PyTermGUI itself emits is supported: cursor movement,
+SGR styling, screen & line clearing, the alternate buffer, cursor visibility and
+synchronized output (`?2026`). Everything else is parsed and ignored.
+
+Like xterm, erasing fills cells with the current background color (BCE). Underline
+colors, and the SGR parameters that aren't tracked by `pytermgui.sgr` are ignored.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Iterator
+
+from wcwidth import wcwidth
+
+from .sgr import EXTENDED_COLORS, STYLE_CODES, STYLE_RESETS
+
+__all__ = ["Cell", "ScreenEmulator"]
+
+RE_SEQUENCE = re.compile(
+    r"\x1b\[([0-?]*)[ -/]*([@-~])"  # CSI
+    r"|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)"  # OSC
+    r"|\x1b_[^\x1b]*\x1b\\"  # APC
+    r"|\x1b([ -/]*[0-OQ-Z\\^`-~])"  # Other sequences, e.g. DECSC
+)
+
+RE_CONTROL = re.compile(r"[\x00-\x1f\x7f]")
+
+TAB_SIZE = 8
+
+MAX_PENDING = 4096
+"""The longest incomplete sequence kept around between writes."""
+
+@dataclass(frozen=True)
+class Cell:
+    """A single character cell of the screen."""
+
+    char: str = " "
+    """The character displayed in the cell.
+
+    Cells covered by the right half of a wide character contain an empty string.
+    """
+
+    style: str = ""
+    """The SGR parameters applied to the cell, in a normalized order.
+
+    Styles (bold, italic, etc.) come first in ascending order, followed by the
+    foreground and background colors. An empty string means no styling.
+    """
+
+    @property
+    def sequence(self) -> str:
+        """Returns the SGR sequence that recreates the cell's style from a reset."""
+
+        return f"\x1b[{self.style}m" if self.style else ""
+
+
+class ScreenEmulator:  # pylint: disable=too-many-instance-attributes
+    """An in-memory screen that can be written into like a stream.
+
+    Besides the screen's contents, it keeps track of some statistics that are useful
+    for measuring rendering efficiency:
+
+    - `bytes_written`: The number of (UTF-8 encoded) bytes received.
+    - `cells_changed`: The number of times a cell's character or style changed.
+    - `frames`: The number of synchronized updates (`?2026`) that were completed.
+
+    Newlines move the cursor to the start of the next line, like a terminal with
+    `onlcr` translation enabled would.
+    """
+
+    def __init__(self, size: tuple[int, int] = (80, 24)) -> None:
+        """Initializes the emulator.
+
+        Args:
+            size: The (width, height) of the screen.
+        """
+
+        self.width, self.height = size
+
+        self.bytes_written = 0
+        self.cells_changed = 0
+        self.frames = 0
+
+        self.reset()
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """Returns the (width, height) of the screen."""
+
+        return self.width, self.height
+
+    @property
+    def cursor(self) -> tuple[int, int]:
+        """Returns the 0-based (x, y) position of the cursor."""
+
+        return self._x, self._y
+
+    @property
+    def cursor_visible(self) -> bool:
+        """Determines whether the cursor is shown (`?25`)."""
+
+        return 25 not in self._hidden_modes
+
+    @property
+    def synchronized(self) -> bool:
+        """Determines whether a synchronized update (`?2026`) is in progress."""
+
+        return 2026 in self.modes
+
+    @property
+    def alt_buffer(self) -> bool:
+        """Determines whether the alternate screen buffer (`?1049`) is in use."""
+
+        return 1049 in self.modes
+
+    def reset(self) -> None:
+        """Clears the screen and resets all state, except for the statistics."""
+
+        self._x = self._y = 0
+        self._saved_cursor = (0, 0)
+        self._wrap_pending = False
+        self._pending = ""
+
+        self._styles: set[int] = set()
+        self._foreground = ""
+        self._background = ""
+        self._style = ""
+
+        self.modes: set[int] = set()
+        self._hidden_modes: set[int] = set()
+
+        self._chars = self._blank_grid()
+        self._cell_styles = self._blank_styles()
+        self._main_screen: tuple[list[list[str]], list[list[str]]] | None = None
+
+    def reset_stats(self) -> None:
+        """Resets `bytes_written`, `cells_changed` and `frames`."""
+
+        self.bytes_written = 0
+        self.cells_changed = 0
+        self.frames = 0
+
+    def resize(self, size: tuple[int, int]) -> None:
+        """Resizes the screen, keeping the content that still fits."""
+
+        width, height = size
+
+        for grid, blank in ((self._chars, " "), (self._cell_styles, "")):
+            for row in grid:
+                del row[width:]
+                row.extend(blank for _ in range(width - len(row)))
+
+            del grid[height:]
+            grid.extend([blank] * width for _ in range(height - len(grid)))
+
+        self.width, self.height = width, height
+        self._main_screen = None
+        self._move_to(self._x, self._y)
+
+    # File-like interface
+
+    def write(self, data: str) -> int:
+        """Interprets the given data.
+
+        Returns:
+            The number of characters written, like `io.TextIOBase.write`.
+        """
+
+        self.bytes_written += len(data.encode("utf-8", "replace"))
+
+        text = self._pending + data
+        self._pending = ""
+
+        cursor = 0
+        for match in RE_SEQUENCE.finditer(text):
+            start, end = match.span()
+
+            if cursor < start:
+                self._put_text(text[cursor:start])
+
+            cursor = end
+            self._handle_sequence(match)
+
+        remainder = text[cursor:]
+        escape = remainder.find("\x1b")
+
+        # Keep incomplete sequences until the rest of them arrives
+        if escape != -1 and len(remainder) - escape <= MAX_PENDING:
+            self._pending = remainder[escape:]
+            remainder = remainder[:escape]
+
+        if remainder:
+            self._put_text(remainder)
+
+        return len(data)
+
+    def flush(self) -> None:
+        """Does nothing, as the screen is always up to date."""
+
+    def truncate(self, _: int | None = None) -> int:
+        """Does nothing; the screen can only be cleared through escape sequences."""
+
+        return 0
+
+    @staticmethod
+    def isatty() -> bool:
+        """Returns False, as this is not an actual tty."""
+
+        return False
+
+    @staticmethod
+    def writable() -> bool:
+        """Returns True, as the emulator can always be written to."""
+
+        return True
+
+    # Inspection
+
+    def cell(self, x: int, y: int) -> Cell:
+        """Returns the cell at the given 0-based position."""
+
+        return Cell(self._chars[y][x], self._cell_styles[y][x])
+
+    @property
+    def cells(self) -> list[list[Cell]]:
+        """Returns the full grid of cells, row by row."""
+
+        return [
+            [Cell(char, style) for char, style in zip(chars, styles)]
+            for chars, styles in zip(self._chars, self._cell_styles)
+        ]
+
+    def get_lines(self) -> list[str]:
+        """Returns the plain text of every row, with trailing whitespace removed."""
+
+        return ["".join(row).rstrip() for row in self._chars]
+
+    def get_styled_lines(self) -> list[str]:
+        """Returns every row with the SGR sequences needed to recreate it.
+
+        A sequence is only inserted where the style changes, and every styled row ends
+        with a reset.
+        """
+
+        lines = []
+
+        for chars, styles in zip(self._chars, self._cell_styles):
+            line = ""
+            current = ""
+
+            for char, style in zip(chars, styles):
+                if style != current:
+                    line += "\x1b[0m" + (f"\x1b[{style}m" if style else "")
+                    current = style
+
+                line += char
+
+            lines.append(line + ("\x1b[0m" if current else ""))
+
+        return lines
+
+    def get_snapshot(self) -> str:
+        """Returns the output that recreates the screen on any terminal of its size.
+
+        This includes the screen's contents, the modes set on it, the cursor's
+        position & visibility and the current style.
+        """
+
+        snapshot = "\x1b[?1049h" if self.alt_buffer else ""
+        snapshot += "".join(f"\x1b[?{mode}h" for mode in sorted(self.modes - {1049}))
+        snapshot += "\x1b[0m\x1b[2J"
+
+        for y, line in enumerate(self.get_styled_lines()):
+            # Unstyled trailing spaces are already blank after the clear
+            line = line.rstrip(" ")
+
+            if line != "":
+                snapshot += f"\x1b[{y + 1};1H{line}"
+
+        snapshot += f"\x1b[{self._y + 1};{self._x + 1}H"
+        snapshot += "\x1b[?25h" if self.cursor_visible else "\x1b[?25l"
+
+        return snapshot + (f"\x1b[{self._style}m" if self._style else "")
+
+    def __str__(self) -> str:
+        return "\n".join(self.get_lines())
+
+    def __iter__(self) -> Iterator[list[Cell]]:
+        return iter(self.cells)
+
+    # Internals
+
+    def _blank_grid(self) -> list[list[str]]:
+        """Creates an empty grid of characters."""
+
+        return [[" "] * self.width for _ in range(self.height)]
+
+    def _blank_styles(self) -> list[list[str]]:
+        """Creates an empty grid of styles."""
+
+        return [[""] * self.width for _ in range(self.height)]
+
+    def _move_to(self, x: int, y: int) -> None:
+        """Moves the cursor, clamped to the screen."""
+
+        self._x = min(max(x, 0), self.width - 1)
+        self._y = min(max(y, 0), self.height - 1)
+        self._wrap_pending = False
+
+    def _set_cell(self, x: int, y: int, char: str, style: str) -> None:
+        """Sets a cell, counting the change if there was one."""
+
+        chars = self._chars[y]
+        styles = self._cell_styles[y]
+
+        if chars[x] != char or styles[x] != style:
+            chars[x] = char
+            styles[x] = style
+            self.cells_changed += 1
+
+    def _count_changes(self, chars: list[list[str]], styles: list[list[str]]) -> None:
+        """Counts the cells that differ from the given, previously shown grids."""
+
+        for old, new in ((chars, self._chars), (styles, self._cell_styles)):
+            for old_row, new_row in zip(old, new):
+                if old_row != new_row:
+                    self.cells_changed += sum(
+                        1 for a, b in zip(old_row, new_row) if a != b
+                    )
+
+    def _erase(self, y: int, start: int, end: int) -> None:
+        """Blanks the cells of a row in the range [start, end).
+
+        The cells keep the current background color, but no other styling.
+        """
+
+        for x in range(max(start, 0), min(end, self.width)):
+            self._set_cell(x, y, " ", self._background)
+
+    def _line_feed(self) -> None:
+        """Moves the cursor down a line, scrolling the screen at the bottom."""
+
+        if self._y < self.height - 1:
+            self._y += 1
+            return
+
+        chars, styles = self._chars, self._cell_styles
+        self._chars = chars[1:] + [[" "] * self.width]
+        self._cell_styles = styles[1:] + [[""] * self.width]
+
+        self._count_changes(chars, styles)
+
+    def _put_text(self, text: str) -> None:
+        """Writes text at the cursor, handling control characters."""
+
+        for char in text:
+            if RE_CONTROL.match(char):
+                self._handle_control(char)
+                continue
+
+            width = wcwidth(char)
+
+            # Combining characters are added to the previous cell
+            if width == 0:
+                x = self._x if self._wrap_pending else self._x - 1
+
+                if x >= 0:
+                    chars = self._chars[self._y]
+                    chars[x] += char
+
+                continue
+
+            width = max(width, 1)
+
+            if self._wrap_pending or self._x + width > self.width:
+                self._x = 0
+                self._wrap_pending = False
+                self._line_feed()
+
+            self._set_cell(self._x, self._y, char, self._style)
+
+            if width == 2 and self._x + 1 < self.width:
+                self._set_cell(self._x + 1, self._y, "", self._style)
+
+            if self._x + width >= self.width:
+                self._x = self.width - 1
+                self._wrap_pending = True
+            else:
+                self._x += width
+
+    def _handle_control(self, char: str) -> None:
+        """Handles a single C0 control character."""
+
+        if char == "\n":
+            self._x = 0
+            self._wrap_pending = False
+            self._line_feed()
+
+        elif char == "\r":
+            self._x = 0
+            self._wrap_pending = False
+
+        elif char == "\b":
+            self._move_to(self._x - 1, self._y)
+
+        elif char == "\t":
+            self._move_to((self._x // TAB_SIZE + 1) * TAB_SIZE, self._y)
+
+    def _handle_escape(self, escape: str) -> None:
+        """Handles a non-CSI escape sequence, e.g. DECSC (`ESC 7`)."""
+
+        if escape == "7":
+            self._saved_cursor = self.cursor
+        elif escape == "8":
+            self._move_to(*self._saved_cursor)
+        elif escape == "c":
+            self.reset()
+
+    def _handle_sequence(self, match: re.Match) -> None:
+        """Handles a single escape sequence."""
+
+        params, final, escape = match.groups()
+
+        if escape is not None:
+            self._handle_escape(escape)
+            return
+
+        if final is None:
+            return
+
+        if params.startswith("?"):
+            self._handle_private_mode(params[1:], final)
+            return
+
+        # Other private parameters, e.g. xterm's modifyOtherKeys (CSI > 4 ; 1 m)
+        if params[:1] in ("<", "=", ">"):
+            return
+
+        if final == "m":
+            self._handle_sgr(params)
+            return
+
+        args = [int(value) if value.isdigit() else 0 for value in params.split(";")]
+        count = max(args[0], 1)
+
+        if final in "HfABCDEFGd":
+            self._move_cursor(final, args)
+
+        elif final == "J":
+            self._erase_display(args[0])
+
+        elif final == "K":
+            start, end = {0: (self._x, self.width), 1: (0, self._x + 1)}.get(
+                args[0], (0, self.width)
+            )
+            self._erase(self._y, start, end)
+
+        elif final == "X":
+            self._erase(self._y, self._x, self._x + count)
+
+        elif final == "s":
+            self._saved_cursor = self.cursor
+
+        elif final == "u":
+            self._move_to(*self._saved_cursor)
+
+    def _move_cursor(self, final: str, args: list[int]) -> None:
+        """Handles the cursor movement sequences, e.g. `H` (cursor position)."""
+
+        count = max(args[0], 1)
+
+        if final in "Hf":
+            row = args[0] if args[0] > 0 else 1
+            col = args[1] if len(args) > 1 and args[1] > 0 else 1
+            self._move_to(col - 1, row - 1)
+
+        elif final == "A":
+            self._move_to(self._x, self._y - count)
+
+        elif final == "B":
+            self._move_to(self._x, self._y + count)
+
+        elif final == "C":
+            self._move_to(self._x + count, self._y)
+
+        elif final == "D":
+            self._move_to(self._x - count, self._y)
+
+        elif final in "EF":
+            self._move_to(0, self._y + (count if final == "E" else -count))
+
+        elif final == "G":
+            self._move_to(count - 1, self._y)
+
+        elif final == "d":
+            self._move_to(self._x, count - 1)
+
+    def _erase_display(self, mode: int) -> None:
+        """Handles the `J` (erase in display) sequence.
+
+        Mode 3 only erases the scrollback, which the emulator doesn't have.
+        """
+
+        if mode == 0:
+            self._erase(self._y, self._x, self.width)
+            rows = range(self._y + 1, self.height)
+
+        elif mode == 1:
+            self._erase(self._y, 0, self._x + 1)
+            rows = range(0, self._y)
+
+        elif mode == 2:
+            rows = range(self.height)
+
+        else:
+            return
+
+        for y in rows:
+            self._erase(y, 0, self.width)
+
+    def _handle_private_mode(self, params: str, final: str) -> None:
+        """Handles DEC private mode set & reset sequences."""
+
+        if final not in "hl":
+            return
+
+        for value in params.split(";"):
+            if not value.isdigit():
+                continue
+
+            mode = int(value)
+
+            if mode == 25:
+                if final == "h":
+                    self._hidden_modes.discard(25)
+                else:
+                    self._hidden_modes.add(25)
+
+                continue
+
+            if mode == 1049:
+                self._switch_buffer(final == "h")
+
+            if final == "h":
+                self.modes.add(mode)
+                continue
+
+            if mode == 2026 and mode in self.modes:
+                self.frames += 1
+
+            self.modes.discard(mode)
+
+    def _switch_buffer(self, alternate: bool) -> None:
+        """Switches between the main and alternate screen buffers."""
+
+        if alternate == (self._main_screen is not None):
+            return
+
+        chars, styles = self._chars, self._cell_styles
+
+        if alternate:
+            self._saved_cursor = self.cursor
+            self._main_screen = (chars, styles)
+            self._chars = self._blank_grid()
+            self._cell_styles = self._blank_styles()
+
+        else:
+            assert self._main_screen is not None
+            self._chars, self._cell_styles = self._main_screen
+            self._main_screen = None
+            self._move_to(*self._saved_cursor)
+
+        self._count_changes(chars, styles)
+
+    def _handle_sgr(self, params: str) -> None:
+        """Updates the current style from the parameters of an SGR sequence."""
+
+        groups = params.split(";")
+
+        i = 0
+        while i < len(groups):
+            group = groups[i]
+            i += 1
+
+            if ":" in group:
+                self._apply_sub_parameters(group.split(":"))
+                continue
+
+            value = int(group) if group.isdigit() else 0
+
+            if value == 0:
+                self._styles.clear()
+                self._foreground = self._background = ""
+
+            elif value in STYLE_RESETS:
+                self._styles.difference_update(STYLE_RESETS[value])
+
+            elif value in STYLE_CODES:
+                self._styles.add(value)
+
+            elif value in EXTENDED_COLORS:
+                i += self._apply_extended_color(value, groups[i:], colon=False)
+
+            elif value == 39:
+                self._foreground = ""
+
+            elif value == 49:
+                self._background = ""
+
+            elif 30 <= value <= 37 or 90 <= value <= 97:
+                self._foreground = str(value)
+
+            elif 40 <= value <= 47 or 100 <= value <= 107:
+                self._background = str(value)
+
+        parts = [str(style) for style in sorted(self._styles)]
+        parts.extend(color for color in (self._foreground, self._background) if color)
+
+        self._style = ";".join(parts)
+
+    def _apply_sub_parameters(self, parts: list[str]) -> None:
+        """Applies a colon-separated SGR parameter, e.g. `38:2::255:0:0` or `4:3`.
+
+        Other than extended colors, only the underline style is understood; `4:0`
+        turns the underline off, and any other style turns it on.
+        """
+
+        code, *args = parts
+
+        if code.isdigit() and int(code) in EXTENDED_COLORS:
+            self._apply_extended_color(int(code), args, colon=True)
+
+        elif code == "4":
+            if args[:1] in ([], [""], ["0"]):
+                self._styles.discard(4)
+            else:
+                self._styles.add(4)
+
+    def _apply_extended_color(self, code: int, args: list[str], colon: bool) -> int:
+        """Applies an indexed (`5;n`) or RGB (`2;r;g;b`) color.
+
+        Args:
+            code: The code of the color, see `pytermgui.sgr.EXTENDED_COLORS`.
+            args: The parameters following the code.
+            colon: Whether the parameters were colon-separated. In this form, RGB
+                colors may have a color space ID before the channels, which is
+                skipped.
+
+        Returns:
+            The number of parameters used.
+        """
+
+        kind = args[0] if args else ""
+        length = {"5": 1, "2": 3}.get(kind)
+
+        if length is None:
+            return 0
+
+        values = args[1:][-length:] if colon else args[1 : 1 + length]
+        values += ["0"] * (length - len(values))
+
+        color = f"{code};{kind};" + ";".join(
+            str(int(value)) if value.isdigit() else "0" for value in values
+        )
+
+        # Underline colors are not tracked
+        if code == 38:
+            self._foreground = color
+        elif code == 48:
+            self._background = color
+
+        return 1 + length
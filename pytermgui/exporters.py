@@ -6,14 +6,24 @@
 
 from __future__ import annotations
 
+import os
 import xml.dom.minidom as md
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from copy import deepcopy
+from dataclasses import dataclass
 from html import escape
-from typing import Iterator
+from itertools import islice
+from typing import Any, Iterable, Iterator
 
 from .colors import Color
-from .markup import StyledText, Token, tim
-from .term import get_terminal
+from .markup import (
+    MarkupLanguage,
+    StyledText,
+    Token,
+    tim,
+)
+from .term import ColorSystem, Terminal, get_terminal, set_global_terminal
 from .widgets import Widget
 
 MARGIN = 15
@@ -100,7 +110,12 @@ _STYLE_TO_CSS = {
 }
 
 
-__all__ = ["token_to_css", "to_html"]
+__all__ = [
+    "token_to_css",
+    "to_html",
+    "to_svg",
+    "export_many",
+]
 
 
 def prettify_xml(xml: str) -> str:
@@ -121,7 +136,9 @@ def _get_cls(prefix: str, index: int) -> str:
     return f"{prefix}-{index}"
 
 
-def _generate_stylesheet(document_styles: list[list[str]], prefix: str | None) -> str:
+def _generate_stylesheet(
+    document_styles: Iterable[Iterable[str]], prefix: str | None
+) -> str:
     """Generates a '\\n' joined CSS stylesheet from the given styles."""
 
     stylesheet = ""
@@ -135,17 +152,77 @@ def _generate_stylesheet(document_styles: list[list[str]], prefix: str | None) -
     return stylesheet
 
 
-def _generate_index_in(lst: list[list[str]], item: list[str]) -> int:
-    """Returns the given item's index in the list, len(lst) if not found."""
+def _generate_index_in(indices: dict[tuple[str, ...], int], item: list[str]) -> int:
+    """Returns the given item's index, registering it if it wasn't yet seen.
+
+    Indices are assigned in order of first appearance, so `list(indices)` can be
+    used to generate the stylesheet.
+    """
 
-    index = len(lst)
+    key = tuple(item)
+    index = indices.get(key)
 
-    if item in lst:
-        return lst.index(item)
+    if index is None:
+        index = indices[key] = len(indices)
 
     return index
 
 
+def _get_data_lines(obj: Widget | StyledText | str | Iterable[str]) -> Iterable[str]:
+    """Returns the lines of ANSI text to export from the given object."""
+
+    if isinstance(obj, Widget):
+        return obj.get_lines()
+
+    if isinstance(obj, str):
+        return obj.splitlines()
+
+    if isinstance(obj, StyledText):
+        return str(obj).splitlines()
+
+    return (line.rstrip("\r\n") for line in obj)
+
+
+def _generate_html_lines(  # pylint: disable=too-many-arguments
+    data: Iterable[str],
+    document_styles: dict[tuple[str, ...], int],
+    prefix: str | None,
+    inline_styles: bool,
+    include_background: bool,
+    vertical_offset: float,
+    horizontal_offset: float,
+) -> Iterator[str]:
+    """Yields the HTML representation of each line of data.
+
+    Args:
+        data: The ANSI lines to convert.
+        document_styles: The style-to-index mapping to use & update. Each new
+            style encountered is added to it.
+
+    For help on the rest of the arguments, see `to_html`.
+    """
+
+    for dataline in data:
+        line = ""
+
+        for span, styles in _get_spans(
+            dataline, vertical_offset, horizontal_offset, include_background
+        ):
+            index = _generate_index_in(document_styles, styles)
+
+            if inline_styles:
+                stylesheet = ";".join(styles)
+                line += span.format(f" styles='{stylesheet}'")
+
+            else:
+                line += span.format(" class='" + _get_cls(prefix or "", index) + "'")
+
+        # Close any previously not closed divs
+        line += "</div>" * (line.count("<div") - line.count("</div"))
+
+        yield line
+
+
 # Note: This whole routine will be massively refactored in an upcoming update,
 #       once StyledText has a bit of a better way of managing style attributes.
 #       Until then we must ignore some linting issues :(.
@@ -302,38 +379,18 @@ def to_html(  # pylint: disable=too-many-arguments, too-many-locals
             output.
     """
 
-    document_styles: list[list[str]] = []
-
-    if isinstance(obj, Widget):
-        data = obj.get_lines()
-
-    elif isinstance(obj, str):
-        data = obj.splitlines()
-
-    else:
-        data = str(obj).splitlines()
-
-    lines = []
-    for dataline in data:
-        line = ""
-
-        for span, styles in _get_spans(
-            dataline, vertical_offset, horizontal_offset, include_background
-        ):
-            index = _generate_index_in(document_styles, styles)
-            if index == len(document_styles):
-                document_styles.append(styles)
-
-            if inline_styles:
-                stylesheet = ";".join(styles)
-                line += span.format(f" styles='{stylesheet}'")
-
-            else:
-                line += span.format(" class='" + _get_cls(prefix or "", index) + "'")
+    document_styles: dict[tuple[str, ...], int] = {}
 
-        # Close any previously not closed divs
-        line += "</div>" * (line.count("<div") - line.count("</div"))
-        lines.append(line)
+    lines = _generate_html_lines(
+        _get_data_lines(obj),
+        document_styles,
+        prefix,
+        inline_styles,
+        include_background,
+        vertical_offset,
+        horizontal_offset,
+    )
+    content = joiner.join(lines)
 
     stylesheet = ""
     if not inline_styles:
@@ -342,7 +399,7 @@ def to_html(  # pylint: disable=too-many-arguments, too-many-locals
     document = formatter.format(
         foreground=Color.get_default_foreground().hex,
         background=Color.get_default_background().hex if include_background else "",
-        content=joiner.join(lines),
+        content=content,
         styles=stylesheet,
         font_size=FONT_SIZE,
     )
@@ -410,6 +467,25 @@ def _handle_tokens_svg(
     return (None if pos is None else (pos[0] or 0, pos[1] or 0)), back, css_styles
 
 
+def _get_svg_style_attr(
+    styles: list[str],
+    document_styles: dict[tuple[str, ...], int],
+    prefix: str,
+    inline_styles: bool,
+) -> str:
+    """Returns the attributes that apply the given styles to an SVG element.
+
+    Unless the styles are inlined, they are registered in `document_styles`, and
+    referred to by their class.
+    """
+
+    if inline_styles:
+        return f"class='{prefix}' style='{';'.join(styles)}'"
+
+    index = _generate_index_in(document_styles, styles)
+    return f"class='{prefix} {_get_cls(prefix, index)}'"
+
+
 def _slugify(text: str) -> str:
     """Turns the given text into a slugified form."""
 
@@ -439,6 +515,73 @@ def _make_tag(tagname: str, content: str = "", **attrs) -> str:
     return tag
 
 
+def _is_block(text: str) -> bool:
+    """Determines whether the given text only contains block characters.
+
+    These characters reside in the unicode range of 9600-9631, which is what we test
+    against.
+    """
+
+    return all(9600 <= ord(char) <= 9631 for char in text)
+
+
+def _get_svg_frame(
+    prefix: str, chrome: bool, title: str, default_back: str
+) -> tuple[str, dict[str, object]]:
+    """Creates the parts of an SVG document that surround its content.
+
+    Returns:
+        The transform to apply to the content's group, and the frame-related
+        arguments of `SVG_FORMAT`.
+    """
+
+    terminal = get_terminal()
+
+    terminal_width = round(terminal.width * FONT_WIDTH + 2 * TEXT_MARGIN_LEFT, 4)
+    terminal_height = round(
+        terminal.height * FONT_HEIGHT + (2 if chrome else 1) * TEXT_MARGIN_TOP, 4
+    )
+
+    total_width = terminal_width + (2 * SVG_MARGIN_LEFT if chrome else 0)
+    total_height = terminal_height + (2 * SVG_MARGIN_TOP if chrome else 0)
+
+    if chrome:
+        transform = (
+            f"translate({TEXT_MARGIN_LEFT + SVG_MARGIN_LEFT}, "
+            + f"{TEXT_MARGIN_TOP + SVG_MARGIN_TOP})"
+        )
+
+        chrome_part = f"""<g>
+            <rect x="{SVG_MARGIN_LEFT}" y="{SVG_MARGIN_TOP}"
+                rx="9px" ry="9px" stroke-width="1px" stroke-linejoin="round"
+                width="{terminal_width}" height="{terminal_height}" fill="{default_back}" />
+            <circle cx="{SVG_MARGIN_LEFT+15}" cy="{SVG_MARGIN_TOP + 15}" r="6" fill="#ff6159"/>
+            <circle cx="{SVG_MARGIN_LEFT+35}" cy="{SVG_MARGIN_TOP + 15}" r="6" fill="#ffbd2e"/>
+            <circle cx="{SVG_MARGIN_LEFT+55}" cy="{SVG_MARGIN_TOP + 15}" r="6" fill="#28c941"/>
+            <text x="{terminal_width // 2}" y="{SVG_MARGIN_TOP + FONT_HEIGHT}" text-anchor="middle"
+                class="{prefix}-title">{title}</text>
+        </g>
+        """
+
+    else:
+        transform = "translate(16, 16)"
+
+        chrome_part = f"""<rect width="{total_width}" height="{total_height}"
+            fill="{default_back}" />"""
+
+    return transform, {
+        # Dimensions
+        "total_width": round(total_width, 4),
+        "total_height": round(total_height, 4),
+        "terminal_width": terminal_width * 1.02,
+        "terminal_height": terminal_height - 15,
+        # Styles
+        "background": default_back,
+        "prefix": prefix,
+        "chrome": chrome_part,
+    }
+
+
 # This is a bit of a beast of a function, but it does the job and IMO reducing it
 # into parts would just make our lives more complicated.
 def to_svg(  # pylint: disable=too-many-locals, too-many-arguments, too-many-statements, R0912
@@ -468,15 +611,6 @@ def to_svg(  # pylint: disable=too-many-locals, too-many-arguments, too-many-sta
             to see all of its arguments.
     """
 
-    def _is_block(text: str) -> bool:
-        """Determines whether the given text only contains block characters.
-
-        These characters reside in the unicode range of 9600-9631, which is what we test
-        against.
-        """
-
-        return all(9600 <= ord(char) <= 9631 for char in text)
-
     prefix = prefix if prefix is not None else "ptg"
 
     terminal = get_terminal()
@@ -487,7 +621,7 @@ def to_svg(  # pylint: disable=too-many-locals, too-many-arguments, too-many-sta
 
     lines = 1
     cursor_x = cursor_y = 0.0
-    document_styles: list[list[str]] = []
+    document_styles: dict[tuple[str, ...], int] = {}
 
     # We manually set all text to have an alignment-baseline of
     # text-after-edge to avoid block characters rendering in the
@@ -509,17 +643,7 @@ def to_svg(  # pylint: disable=too-many-locals, too-many-arguments, too-many-sta
         should_newline = False
 
         pos, back, styles = _handle_tokens_svg(plain, default_fore, default_back)
-
-        index = _generate_index_in(document_styles, styles)
-
-        if index == len(document_styles):
-            document_styles.append(styles)
-
-        style_attr = (
-            f"class='{prefix}' style='{';'.join(styles)}'"
-            if inline_styles
-            else f"class='{prefix} {_get_cls(prefix, index)}'"
-        )
+        style_attr = _get_svg_style_attr(styles, document_styles, prefix, inline_styles)
 
         # Manual positioning
         if pos is not None:
@@ -570,53 +694,164 @@ def to_svg(  # pylint: disable=too-many-locals, too-many-arguments, too-many-sta
 
     stylesheet = "" if inline_styles else _generate_stylesheet(document_styles, prefix)
 
-    terminal_width = round(terminal.width * FONT_WIDTH + 2 * TEXT_MARGIN_LEFT, 4)
-    terminal_height = round(
-        terminal.height * FONT_HEIGHT + (2 if chrome else 1) * TEXT_MARGIN_TOP, 4
-    )
-
-    total_width = terminal_width + (2 * SVG_MARGIN_LEFT if chrome else 0)
-    total_height = terminal_height + (2 * SVG_MARGIN_TOP if chrome else 0)
-
-    if chrome:
-        transform = (
-            f"translate({TEXT_MARGIN_LEFT + SVG_MARGIN_LEFT}, "
-            + f"{TEXT_MARGIN_TOP + SVG_MARGIN_TOP})"
-        )
-
-        chrome_part = f"""<g>
-            <rect x="{SVG_MARGIN_LEFT}" y="{SVG_MARGIN_TOP}"
-                rx="9px" ry="9px" stroke-width="1px" stroke-linejoin="round"
-                width="{terminal_width}" height="{terminal_height}" fill="{default_back}" />
-            <circle cx="{SVG_MARGIN_LEFT+15}" cy="{SVG_MARGIN_TOP + 15}" r="6" fill="#ff6159"/>
-            <circle cx="{SVG_MARGIN_LEFT+35}" cy="{SVG_MARGIN_TOP + 15}" r="6" fill="#ffbd2e"/>
-            <circle cx="{SVG_MARGIN_LEFT+55}" cy="{SVG_MARGIN_TOP + 15}" r="6" fill="#28c941"/>
-            <text x="{terminal_width // 2}" y="{SVG_MARGIN_TOP + FONT_HEIGHT}" text-anchor="middle"
-                class="{prefix}-title">{title}</text>
-        </g>
-        """
-
-    else:
-        transform = "translate(16, 16)"
-
-        chrome_part = f"""<rect width="{total_width}" height="{total_height}"
-            fill="{default_back}" />"""
+    transform, frame = _get_svg_frame(prefix, chrome, title, default_back)
 
     output = _make_tag("g", text, transform=transform) + "\n"
 
     return prettify_xml(
         formatter.format(
-            # Dimensions
-            total_width=round(total_width, 4),
-            total_height=round(total_height, 4),
-            terminal_width=terminal_width * 1.02,
-            terminal_height=terminal_height - 15,
-            # Styles
-            background=default_back,
             stylesheet=stylesheet,
-            # Code
             code=output,
-            prefix=prefix,
-            chrome=chrome_part,
+            **frame,
         )
     )
+
+
+@dataclass
+class _ExportJob:
+    """The language & exporter settings shared by all items of `export_many`."""
+
+    lang: MarkupLanguage
+    format: str
+    options: dict[str, Any]
+
+    def render(self, items: list[str]) -> list[str]:
+        """Parses & exports the given markup items."""
+
+        exporter = to_html if self.format == "html" else to_svg
+        parse = self.lang.parse
+
+        return [exporter(parse(item), **self.options) for item in items]
+
+
+# This is per-process state set by the pool's initializer, not a constant. It can't be
+# passed to `_render_in_worker` instead, as the job would be pickled for every chunk.
+_worker_job: _ExportJob | None = None  # pylint: disable=invalid-name
+
+
+def _init_export_worker(  # pylint: disable=too-many-arguments
+    job: _ExportJob,
+    size: tuple[int, int],
+    colorsystem: ColorSystem,
+    foreground: Color,
+    background: Color,
+) -> None:
+    """Sets up a worker process of `export_many` to render like its parent."""
+
+    global _worker_job  # pylint: disable=global-statement
+
+    terminal = Terminal(size=size)
+    terminal.forced_colorsystem = colorsystem
+    set_global_terminal(terminal)
+
+    Color.default_foreground = foreground
+    Color.default_background = background
+
+    _worker_job = job
+
+
+def _render_in_worker(items: list[str]) -> list[str]:
+    """Renders a chunk of items using the job the worker was set up with."""
+
+    assert _worker_job is not None
+
+    return _worker_job.render(items)
+
+
+def _iter_chunks(items: Iterable[str], size: int) -> Iterator[list[str]]:
+    """Splits the items into lists of the given size."""
+
+    iterator = iter(items)
+
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _stream_exports(
+    job: _ExportJob, items: Iterable[str], workers: int, chunksize: int
+) -> Iterator[str]:
+    """Yields the exports of `export_many`, in order."""
+
+    if workers == 1:
+        for chunk in _iter_chunks(items, chunksize):
+            yield from job.render(chunk)
+
+        return
+
+    terminal = get_terminal()
+
+    with ProcessPoolExecutor(
+        workers,
+        initializer=_init_export_worker,
+        initargs=(
+            job,
+            terminal.size,
+            terminal.colorsystem,
+            Color.get_default_foreground(),
+            Color.get_default_background(),
+        ),
+    ) as executor:
+        pending: deque[Future[list[str]]] = deque()
+
+        for chunk in _iter_chunks(items, chunksize):
+            pending.append(executor.submit(_render_in_worker, chunk))
+
+            # Only keep a few chunks in flight, so results are streamed back
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+
+        while len(pending) > 0:
+            yield from pending.popleft().result()
+
+
+def export_many(  # pylint: disable=too-many-arguments
+    items: Iterable[str],
+    format: str = "html",  # pylint: disable=redefined-builtin
+    workers: int | None = None,
+    lang: MarkupLanguage | None = None,
+    chunksize: int = 8,
+    **options: Any,
+) -> Iterator[str]:
+    """Parses & exports many markup strings, using a pool of worker processes.
+
+    The language is sent to each worker once, when it starts. Its aliases & macros
+    are kept, so every macro has to be picklable (e.g. a module-level function).
+    The terminal's size & color system and the default colors are copied over too,
+    so the results are the same as the ones rendered by this process.
+
+    Items are sent to the workers in chunks, and only a few chunks are rendered
+    ahead of the consumer. This means `items` can be a lazy iterable, like the lines
+    of a file.
+
+    ```python3
+    with open("reports.txt", "r") as reports:
+        for i, html in enumerate(export_many(reports, workers=4)):
+            with open(f"report_{i}.html", "w") as file:
+                file.write(html)
+    ```
+
+    Args:
+        items: The markup strings to export.
+        format: Either `html` or `svg`, see `to_html` and `to_svg`.
+        workers: The number of processes to render with. When 1, everything is
+            rendered in this process. Defaults to the number of CPUs.
+        lang: The language to parse the items with. Defaults to `tim`.
+        chunksize: The number of items sent to a worker at once.
+        **options: Passed to the exporter for every item.
+
+    Returns:
+        An iterator of the exported documents, in the order of `items`.
+    """
+
+    if format not in ("html", "svg"):
+        raise ValueError(f"Unknown export format {format!r}, use 'html' or 'svg'.")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers < 1 or chunksize < 1:
+        raise ValueError("Both `workers` and `chunksize` must be at least 1.")
+
+    job = _ExportJob(lang if lang is not None else tim, format, options)
+
+    return _stream_exports(job, items, workers, chunksize)
@@ -2,112 +2,513 @@
 
 from __future__ import annotations
 
-from typing import Iterator
+from functools import lru_cache
+from typing import Iterator, Tuple, Union
 
-from .markup import tokenize_ansi
-from .markup.parsing import LINK_TEMPLATE, PARSERS
-from .regex import real_length
+from wcwidth import wcwidth
+
+from .colors import Color
+from .markup import ClearToken, ColorToken, StyleToken, tokenize_ansi
+from .markup.parsing import CLEARER_MASKS, LINK_TEMPLATE, PARSERS, STYLE_BITS
+from .markup.style_maps import CLEARERS, STYLES
+from .term import ColorSystem, get_terminal
 
 __all__ = [
     "break_line",
+    "LineWrapper",
+    "ReflowCache",
+    "reflow_cache",
 ]
 
+# Atom kinds
+_CHAR = 0
+_SPACE = 1
+_NEWLINE = 2
+_SET = 3
+_UNSET = 4
+_RESET = 5
+_LINK_OPEN = 6
+_LINK_CLOSE = 7
+_OTHER = 8
+
+# A (kind, text, value) triplet. The value is the width of characters, the slot(s)
+# changed by style sequences and the URI of opened links.
+Atom = Tuple[int, str, Union[int, str, Tuple[str, ...], None]]
+
+LINK_OPEN, LINK_CLOSE = LINK_TEMPLATE.split("{label}")
+
+# The state slots each clearer empties
+_CLEARED_SLOTS = {
+    "/fg": ("fg",),
+    "/bg": ("bg",),
+    **{
+        name: tuple(style for style, bit in STYLE_BITS.items() if mask & bit)
+        for name, mask in CLEARER_MASKS.items()
+    },
+}
+
+# The number of wrapped results kept by each `LineWrapper`
+WRAP_CACHE_SIZE = 8
+
+# The number of texts `reflow_cache` keeps wrappers for
+REFLOW_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=1024)
+def _get_color_sequence(value: str, _: ColorSystem) -> str:
+    """Returns the localized sequence of a color token's value.
+
+    The color system is only used to key the cache.
+    """
 
-def break_line(  # pylint: disable=too-many-branches
-    line: str, limit: int, non_first_limit: int | None = None, fill: str | None = None
-) -> Iterator[str]:
-    """Breaks a line into a `list[str]` with maximum `limit` length per line.
+    return Color.parse(value, localize=False).get_localized().sequence
 
-    It keeps ongoing ANSI sequences between lines, and inserts a reset sequence
-    at the end of each style-containing line.
 
-    At the moment it splits strings exactly on the limit, and not on word
-    boundaries. That functionality would be preferred, so it will end up being
-    implemented at some point.
+def _is_word_char(atom: Atom) -> bool:
+    """Determines whether an atom is a narrow letter or digit."""
 
-    Args:
-        line: The line to split. May or may not contain ANSI sequences.
-        limit: The maximum amount of characters allowed in each line, excluding
-            non-printing sequences.
-        non_first_limit: The limit after the first line. If not given, defaults
-            to `limit`.
+    return atom[0] == _CHAR and atom[2] == 1 and atom[1].isalnum()
+
+
+class LineWrapper:  # pylint: disable=too-few-public-methods
+    """Wraps a line of ANSI-coded text to some width.
+
+    The line is only tokenized & measured once, so wrapping the same line to a new
+    width (e.g. after a resize) only costs a single pass over its characters. The
+    most recent results are also kept, and returned when asked for again.
+
+    Wrapping is linear in the length of the line. Characters are measured by their
+    display width, so wide (e.g. CJK) characters take up two cells. The styles and
+    hyperlink that are active at the end of a line are reapplied at the start of the
+    next one, and every line that ends in a styled state is closed with a reset.
     """
 
-    if line in ["", "\x1b[0m"]:
-        yield ""
-        return
+    def __init__(self, line: str) -> None:
+        """Initializes the wrapper.
 
-    def _pad_and_link(line: str, link: str | None) -> str:
-        count = limit - real_length(line)
+        Args:
+            line: The line to wrap. May or may not contain ANSI sequences.
+        """
 
-        if link is not None:
-            line = LINK_TEMPLATE.format(uri=link, label=line)
+        self.line = line
 
-        if fill is None:
-            return line
+        self._atoms: list[Atom] = []
+        self._breakable: list[bool] | None = None
+        self._hyphenable: list[bool] = []
+        self._results: dict[tuple, list[str]] = {}
 
-        line += count * fill
+        self._tokenize()
 
-        return line
+    def _tokenize(self) -> None:
+        """Splits the line into atoms; characters & sequences."""
 
-    used = 0
-    current = ""
-    sequences = ""
+        atoms = self._atoms
+        parsers = PARSERS
+        system = get_terminal().colorsystem
 
-    if non_first_limit is None:
-        non_first_limit = limit
+        for token in tokenize_ansi(self.line):
+            if token.is_plain():
+                self._add_plain(token.value)
+                continue
 
-    parsers = PARSERS
-    link = None
+            token_type = type(token)
 
-    for token in tokenize_ansi(line):
-        if token.is_plain():
-            for char in token.value:
-                if char == "\n" or used >= limit:
-                    if sequences != "":
-                        current += "\x1b[0m"
+            if token_type is ColorToken:
+                slot = "bg" if token.color.background else "fg"  # type: ignore
+                sequence = _get_color_sequence(token.value, system)
+                atoms.append((_SET, sequence, slot))
 
-                    yield _pad_and_link(current, link)
-                    link = None
+            elif token_type is StyleToken:
+                atoms.append((_SET, f"\x1b[{STYLES[token.value]}m", token.value))
 
-                    current = sequences
-                    used = 0
+            elif token_type is ClearToken:
+                value = token.value
 
-                    limit = non_first_limit
+                if value == "/~":
+                    atoms.append((_LINK_CLOSE, LINK_CLOSE, None))
 
-                if char != "\n":
-                    current += char
-                    used += 1
+                elif value == "/":
+                    atoms.append((_RESET, "\x1b[0m", None))
+
+                else:
+                    sequence = f"\x1b[{CLEARERS[value]}m"
+                    atoms.append((_UNSET, sequence, _CLEARED_SLOTS.get(value, ())))
+
+            elif token.is_hyperlink():
+                atoms.append(
+                    (_LINK_OPEN, LINK_OPEN.format(uri=token.value), token.value)
+                )
+
+            else:
+                parser = parsers[type(token)]
+                sequence = parser(token, {}, lambda: self.line)  # type: ignore
+                atoms.append((_OTHER, sequence, None))
+
+    def _add_plain(self, value: str) -> None:
+        """Adds the atoms of some plain text, measuring each character."""
+
+        atoms = self._atoms
+
+        if value.isascii() and value.isprintable():
+            atoms.extend(
+                [(_SPACE if char == " " else _CHAR, char, 1) for char in value]
+            )
+            return
+
+        for char in value:
+            if char == "\n":
+                atoms.append((_NEWLINE, char, 0))
+                continue
+
+            width = wcwidth(char)
+
+            # Combining characters belong to the previous one
+            if width == 0 and len(atoms) > 0 and atoms[-1][0] == _CHAR:
+                kind, text, previous = atoms[-1]
+                atoms[-1] = (kind, text + char, previous)
+                continue
+
+            kind = _SPACE if char == " " else _CHAR
+            atoms.append((kind, char, width if width >= 0 else 1))
+
+    def _find_breaks(self) -> None:
+        """Finds the atoms a line may be broken before when wrapping words.
+
+        These are the starts of space runs, the letters after a hyphen within a word,
+        and wide characters & the ones after them. It also marks the letters in the
+        middle of words, which a word can be hyphenated before.
+        """
+
+        atoms = self._atoms
+        breakable = [False] * len(atoms)
+        hyphenable = [False] * len(atoms)
+
+        # The last two visible atoms
+        previous: Atom | None = None
+        before_previous: Atom | None = None
+        previous_index = -1
+        follows_letter = False
+
+        for i, atom in enumerate(atoms):
+            kind = atom[0]
+
+            if kind == _NEWLINE:
+                previous = before_previous = None
+                follows_letter = False
+                continue
+
+            if kind not in (_CHAR, _SPACE):
+                continue
+
+            if previous is not None:
+                if kind == _SPACE:
+                    breakable[i] = previous[0] != _SPACE
+
+                elif previous[0] == _CHAR:
+                    breakable[i] = (
+                        atom[2] == 2
+                        or previous[2] == 2
+                        or previous[1] == "-"
+                        and _is_word_char(atom)
+                        and before_previous is not None
+                        and _is_word_char(before_previous)
+                    )
+
+                is_letter = _is_word_char(atom)
+                hyphenable[previous_index] = follows_letter and is_letter
+                follows_letter = is_letter and _is_word_char(previous)
+
+            before_previous, previous = previous, atom
+            previous_index = i
+
+        self._breakable = breakable
+        self._hyphenable = hyphenable
+
+    def wrap(
+        self,
+        limit: int,
+        non_first_limit: int | None = None,
+        fill: str | None = None,
+        *,
+        words: bool = False,
+        hyphenate: bool = False,
+    ) -> list[str]:
+        """Wraps the line.
+
+        Args:
+            limit: The maximum width of each line, excluding non-printing sequences.
+            non_first_limit: The limit after the first line. If not given, defaults
+                to `limit`.
+            fill: If given, every line is padded to its limit using this string.
+            words: If set, lines are broken on word boundaries, and the spaces
+                they are broken at are dropped. Words that don't fit on a line of
+                their own are broken anywhere. Otherwise lines are broken exactly at
+                the limit, keeping every character.
+            hyphenate: If set, words broken up due to their length get a hyphen at
+                the end of each of their non-last lines. Only applies when `words`
+                is set.
+
+        Returns:
+            The wrapped lines.
+        """
+
+        key = (limit, non_first_limit, fill, words, hyphenate)
+        lines = self._results.get(key)
+
+        if lines is None:
+            lines = self._wrap(
+                limit,
+                limit if non_first_limit is None else non_first_limit,
+                fill,
+                words,
+                hyphenate and words,
+            )
+
+            if len(self._results) >= WRAP_CACHE_SIZE:
+                del self._results[next(iter(self._results))]
+
+            self._results[key] = lines
+
+        return lines.copy()
+
+    def _wrap(  # pylint: disable=too-many-arguments, too-many-locals, R0912, R0915
+        self,
+        limit: int,
+        non_first_limit: int,
+        fill: str | None,
+        words: bool,
+        hyphenate: bool,
+    ) -> list[str]:
+        """Does the actual wrapping, see `wrap`."""
+
+        if words and self._breakable is None:
+            self._find_breaks()
+
+        atoms = self._atoms
+        breakable = self._breakable
+        hyphenable = self._hyphenable
+
+        lines: list[str] = []
+        state: dict[str, str] = {}
+        link: str | None = None
+
+        buffer: list[str] = []
+        used = 0
+        placed = 0
+        skip_spaces = False
+
+        # The (atom index, buffer length, used, state, link) of the last place the
+        # current line could be broken at.
+        break_at: tuple[int, int, int, dict[str, str], str | None] | None = None
+
+        def _finish_line() -> None:
+            nonlocal buffer, used, placed, limit, break_at
+
+            line = "".join(buffer)
 
-            # If the link wasn't yielded along with its token, remove and add it
-            # to current manually.
             if link is not None:
-                current = current[: -len(token.value)]
-                current += LINK_TEMPLATE.format(uri=link, label=token.value)
-                link = None
+                line += LINK_CLOSE
 
-            continue
+            if len(state) > 0:
+                line += "\x1b[0m"
 
-        if token.value == "/":
-            sequences = "\x1b[0m"
+            if fill is not None:
+                line += max(limit - used, 0) * fill
 
-            if len(current) > 0:
-                current += sequences
+            lines.append(line)
 
-            continue
+            buffer = list(state.values())
+            if link is not None:
+                buffer.append(LINK_OPEN.format(uri=link))
 
-        if token.is_hyperlink():
-            link = token.value
-            continue
+            used = placed = 0
+            limit = non_first_limit
+            break_at = None
 
-        sequence = parsers[type(token)](token, {}, lambda: line)  # type: ignore
-        sequences += sequence
-        current += sequence
+        i = 0
+        count = len(atoms)
 
-    if current == "":
-        return
+        while i < count:
+            kind, text, value = atoms[i]
+
+            if kind in (_CHAR, _SPACE):
+                if skip_spaces:
+                    if kind == _SPACE:
+                        i += 1
+                        continue
+
+                    skip_spaces = False
+
+                if words and breakable[i] and placed > 0:  # type: ignore
+                    break_at = (i, len(buffer), used, state.copy(), link)
+
+                width: int = value  # type: ignore
+
+                if placed > 0 and used + width > limit:
+                    if break_at is not None:
+                        i, length, used, state, link = break_at
+                        del buffer[length:]
+
+                        _finish_line()
+                        skip_spaces = True
+                        continue
+
+                    _finish_line()
+
+                elif (
+                    hyphenate
+                    and break_at is None
+                    and placed > 0
+                    and hyphenable[i]
+                    and used + width + 1 > limit
+                ):
+                    buffer.append("-")
+                    used += 1
+                    _finish_line()
+
+                buffer.append(text)
+                used += width
+                placed += 1
+
+            elif kind == _NEWLINE:
+                _finish_line()
+                skip_spaces = False
+
+            else:
+                buffer.append(text)
+
+                if kind == _SET:
+                    state[value] = text  # type: ignore
+
+                elif kind == _UNSET:
+                    for slot in value:  # type: ignore
+                        state.pop(slot, None)
+
+                elif kind == _RESET:
+                    state.clear()
+
+                elif kind == _LINK_OPEN:
+                    link = value  # type: ignore
+
+                elif kind == _LINK_CLOSE:
+                    link = None
+
+            i += 1
+
+        if placed > 0 or len(lines) == 0:
+            _finish_line()
 
-    if sequences != "" and not current.endswith("\x1b[0m"):
-        current += "\x1b[0m"
+        return lines
+
+
+class ReflowCache:
+    """A least-recently-used cache of `LineWrapper`s, keyed by the text they wrap.
+
+    Widgets that wrap their (styled) content on every `get_lines` call share the
+    global `reflow_cache` instance. As long as the text doesn't change, wrapping it
+    is only a lookup, and wrapping it to a new width (e.g. while a window is being
+    resized) skips tokenizing it again.
+
+    Wrappers localize the colors of their text, so they are also keyed by the
+    terminal's color system.
+    """
+
+    def __init__(self, size: int = REFLOW_CACHE_SIZE) -> None:
+        """Initializes the cache.
+
+        Args:
+            size: The number of texts to keep wrappers for.
+        """
+
+        self.size = size
+        self._wrappers: dict[tuple[str, ColorSystem], LineWrapper] = {}
+
+    def __len__(self) -> int:
+        return len(self._wrappers)
+
+    def __contains__(self, text: object) -> bool:
+        return (text, get_terminal().colorsystem) in self._wrappers
+
+    def clear(self) -> None:
+        """Drops all wrappers."""
+
+        self._wrappers.clear()
+
+    def get_wrapper(self, text: str) -> LineWrapper:
+        """Returns the wrapper of the given text, creating it if needed."""
+
+        wrappers = self._wrappers
+        key = (text, get_terminal().colorsystem)
+        wrapper = wrappers.pop(key, None)
+
+        if wrapper is None:
+            wrapper = LineWrapper(text)
+
+            if len(wrappers) >= self.size:
+                del wrappers[next(iter(wrappers))]
+
+        # Re-inserting keeps the most recently used wrappers at the end
+        wrappers[key] = wrapper
+
+        return wrapper
+
+    def wrap(  # pylint: disable=too-many-arguments
+        self,
+        text: str,
+        limit: int,
+        non_first_limit: int | None = None,
+        fill: str | None = None,
+        *,
+        words: bool = False,
+        hyphenate: bool = False,
+    ) -> list[str]:
+        """Wraps some text using its cached wrapper.
+
+        The arguments & results are the same as the ones of `break_line`.
+        """
+
+        if text in ["", "\x1b[0m"]:
+            return [""]
+
+        return self.get_wrapper(text).wrap(
+            limit, non_first_limit, fill, words=words, hyphenate=hyphenate
+        )
+
+
+reflow_cache = ReflowCache()
+"""The cache used by widgets to wrap their content."""
+
+
+def break_line(  # pylint: disable=too-many-arguments
+    line: str,
+    limit: int,
+    non_first_limit: int | None = None,
+    fill: str | None = None,
+    *,
+    words: bool = False,
+    hyphenate: bool = False,
+) -> Iterator[str]:
+    """Breaks a line into a `list[str]` with maximum `limit` length per line.
+
+    It keeps ongoing ANSI sequences between lines, and inserts a reset sequence
+    at the end of each style-containing line. See `LineWrapper` for more info; use it
+    directly to wrap the same line to multiple widths.
+
+    Args:
+        line: The line to split. May or may not contain ANSI sequences.
+        limit: The maximum amount of characters allowed in each line, excluding
+            non-printing sequences.
+        non_first_limit: The limit after the first line. If not given, defaults
+            to `limit`.
+        fill: If given, every line is padded to its limit using this string.
+        words: Break lines on word boundaries, instead of exactly at the limit.
+        hyphenate: Hyphenate words that are broken up due to their length.
+    """
+
+    if line in ["", "\x1b[0m"]:
+        yield ""
+        return
 
-    yield _pad_and_link(current, link)
+    yield from LineWrapper(line).wrap(
+        limit, non_first_limit, fill, words=words, hyphenate=hyphenate
+    )
@@ -37,7 +37,7 @@ class Highlighter(Protocol):  # pylint: disable=too-few-public-methods
 
 
 @dataclass
-class RegexHighlighter:
+class RegexHighlighter:  # pylint: disable=too-many-instance-attributes
     """A class to highlight strings using regular expressions.
 
     This class must be provided with a list of styles. These styles are really just a
@@ -60,6 +60,10 @@ class RegexHighlighter:
         groups cannot match the same text.
     - Because of how capturing groups work, everything within the patterns will be
         matched. To look for context around a match, look-around assertions can be used.
+
+    Documents can also be highlighted line-by-line, using `highlight_line`. Styles that
+    may span multiple lines need to have their opening and closing patterns given under
+    `multiline`, so their state can be carried from one line to the next.
     """
 
     styles: list[tuple[str, str]]
@@ -81,7 +85,14 @@ class RegexHighlighter:
     re_flags: int = 0
     """All regex flags to apply when compiling the generated pattern, OR-d (|) together."""
 
+    multiline: dict[str, tuple[str, str]] = field(default_factory=dict)
+    """A mapping of style names to their (opener, closer) patterns.
+
+    Only used by `highlight_line`, for styles whose matches may span multiple lines.
+    """
+
     _pattern: Pattern = field(init=False)
+    _multiline_patterns: dict[str, tuple[Pattern, Pattern]] = field(init=False)
     _highlight_cache: dict[str, str] = field(init=False, default_factory=dict)
 
     def __post_init__(self) -> None:
@@ -96,6 +107,13 @@ class RegexHighlighter:
         pattern = pattern[:-1]
 
         self._pattern = re.compile(pattern, flags=self.re_flags)
+        self._multiline_patterns = {
+            name: (
+                re.compile(opener, flags=self.re_flags),
+                re.compile(closer, flags=self.re_flags),
+            )
+            for name, (opener, closer) in self.multiline.items()
+        }
 
     def __call__(self, text: str, cache: bool = True) -> str:
         """Highlights the given text, using the combined regex pattern."""
@@ -108,29 +126,117 @@ class RegexHighlighter:
 
         cache_key = text
 
-        def _insert_style(matchobj: Match) -> str:
-            """Returns the match inserted into a markup style."""
+        text = self._pattern.sub(self._insert_style, text)
+        self._highlight_cache[cache_key] = text
 
-            groups = matchobj.groupdict()
+        return text
 
-            name = matchobj.lastgroup
-            content = groups.get(str(name), None)
+    def _insert_style(self, matchobj: Match) -> str:
+        """Returns the match inserted into a markup style."""
 
-            if self.match_formatter is not None:
-                content = self.match_formatter(matchobj, content)
+        groups = matchobj.groupdict()
 
-                if content == "":
-                    return ""
+        name = matchobj.lastgroup
+        content = groups.get(str(name), None)
 
-            tag = f"{self.prefix}{name}"
-            style = f"[{tag}]{{}}[/{tag}]"
+        if self.match_formatter is not None:
+            content = self.match_formatter(matchobj, content)
 
-            return style.format(content)
+            if content == "":
+                return ""
 
-        text = self._pattern.sub(_insert_style, text)
-        self._highlight_cache[cache_key] = text
+        return self._wrap(str(name), str(content))
 
-        return text
+    def _wrap(self, name: str, content: str) -> str:
+        """Wraps content in the markup style of the given name."""
+
+        if content == "":
+            return ""
+
+        tag = f"{self.prefix}{name}"
+        return f"[{tag}]{content}[/{tag}]"
+
+    def _find_opener(self, line: str, position: int) -> tuple[str, int] | None:
+        """Finds the first multiline style that opens, but doesn't close in line.
+
+        Returns:
+            The name of the style and the index it opens at, or None if all multiline
+            styles close within the line.
+        """
+
+        openers: list[tuple[str, int]] = []
+
+        for name, (opener, closer) in self._multiline_patterns.items():
+            opening = opener.search(line, position)
+
+            if opening is None or closer.search(line, opening.end()) is not None:
+                continue
+
+            openers.append((name, opening.start()))
+
+        return min(openers, key=lambda item: item[1], default=None)
+
+    def highlight_line(
+        self, line: str, state: str | None = None
+    ) -> tuple[str, str | None]:
+        """Highlights a single line of a larger document.
+
+        Highlighting a document line-by-line, passing each line the state returned for
+        the previous one, allows re-highlighting only the lines that changed, as well as
+        the ones after it whose starting state is now different.
+
+        Args:
+            line: The line to highlight.
+            state: The name of the `multiline` style left open by the previous line, or
+                None if there isn't one.
+
+        Returns:
+            The highlighted line, and the name of the multiline style left open at its
+            end (or None).
+        """
+
+        if self.pre_formatter is not None:
+            line = self.pre_formatter(line)
+
+        output = ""
+        position = 0
+
+        if state is not None:
+            _, closer = self._multiline_patterns[state]
+            closing = closer.search(line)
+
+            if closing is None:
+                return self._wrap(state, line), state
+
+            output += self._wrap(state, line[: closing.end()])
+            position = closing.end()
+
+        while position < len(line):
+            matchobj = self._pattern.search(line, position)
+            opening = self._find_opener(line, position)
+
+            if opening is not None and (
+                matchobj is None or opening[1] <= matchobj.start()
+            ):
+                name, start = opening
+                output += line[position:start] + self._wrap(name, line[start:])
+
+                return output, name
+
+            if matchobj is None:
+                break
+
+            start, end = matchobj.span()
+            output += line[position:start] + self._insert_style(matchobj)
+
+            # Avoid getting stuck on empty matches
+            if start == end:
+                output += line[end : end + 1]
+                end += 1
+
+            position = end
+
+        return output + line[position:], None
 
     def __fancy_repr__(self) -> Generator[FancyYield, None, None]:
         """Yields some fancy looking repr text."""
@@ -233,4 +339,5 @@ highlight_python = RegexHighlighter(
         ("global", r"(?<=\b)([A-Z]\w+)"),
         ("number", r"(?<=\b)((?:0x[\da-zA-Z]+)|(?:\d+))"),
     ],
+    multiline={"multiline_str": (r"[frbu]*\"{3}", r"(?<!\\)\"{3}")},
 )
@@ -2,6 +2,8 @@
 
 from typing import Any
 
+from ..default_tables import DEFAULT_ALIAS_TABLE
+
 MarkupLanguage = Any  # pylint: disable=invalid-name
 
 CODE_GROUP = {
@@ -26,9 +28,12 @@ DEFAULT_ALIASES = {**CODE_GROUP, **{"background": ""}}
 def apply_default_aliases(lang: MarkupLanguage) -> None:
     """Applies all aliases within `DEFAULT_ALIASES`.
 
+    Their unsetters are loaded from `DEFAULT_ALIAS_TABLE`, instead of being generated
+    every time.
+
     Args:
         lang: The `MarkupLanguage` instance all aliases will be
             applied to.
     """
 
-    lang.alias_multiple(**DEFAULT_ALIASES)
+    lang.alias_multiple(**DEFAULT_ALIAS_TABLE, generate_unsetter=False)
@@ -4,12 +4,12 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
-from functools import cached_property
-from typing import Callable, Generator, Iterator, Match
+from functools import cached_property, lru_cache, wraps
+from typing import Any, Callable, Generator, Iterator, List, Match, Optional, Tuple
 
 from ..colors import Color, ColorSyntaxError, str_to_color
-from ..regex import RE_MARKUP
-from ..term import get_terminal
+from ..regex import RE_MACRO, RE_MARKUP
+from ..term import ColorSystem, get_terminal
 from .aliases import apply_default_aliases
 from .macros import apply_default_macros
 from .parsing import (
@@ -28,6 +28,9 @@ from .tokens import Token
 
 STRICT_MARKUP = bool(os.getenv("PTG_STRICT_MARKUP"))
 
+# The number of results cached for each pure macro
+MACRO_CACHE_SIZE = 1024
+
 __all__ = [
     "escape",
     "MarkupLanguage",
@@ -36,6 +39,11 @@ __all__ = [
 ]
 
 Tokenizer = Callable[[str], Iterator[Token]]
+CacheKey = Tuple[str, bool, bool]
+
+# The output, tokens, whether an impure macro was used, and the color system the
+# output was created with if any macros were used
+CacheEntry = Tuple[str, List[Token], bool, Optional[ColorSystem]]
 
 
 def escape(text: str) -> str:
@@ -49,12 +57,34 @@ def escape(text: str) -> str:
     return RE_MARKUP.sub(_repl, text)
 
 
-class MarkupLanguage:
+def _cache_macro(method: Callable[..., str]) -> Callable[..., str]:
+    """Caches the results of a pure macro, keyed by its arguments & color system.
+
+    Macros that output colors, like `!gradient`, localize them for the terminal's
+    current color system.
+    """
+
+    @lru_cache(maxsize=MACRO_CACHE_SIZE)
+    def _call(_: ColorSystem, *args: str) -> str:
+        return method(*args)
+
+    @wraps(method)
+    def _macro(*args: str) -> str:
+        return _call(get_terminal().colorsystem, *args)
+
+    return _macro
+
+
+class MarkupLanguage:  # pylint: disable=too-many-instance-attributes
     """A relatively simple object that binds context to TIM parsing functions.
 
     Most of the job this class has is to pass along a `ContextDict` to various
     "lower level" functions, in order to maintain a sort of state. It also exposes
     ways to modify this state, namely the `alias` and `define` methods.
+
+    Aliases are resolved into flat token lists the first time they are used. The
+    language keeps track of which aliases & cached parses reference each alias, so
+    redefining one only invalidates the results that depend on it.
     """
 
     def __init__(
@@ -64,7 +94,13 @@ class MarkupLanguage:
         default_aliases: bool = True,
         default_macros: bool = True,
     ) -> None:
-        self._cache: dict[tuple[str, bool, bool], tuple[str, list[Token], bool]] = {}
+        self._cache: dict[CacheKey, CacheEntry] = {}
+        self._resolved_aliases: dict[str, tuple[str, list[Token]]] = {}
+        self._pure_macros: set[str] = set()
+
+        # Maps a tag to the aliases & cached parses that reference it
+        self._alias_dependents: dict[str, set[str]] = {}
+        self._cache_dependents: dict[str, set[CacheKey]] = {}
 
         self.context = create_context_dict()
         self._aliases = self.context["aliases"]
@@ -78,6 +114,39 @@ class MarkupLanguage:
 
         self.strict = strict or STRICT_MARKUP
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Returns the language's state for pickling.
+
+        Only the aliases & macros are kept, caches are rebuilt by the new copy. Every
+        macro has to be picklable, e.g. a module-level function.
+        """
+
+        macros = {
+            name: getattr(method, "__wrapped__", method)
+            if name in self._pure_macros
+            else method
+            for name, method in self._macros.items()
+        }
+
+        return {
+            "strict": self.strict,
+            "aliases": self.aliases,
+            "macros": macros,
+            "pure_macros": set(self._pure_macros),
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restores a pickled language."""
+
+        MarkupLanguage.__init__(
+            self, strict=state["strict"], default_aliases=False, default_macros=False
+        )
+
+        self._aliases.update(state["aliases"])
+
+        for name, method in state["macros"].items():
+            self.define(name, method, pure=name in state["pure_macros"])
+
     @property
     def aliases(self) -> dict[str, str]:
         """Returns a copy of the aliases defined in context."""
@@ -91,14 +160,89 @@ class MarkupLanguage:
         return self._macros.copy()
 
     def clear_cache(self) -> None:
-        """Clears the internal cache.
+        """Clears the internal cache, and all resolved aliases.
 
-        Use this after re-defining aliases.
+        `alias` invalidates everything that depends on the changed alias by itself, so
+        this is only needed after modifying `context` directly.
         """
 
         self._cache.clear()
+        self._resolved_aliases.clear()
+        self._alias_dependents.clear()
+        self._cache_dependents.clear()
+
+    def _evaluate_alias(self, name: str) -> str:
+        """Returns the flattened tags an alias stands for, resolving it if needed."""
+
+        resolved = self._resolved_aliases.get(name)
+        if resolved is not None:
+            return resolved[0]
+
+        tags = []
+        for tag in self._aliases[name].split():
+            # Macros are redefined by name, without their arguments
+            macro = RE_MACRO.match(tag) if tag.startswith("!") else None
+            dependency = tag if macro is None else macro.group(1)
+
+            self._alias_dependents.setdefault(dependency, set()).add(name)
+
+            if tag in self._aliases:
+                tags.append(self._evaluate_alias(tag))
+                continue
+
+            tags.append(tag)
+
+        value = " ".join(tags).strip()
+        self._resolved_aliases[name] = (value, list(tokenize_markup(f"[{value}]")))
+
+        return value
+
+    def resolve_alias(self, name: str) -> list[Token]:
+        """Returns the tokens an alias stands for, with all inner aliases substituted.
+
+        The result is computed once, and reused until the alias, or any of the aliases
+        it references are redefined.
 
-    def define(self, name: str, method: MacroType) -> None:
+        Args:
+            name: The name of a defined alias.
+
+        Returns:
+            The alias' tokens. This list must not be modified.
+        """
+
+        resolved = self._resolved_aliases.get(name)
+        if resolved is None:
+            self._evaluate_alias(name)
+            resolved = self._resolved_aliases[name]
+
+        return resolved[1]
+
+    def _invalidate(self, name: str) -> None:
+        """Drops the resolved aliases & cached parses that depend on a tag."""
+
+        if not (
+            name in self._resolved_aliases
+            or name in self._alias_dependents
+            or name in self._cache_dependents
+        ):
+            return
+
+        invalidated = {name}
+        remaining = [name]
+
+        while len(remaining) > 0:
+            current = remaining.pop()
+            self._resolved_aliases.pop(current, None)
+
+            for key in self._cache_dependents.pop(current, ()):
+                self._cache.pop(key, None)
+
+            for dependent in self._alias_dependents.pop(current, ()):
+                if dependent not in invalidated:
+                    invalidated.add(dependent)
+                    remaining.append(dependent)
+
+    def define(self, name: str, method: MacroType, *, pure: bool = False) -> None:
         """Defines a markup macro.
 
         Macros are essentially function bindings callable within markup. They can be
@@ -110,12 +254,41 @@ class MarkupLanguage:
             method: The function bound to the name given above. This function will take
                 any number of strings as arguments, and return a terminal-ready (i.e. parsed)
                 string.
+            pure: Whether the macro's output only depends on its arguments. The results
+                of pure macros are cached, and markup that only contains pure macros
+                is not re-parsed on every call. Leave this unset for macros that
+                display changing data, like the current time.
         """
 
         if not name.startswith("!"):
             raise ValueError("TIM macro names must be prefixed by `!`.")
 
+        if pure:
+            method = _cache_macro(method)
+            self._pure_macros.add(name)
+
+        else:
+            self._pure_macros.discard(name)
+
         self._macros[name] = method
+        self._invalidate(name)
+
+    def _get_macros(self, tokens: list[Token]) -> set[str]:
+        """Returns the macros used by the tokens, or any aliases within them."""
+
+        macros = set()
+
+        for token in tokens:
+            if token.value in self._aliases and (
+                token.is_alias() or token.is_clear() or token.is_macro()
+            ):
+                macros |= self._get_macros(self.resolve_alias(token.value))
+                continue
+
+            if token.is_macro():
+                macros.add(token.value)
+
+        return macros
 
     def alias(self, name: str, value: str, *, generate_unsetter: bool = True) -> None:
         """Creates an alias from one custom name to a set of styles.
@@ -162,10 +335,17 @@ class MarkupLanguage:
 
             return unsetter.lstrip(" ")
 
-        self._aliases[name] = value
+        if self._aliases.get(name) != value:
+            self._aliases[name] = value
+            self._invalidate(name)
 
         if generate_unsetter:
-            self._aliases[f"/{name}"] = _generate_unsetter()
+            unsetter_name = f"/{name}"
+            unsetter = _generate_unsetter()
+
+            if self._aliases.get(unsetter_name) != unsetter:
+                self._aliases[unsetter_name] = unsetter
+                self._invalidate(unsetter_name)
 
     def alias_multiple(self, *, generate_unsetter: bool = True, **items: str) -> None:
         """Runs `MarkupLanguage.alias` repeatedly for all arguments.
@@ -188,8 +368,17 @@ class MarkupLanguage:
             ```
         """
 
+        if generate_unsetter:
+            for name, value in items.items():
+                self.alias(name, value)
+
+            return
+
+        aliases = self._aliases
         for name, value in items.items():
-            self.alias(name, value, generate_unsetter=generate_unsetter)
+            if aliases.get(name) != value:
+                aliases[name] = value
+                self._invalidate(name)
 
     def parse(
         self,
@@ -217,25 +406,28 @@ class MarkupLanguage:
 
         cache_hit = self._cache.get(key)
         if cache_hit is not None:
-            cached, tokens, has_macro = cache_hit
+            cached, tokens, has_impure_macro, system = cache_hit
 
-            # Re-parse using known tokens when macro is present
+            # Re-parse using known tokens when an impure macro is present
             #
             # This saves a tiny fraction of time (around 0.2ms) when parsing
             # macros, for a loss of an even smaller time for the general,
             # non-macro usecase.
-            if has_macro:
+            if has_impure_macro:
                 output = parse_tokens(
                     tokens,
                     optimize=optimize,
                     append_reset=append_reset,
                     context=self.context,
                     ignore_unknown_tags=not self.strict,
+                    resolve_alias=self.resolve_alias,
                 )
 
                 return output
 
-            return cached
+            # Pure macros (e.g. `!gradient`) may still depend on the color system
+            if system is None or system is get_terminal().colorsystem:
+                return cached
 
         tokens = list(tokenize_markup(text))
 
@@ -245,11 +437,23 @@ class MarkupLanguage:
             append_reset=append_reset,
             context=self.context,
             ignore_unknown_tags=not self.strict,
+            resolve_alias=self.resolve_alias,
         )
 
-        has_macro = any(token.is_macro() for token in tokens)
+        for token in tokens:
+            # Tags that may be (re)defined as aliases or macros later on
+            if token.is_macro() or token.is_alias() or token.is_clear():
+                self._cache_dependents.setdefault(token.value, set()).add(key)
 
-        self._cache[key] = (output, tokens, has_macro)
+        macros = self._get_macros(tokens)
+
+        # Unknown macros are considered impure, as they may be defined later on
+        self._cache[key] = (
+            output,
+            tokens,
+            any(macro not in self._pure_macros for macro in macros),
+            get_terminal().colorsystem if macros else None,
+        )
 
         return output
 
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from random import shuffle
-from typing import Any, TypeVar
+from typing import Any, Callable, Sequence, Tuple, TypeVar, overload
 
-from .parsing import parse
+from ..colors import str_to_color
+from ..term import ColorSystem, get_terminal
 
 DEFAULT_MACROS = {}
+PURE_MACROS: set[str] = set()
 
 MarkupLanguage = Any
 
@@ -15,14 +18,37 @@ MarkupLanguage = Any
 MacroTemplate = TypeVar("MacroTemplate")
 
 
+@overload
 def export_macro(func: MacroTemplate) -> MacroTemplate:
-    """A decorator to add a function to `DEFAULT_MACROS`."""
+    ...
 
-    name = "_".join(func.__name__.split("_")[1:])  # type: ignore
 
-    DEFAULT_MACROS[f"!{name}"] = func
+@overload
+def export_macro(*, pure: bool) -> Callable[[MacroTemplate], MacroTemplate]:
+    ...
 
-    return func
+
+def export_macro(func: Any = None, *, pure: bool = True) -> Any:
+    """A decorator to add a function to `DEFAULT_MACROS`.
+
+    Macros are assumed to be pure by default. Use `@export_macro(pure=False)` for
+    ones that aren't, see `MarkupLanguage.define`.
+    """
+
+    def _export(func: MacroTemplate) -> MacroTemplate:
+        name = "!" + "_".join(func.__name__.split("_")[1:])  # type: ignore
+
+        DEFAULT_MACROS[name] = func
+
+        if pure:
+            PURE_MACROS.add(name)
+
+        return func
+
+    if func is None:
+        return _export
+
+    return _export(func)
 
 
 def apply_default_macros(lang: MarkupLanguage) -> None:
@@ -33,7 +59,7 @@ def apply_default_macros(lang: MarkupLanguage) -> None:
     """
 
     for name, value in DEFAULT_MACROS.items():
-        lang.define(name, value)
+        lang.define(name, value, pure=name in PURE_MACROS)
 
 
 @export_macro
@@ -71,7 +97,7 @@ def macro_align(width: str, alignment: str, content: str) -> str:
     return f"{content:{aligner}{width}}"
 
 
-@export_macro
+@export_macro(pure=False)
 def macro_expand(lang: MarkupLanguage, tag: str) -> str:
     """Expands a tag alias."""
 
@@ -81,7 +107,7 @@ def macro_expand(lang: MarkupLanguage, tag: str) -> str:
     return lang.get_markup(f"\x1b[{lang.user_tags[tag]}m ")[:-1]
 
 
-@export_macro
+@export_macro(pure=False)
 def macro_shuffle(item: str) -> str:
     """Shuffles a string using shuffle.shuffle on its list cast."""
 
@@ -91,35 +117,96 @@ def macro_shuffle(item: str) -> str:
     return "".join(shuffled)
 
 
-def _apply_colors(colors: list[str] | list[int], item: str) -> str:
-    """Applies the given list of colors to the item, spread out evenly."""
+# A list of (sequence, start index) pairs, applied to a string of a given length
+BlockLayout = Tuple[Tuple[str, int], ...]
+
+RAINBOW_COLORS = ("red", "orange", "yellow", "green", "blue", "indigo", "violet")
+
+
+@lru_cache(maxsize=1024)
+def _get_blocks(
+    colors: tuple[str, ...], length: int, _system: ColorSystem
+) -> BlockLayout:
+    """Spreads the colors out evenly across a string of the given length.
+
+    The `_system` argument is only used to key the cache, as localized sequences
+    depend on the terminal's color system.
+    """
+
+    blocksize = max(round(length / len(colors)), 1)
+    starts = range(0, min(len(colors) * blocksize, length), blocksize)
+
+    return tuple(
+        (str_to_color(color, localize=False).get_localized().sequence, start)
+        for color, start in zip(colors, starts)
+    )
+
+
+@lru_cache(maxsize=1024)
+def _get_interpolated_blocks(
+    stops: tuple[str, ...], length: int, _system: ColorSystem
+) -> BlockLayout:
+    """Interpolates between the stop colors for every character of a string.
 
-    blocksize = max(round(len(item) / len(colors)), 1)
+    Neighbouring characters that end up with the same localized color are merged into
+    one block. The `_system` argument is only used to key the cache.
+    """
+
+    colors = [str_to_color(stop, localize=False) for stop in stops]
+    segments = len(colors) - 1
+
+    blocks: list[tuple[str, int]] = []
+    previous = None
+
+    for i in range(length):
+        position = i / (length - 1) * segments if length > 1 else 0.0
+        index = min(int(position), segments - 1)
+
+        color = colors[index].blend(colors[index + 1], position - index, localize=True)
+        sequence = color.sequence
+
+        if sequence != previous:
+            blocks.append((sequence, i))
+            previous = sequence
 
-    out = ""
-    current_block = 0
-    for i, char in enumerate(item):
-        if i % blocksize == 0 and current_block < len(colors):
-            out += f"[{colors[current_block]}]"
-            current_block += 1
+    return tuple(blocks)
 
-        out += char
 
-    return parse(out + "[/fg]", append_reset=False) + "\x1b[0m"
+def _apply_blocks(blocks: BlockLayout, item: str) -> str:
+    """Applies the sequences of a block layout to the item."""
+
+    ends = [start for _, start in blocks[1:]] + [len(item)]
+
+    return (
+        "".join(
+            sequence + item[start:end] for (sequence, start), end in zip(blocks, ends)
+        )
+        + "\x1b[39m\x1b[0m"
+    )
+
+
+def _apply_colors(colors: Sequence[str] | Sequence[int], item: str) -> str:
+    """Applies the given list of colors to the item, spread out evenly."""
+
+    blocks = _get_blocks(
+        tuple(str(color) for color in colors), len(item), get_terminal().colorsystem
+    )
+
+    return _apply_blocks(blocks, item)
 
 
 @export_macro
 def macro_rainbow(item: str) -> str:
     """Creates rainbow-colored text."""
 
-    colors = ["red", "orange", "yellow", "green", "blue", "indigo", "violet"]
-
-    return _apply_colors(colors, item)
+    return _apply_colors(RAINBOW_COLORS, item)
 
 
 @export_macro
-def macro_gradient(base_str: str, item: str) -> str:
-    """Creates an xterm-256 gradient from a base color.
+def macro_gradient(*args: str) -> str:
+    """Creates a gradient-colored text.
+
+    When given a single xterm-256 color, an xterm-256 gradient is created from it.
 
     This exploits the way the colors are arranged in the xterm color table; every
     36th color is the next item of a single gradient.
@@ -128,8 +215,23 @@ def macro_gradient(base_str: str, item: str) -> str:
     every iteration as long as the point is a valid gradient start.
 
     After that, the 6 colors of this gradient are calculated and applied.
+
+    When given multiple colors, e.g. `[!gradient(#ff0000:yellow:#0000ff)]`, the text
+    is colored by interpolating between them for every character. This is
+    true-color, but degrades to the terminal's color system.
     """
 
+    *stops, item = args
+
+    if len(stops) > 1:
+        blocks = _get_interpolated_blocks(
+            tuple(stops), len(item), get_terminal().colorsystem
+        )
+
+        return _apply_blocks(blocks, item)
+
+    base_str = stops[0] if len(stops) > 0 else ""
+
     if not base_str.isdigit():
         raise ValueError(f"Gradient base has to be a digit, got {base_str}.")
 
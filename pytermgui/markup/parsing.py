@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from dataclasses import dataclass, replace
 from typing import Callable, Iterator, Protocol, TypedDict
 from warnings import filterwarnings, warn
 
@@ -445,100 +446,225 @@ def parse_state_pseudo(
     return parsed
 
 
-def optimize_tokens(tokens: list[Token]) -> Iterator[Token]:
-    """Optimizes a stream of tokens, only yielding functionally relevant ones.
+# The style codes each SGR "reset" sequence turns off. Codes not listed here, like
+# 26 & 54, don't reset anything.
+SGR_RESETS = {
+    "22": ("1", "2"),
+    "23": ("3",),
+    "24": ("4",),
+    "25": ("5", "6"),
+    "27": ("7",),
+    "28": ("8",),
+    "29": ("9",),
+    "55": ("53",),
+}
 
-    Args:
-        tokens: Any list of Token objects. Usually obtained from `tokenize_markup`
-            or `tokenize_ansi`.
+STYLE_BITS = {name: 1 << i for i, name in enumerate(STYLES)}
 
-    Yields:
-        All those tokens within the input iterator that are functionally relevant,
-            keeping their order.
-    """
+# The bitmask of styles each style clearer actually removes
+CLEARER_MASKS = {
+    name: sum(
+        STYLE_BITS[REVERSE_STYLES[code]] for code in SGR_RESETS.get(index, tuple())
+    )
+    for name, index in CLEARERS.items()
+    if name not in ("/", "/fg", "/bg")
+}
 
-    previous: list[Token] = []
-    current_tag_group: list[Token] = []
+# The clearer used to remove each style, preferring the one named after it. Styles
+# missing from this can only be removed by a full reset.
+STYLE_CLEARERS = {
+    bit: ClearToken(f"/{style}" if f"/{style}" in names else names[0])
+    for style, bit in STYLE_BITS.items()
+    if (names := [name for name, mask in CLEARER_MASKS.items() if mask & bit])
+}
 
-    def _diff_previous() -> Iterator[Token]:
-        """Find difference from the previously active list of tokens."""
 
-        applied = previous.copy()
+@dataclass
+class _StyleState:
+    """The SGR state at some point of a token stream, plus the active link."""
 
-        for tkn in current_tag_group:
-            targets = []
+    foreground: ColorToken | None = None
+    background: ColorToken | None = None
+    styles: int = 0
+    link: str | None = None
 
-            clearer = Token.is_clear(tkn)
-            if Token.is_clear(tkn):
-                targets = [tkn.targets(tag) for tag in applied]
+    def apply(self, token: Token) -> bool:
+        """Applies a token to this state.
 
-            if tkn in previous and not clearer:
-                continue
+        Returns:
+            Whether the token was handled. Unhandled tokens don't affect the state.
+        """
 
-            if clearer and not any(targets):
-                continue
+        if Token.is_color(token):
+            if token.color.background:
+                self.background = token
+            else:
+                self.foreground = token
+
+        elif Token.is_style(token):
+            self.styles |= STYLE_BITS[token.value]
 
-            applied.append(tkn)
-            yield tkn
+        elif Token.is_hyperlink(token):
+            self.link = token.value
 
-    def _remove_redundant_color(token: Token) -> None:
-        """Removes non-functional colors.
+        elif not Token.is_clear(token):
+            return False
 
-        These happen in the following ways:
-        - Multiple colors of the same channel (fg/bg) are present.
-        - A color is applied, then a clearer clears it.
+        elif token.value == "/fg":
+            self.foreground = None
+
+        elif token.value == "/bg":
+            self.background = None
+
+        elif token.value == "/~":
+            self.link = None
+
+        elif token.value in CLEARER_MASKS:
+            self.styles &= ~CLEARER_MASKS[token.value]
+
+        else:
+            return False
+
+        return True
+
+    def get_tokens(self) -> list[Token]:
+        """Returns the tokens that create this state from a fully reset one."""
+
+        tokens: list[Token] = [
+            color for color in (self.foreground, self.background) if color is not None
+        ]
+
+        tokens.extend(
+            StyleToken(style)
+            for style, bit in STYLE_BITS.items()
+            if self.styles & bit
+        )
+
+        if self.link is not None:
+            tokens.append(HLinkToken(self.link))
+
+        return tokens
+
+    def transition_to(self, new: _StyleState, can_reset: bool) -> list[Token]:
+        """Returns the fewest tokens that turn this state into the new one.
+
+        Args:
+            new: The state to transition to.
+            can_reset: Whether a full reset (`/`) may be used. It also clears macros,
+                so it can't be when any of them are active.
         """
 
-        for applied in current_tag_group.copy():
-            if Token.is_clear(applied) and applied.targets(token):
-                current_tag_group.remove(applied)
+        if (
+            self.styles == new.styles
+            and self.foreground is new.foreground
+            and self.background is new.background
+            and self.link == new.link
+        ):
+            return []
 
-            if not Token.is_color(applied):
-                continue
+        removed = self.styles & ~new.styles
+        cleared = 0
+        tokens: list[Token] = []
 
-            old = applied.color
+        for bit, clearer in STYLE_CLEARERS.items():
+            if removed & bit and not cleared & bit:
+                tokens.append(clearer)
+                cleared |= CLEARER_MASKS[clearer.value]
 
-            if old.background == new.background:
-                current_tag_group.remove(applied)
+        incremental = removed & ~cleared == 0
 
-    for token in tokens:
-        if Token.is_plain(token):
-            yield from _diff_previous()
-            yield token
+        for old_color, new_color, clearer in (
+            (self.foreground, new.foreground, "/fg"),
+            (self.background, new.background, "/bg"),
+        ):
+            if new_color is None:
+                if old_color is not None:
+                    tokens.append(ClearToken(clearer))
 
-            previous = current_tag_group.copy()
+            elif old_color is None or old_color.markup != new_color.markup:
+                tokens.append(new_color)
 
-            continue
+        tokens.extend(
+            StyleToken(style)
+            for style, bit in STYLE_BITS.items()
+            if new.styles & bit and (self.styles & ~cleared) & bit == 0
+        )
 
-        if Token.is_color(token):
-            new = token.color
+        if new.link != self.link:
+            link = ClearToken("/~") if new.link is None else HLinkToken(new.link)
+            tokens.append(link)
 
-            _remove_redundant_color(token)
+        if can_reset:
+            reset = [ClearToken("/"), *new.get_tokens()]
 
-            if not any(token.markup == applied.markup for applied in current_tag_group):
-                current_tag_group.append(token)
+            # Prefer clean resets over clearing everything one by one
+            if not incremental or len(reset) < len(tokens) or (
+                len(reset) == len(tokens) and len(reset) == 1
+            ):
+                return reset
 
-            continue
+        return tokens
+
+
+def optimize_tokens(tokens: list[Token]) -> Iterator[Token]:
+    """Optimizes a stream of tokens, only yielding functionally relevant ones.
+
+    The styling tokens between two plain tokens are folded into a style state of
+    colors, styles & link, and only the fewest tokens that transition from the
+    previous state to it are yielded. All other tokens, like macros and cursor
+    movements are kept as they are.
+
+    Args:
+        tokens: Any list of Token objects. Usually obtained from `tokenize_markup`
+            or `tokenize_ansi`.
+
+    Yields:
+        All those tokens within the input iterator that are functionally relevant,
+            keeping their order.
+    """
 
-        if token.is_style():
-            if not any(token == tag for tag in current_tag_group):
-                current_tag_group.append(token)
+    applied = _StyleState()
+    state = _StyleState()
+    pending: list[Token] = []
+    has_macros = False
+
+    for i, token in enumerate(tokens):
+        if Token.is_pseudo(token):
+            # Pseudo tokens rely on the exact tokens around them, so we stop here
+            yield from pending
+            yield from applied.transition_to(state, not has_macros)
+            yield from tokens[i:]
+            return
 
+        if Token.is_plain(token):
+            yield from pending
+            yield from applied.transition_to(state, not has_macros)
+            yield token
+
+            pending.clear()
+            applied = replace(state)
             continue
 
-        if Token.is_clear(token):
-            applied = False
-            for tag in current_tag_group.copy():
-                if token.targets(tag) or token == tag:
-                    current_tag_group.remove(tag)
-                    applied = True
+        if state.apply(token):
+            continue
 
-            if not applied:
-                continue
+        if Token.is_clear(token) and token.value == "/":
+            # Macros need the reset to clear them, so it's kept as is
+            if has_macros:
+                pending.append(token)
+                applied = _StyleState()
+                has_macros = False
 
-        current_tag_group.append(token)
+            state = _StyleState()
+            continue
+
+        if Token.is_macro(token):
+            has_macros = True
 
-    yield from _diff_previous()
+        pending.append(token)
+
+    yield from pending
+    yield from applied.transition_to(state, not has_macros)
 
 
 def tokens_to_markup(tokens: list[Token]) -> str:
@@ -620,7 +746,11 @@ def _apply_macros(
     return text
 
 
-def _sub_aliases(tokens: list[Token], context: ContextDict) -> list[Token]:
+def _sub_aliases(
+    tokens: list[Token],
+    context: ContextDict,
+    resolve_alias: Callable[[str], list[Token]] | None = None,
+) -> list[Token]:
     """Substitutes all AliasTokens to their underlying values.
 
     Args:
@@ -628,6 +758,8 @@ def _sub_aliases(tokens: list[Token], context: ContextDict) -> list[Token]:
             that can be interpreted as an alias, the same iterator turned into
             a list will be returned.
         context: The context that aliases will be searched in.
+        resolve_alias: A function returning the pre-resolved tokens of an alias. If
+            not given, aliases are evaluated from context every time.
     """
 
     output: list[Token] = []
@@ -648,7 +780,10 @@ def _sub_aliases(tokens: list[Token], context: ContextDict) -> list[Token]:
             if Token.is_clear(token) or Token.is_macro(token):
                 token = AliasToken(token.value)
 
-            if Token.is_alias(token):
+            if resolve_alias is not None:
+                output.extend(resolve_alias(token.value))
+
+            elif Token.is_alias(token):
                 aliases_parsed = parse_alias(token, context, get_full)
                 output.extend(list(tokenize_markup(f"[{aliases_parsed}]")))
 
@@ -671,6 +806,7 @@ def _sub_aliases(tokens: list[Token], context: ContextDict) -> list[Token]:
 
 
 # This function could be broken up into pieces, but that will likely lose readability.
+# pylint: disable-next=too-many-arguments
 def parse_tokens(  # pylint: disable=too-many-branches, too-many-locals, too-many-statements
     tokens: list[Token],
     *,
@@ -678,6 +814,7 @@ def parse_tokens(  # pylint: disable=too-many-branches, too-many-locals, too-man
     context: ContextDict | None = None,
     append_reset: bool = True,
     ignore_unknown_tags: bool = True,
+    resolve_alias: Callable[[str], list[Token]] | None = None,
 ) -> str:
     """Parses a stream of tokens into the ANSI-coded string they represent.
 
@@ -692,6 +829,9 @@ def parse_tokens(  # pylint: disable=too-many-branches, too-many-locals, too-man
             clearing all styles.
         ignore_unknown_tags: If set, the `MarkupSyntaxError` coming from unknown tags
             will be silenced.
+        resolve_alias: A function returning the pre-resolved tokens of an alias,
+            such as `MarkupLanguage.resolve_alias`. If not given, aliases are
+            evaluated from context every time.
 
     Returns:
         The ANSI-coded string that the token stream represents.
@@ -700,7 +840,7 @@ def parse_tokens(  # pylint: disable=too-many-branches, too-many-locals, too-man
     if context is None:
         context = create_context_dict()
 
-    token_list = _sub_aliases(tokens, context)
+    token_list = _sub_aliases(tokens, context, resolve_alias)
 
     # It's more computationally efficient to create this lambda once and reuse it
     # every time. There is no need to define a full function, as it just returns
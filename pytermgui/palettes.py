@@ -4,12 +4,15 @@ from __future__ import annotations
 
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import Any, Callable, Generator, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Generator, Tuple
 
 from .colors import Color
-from .fancy_repr import FancyYield
+from .default_tables import DEFAULT_PALETTE_TABLE
 from .markup import MarkupLanguage, tim
 
+if TYPE_CHECKING:
+    from .fancy_repr import FancyYield
+
 SHADE_COUNT = 3
 SHADE_FLOOR = 0.4
 SHADE_INCREMENT = (1 - SHADE_FLOOR) / SHADE_COUNT
@@ -17,6 +20,9 @@ SHADE_INCREMENT = (1 - SHADE_FLOOR) / SHADE_COUNT
 SURFACE = Color.parse("#303030")
 SURFACE_ALPHA = 0.2
 
+DEFAULT_PRIMARY = "#7c93d0"
+"""The primary color of the default palette."""
+
 SUCCESS = Color.parse("#67eb7f")
 ERROR = Color.parse("#eb7067")
 WARNING = Color.parse("#ebe267")
@@ -271,6 +277,22 @@ class Palette:
             for key, color in data.items()
         }
 
+    @classmethod
+    def from_data(cls, data: dict[str, str]) -> Palette:
+        """Creates a palette from an already generated color map, like `Palette.data`.
+
+        Args:
+            data: A mapping of color names to values.
+
+        Returns:
+            A palette holding a copy of the given data.
+        """
+
+        instance = cls.__new__(cls)
+        instance.data = dict(data)
+
+        return instance
+
     def regenerate(self, **kwargs: Any) -> Palette:
         """Generates a new palette and replaces self.data with its data.
 
@@ -306,7 +328,6 @@ class Palette:
             lang: The language to run `alias_multiple` on.
         """
 
-        lang.clear_cache()
         lang.alias_multiple(**self.data, generate_unsetter=False)
 
     def __fancy_repr__(self) -> Generator[FancyYield, None, None]:
@@ -392,5 +413,6 @@ class Palette:
             tim.print("".join(f"[@{self.data[name]}]{' ' * length}" for name in names))
 
 
-palette = Palette(primary="#7c93d0")
+# The default palette is generated at build time, see `utils/generate_tables.py`
+palette = Palette.from_data(DEFAULT_PALETTE_TABLE)
 palette.alias()
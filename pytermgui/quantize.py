@@ -0,0 +1,198 @@
+"""Fast mapping of RGB colors to the indices of the xterm palettes.
+
+`quantize_rgb` converts whole batches of colors at once, using lookup tables built
+from `pytermgui.color_info.COLOR_TABLE`. The same tables back the `from_rgb`
+constructors of the indexed color types in `pytermgui.colors`.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from math import sqrt  # pylint: disable=no-name-in-module
+from typing import Iterable, Tuple, Union
+
+from .color_info import COLOR_TABLE
+from .term import ColorSystem
+
+__all__ = ["quantize_rgb"]
+
+Number = Union[float, int]
+RGBTriplet = Tuple[Number, Number, Number]
+
+# Per-channel contributions to an xterm-256 color cube index.
+_CUBE_RED = [36 * round(value / 255 * 5) for value in range(256)]
+_CUBE_GREEN = [6 * round(value / 255 * 5) for value in range(256)]
+_CUBE_BLUE = [round(value / 255 * 5) for value in range(256)]
+
+# A 32x32x32 table of the closest xterm-16 color, keyed by the top 5 bits of each
+# channel. Entries are filled on first use; 255 marks an entry not yet computed, and
+# 254 a bin whose colors don't all share the same closest color.
+_STANDARD_LUT = bytearray(b"\xff" * 32**3)
+_MIXED_BIN = 254
+
+
+def clear_lookup_tables() -> None:
+    """Clears the lazily filled xterm-16 color lookup table."""
+
+    _STANDARD_LUT[:] = b"\xff" * 32**3
+    _get_closest_standard.cache_clear()
+
+
+def _linearize(color: float) -> float:
+    """Converts sRGB color to linear value."""
+
+    if color <= 0.04045:
+        return color / 12.92
+
+    return ((color + 0.055) / 1.055) ** 2.4
+
+
+_LINEAR = [_linearize(value / 255) for value in range(256)]
+
+
+@lru_cache(maxsize=4096)
+def _get_closest_standard(red: int, green: int, blue: int) -> int:
+    """Gets the xterm-16 index of the least different color."""
+
+    rgb = (red, green, blue)
+
+    return min(range(16), key=lambda i: _get_color_difference(rgb, COLOR_TABLE[i]))
+
+
+def _get_standard_index(red: int, green: int, blue: int) -> int:
+    """Gets the closest xterm-16 index for the given color, filling the lookup table.
+
+    A bin of the table only stores an index when all of its corners are closest to
+    the same color, which then holds for every color within it. Colors in other bins
+    are matched one by one.
+    """
+
+    key = (red >> 3) << 10 | (green >> 3) << 5 | blue >> 3
+    index = _STANDARD_LUT[key]
+
+    if index == 255:
+        low = (red & ~7, green & ~7, blue & ~7)
+        corners = {
+            _get_closest_standard(low[0] + r, low[1] + g, low[2] + b)
+            for r in (0, 7)
+            for g in (0, 7)
+            for b in (0, 7)
+        }
+
+        index = corners.pop() if len(corners) == 1 else _MIXED_BIN
+        _STANDARD_LUT[key] = index
+
+    if index == _MIXED_BIN:
+        return _get_closest_standard(red, green, blue)
+
+    return index
+
+
+def _get_greyscale_index(red: int, green: int, blue: int) -> int:
+    """Gets the index of the xterm greyscale ramp color matching the given brightness.
+
+    See `Color.luminance` and `Color.brightness`.
+    """
+
+    return _get_ramp_index(
+        0.2126 * _LINEAR[red] + 0.7152 * _LINEAR[green] + 0.0722 * _LINEAR[blue]
+    )
+
+
+def _get_ramp_index(luminance: float) -> int:
+    """Gets the index of the xterm greyscale ramp color of the given luminance."""
+
+    if luminance <= (216 / 24389):
+        brightness = luminance * (24389 / 27)
+
+    else:
+        brightness = luminance ** (1 / 3) * 116 - 16
+
+    return int(232 + brightness / 100 * 23)
+
+
+def _clamp_rgb(rgb: RGBTriplet) -> tuple[int, int, int]:
+    """Clamps the components of an RGB triplet into integers in the range 0-255."""
+
+    red, green, blue = (min(max(round(value), 0), 255) for value in rgb)
+    return red, green, blue
+
+
+def quantize_rgb(
+    data: bytes | bytearray | memoryview | Iterable[RGBTriplet],
+    system: ColorSystem,
+) -> bytes:
+    """Maps a batch of RGB colors to xterm palette indices of the given color system.
+
+    This is considerably faster than creating and localizing a `Color` for each item,
+    as it only uses precomputed lookup tables:
+
+    - `ColorSystem.EIGHT_BIT`: An index into the 6x6x6 color cube (16-231).
+    - `ColorSystem.STANDARD`: The closest xterm-16 color (0-15), looked up from a
+        32x32x32 table wherever a whole bin of it shares the same closest color.
+    - `ColorSystem.NO_COLOR`: A greyscale ramp color (232-255) matching the color's
+        brightness.
+
+    Args:
+        data: Either a flat bytes-like object of RGB triplets (such as the buffer of
+            an `RGBPixelMatrix`, or a `uint8` NumPy array), or an iterable of RGB
+            tuples with components in the range 0-255. Float components are
+            rounded.
+        system: The color system to quantize to. Must not be `ColorSystem.TRUE`.
+
+    Returns:
+        The palette index of every color, in the order they were given.
+    """
+
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        view = memoryview(data).cast("B")
+        triplets: Iterable[tuple[int, int, int]] = zip(
+            view[0::3], view[1::3], view[2::3]
+        )
+
+    else:
+        # Rounded like `pytermgui.colors.Color.from_rgb` does
+        triplets = ((round(r), round(g), round(b)) for r, g, b in data)
+
+    if system is ColorSystem.EIGHT_BIT:
+        red, green, blue = _CUBE_RED, _CUBE_GREEN, _CUBE_BLUE
+
+        return bytes(16 + red[r] + green[g] + blue[b] for r, g, b in triplets)
+
+    if system is ColorSystem.STANDARD:
+        lut = _STANDARD_LUT
+        indices = bytearray()
+
+        for r, g, b in triplets:
+            index = lut[(r >> 3) << 10 | (g >> 3) << 5 | b >> 3]
+
+            indices.append(index if index < 16 else _get_standard_index(r, g, b))
+
+        return bytes(indices)
+
+    if system is ColorSystem.NO_COLOR:
+        return bytes(_get_greyscale_index(r, g, b) for r, g, b in triplets)
+
+    raise ValueError(f"Cannot quantize colors to {system!r}.")
+
+
+def _get_color_difference(rgb1: RGBTriplet, rgb2: RGBTriplet) -> float:
+    """Gets the geometric difference of 2 RGB colors (0-255).
+
+    See https://en.wikipedia.org/wiki/Color_difference's Euclidian section.
+    """
+
+    red1, green1, blue1 = rgb1
+    red2, green2, blue2 = rgb2
+
+    redmean = (red1 + red2) // 2
+
+    delta_red = red1 - red2
+    delta_green = green1 - green2
+    delta_blue = blue1 - blue2
+
+    return sqrt(
+        (2 + (redmean / 256)) * (delta_red**2)
+        + 4 * (delta_green**2)
+        + (2 + (255 - redmean) / 256) * (delta_blue**2)
+    )
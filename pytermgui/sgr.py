@@ -0,0 +1,309 @@
+"""An encoder that minimizes the SGR (styling) sequences within ANSI-coded text.
+
+Rendered markup contains every style & color sequence as it was written, and resets
+everywhere: after each parsed string, between the segments of a `Splitter`, around
+borders and so on. Most of these turn out to be redundant once the lines of a frame
+are written one after the other.
+
+`SGREncoder` keeps track of the style the terminal is currently in, and the style the
+input text wants. Style changes are only emitted right before the next visible text,
+as the smallest delta between the two states, combined into a single sequence:
+
+```python3
+encoder = SGREncoder()
+
+encoder.encode("\x1b[1m\x1b[38;5;141mHello\x1b[0m\x1b[1m\x1b[38;5;141m World\x1b[0m")
+# '\x1b[1;38;5;141mHello World'
+
+encoder.flush()
+# '\x1b[0m'
+```
+
+Cursor movement & hyperlink sequences are passed through without applying the pending
+style, every other sequence (e.g. erasing, which uses the current background) gets the
+pending style applied before it. Colon-separated SGR parameters are not tracked.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, replace
+from typing import Tuple
+
+__all__ = ["SGREncoder", "minimize_sgr"]
+
+RE_SEQUENCE = re.compile(
+    r"\x1b\[(?P<sgr>[0-9;]*)m"
+    r"|(?P<passthrough>\x1b\[[0-9;]*[Hf]|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\))"
+    r"|(?P<other>\x1b\[[0-?]*[ -/]*[@-~]|\x1b_[^\x1b]*\x1b\\|\x1b[^\[\]_])"
+)
+
+# The style codes turned off by each "reset" code
+STYLE_RESETS = {
+    22: (1, 2),
+    23: (3,),
+    24: (4,),
+    25: (5, 6),
+    27: (7,),
+    28: (8,),
+    29: (9,),
+    55: (53,),
+}
+
+STYLE_CODES = (1, 2, 3, 4, 5, 6, 7, 8, 9, 53)
+
+# The codes followed by an indexed (`5;n`) or RGB (`2;r;g;b`) color: foreground,
+# background and underline
+EXTENDED_COLORS = (38, 48, 58)
+
+# The code used to turn off each style
+STYLE_CLEARERS = {
+    style: reset for reset, styles in STYLE_RESETS.items() for style in styles
+}
+
+
+@dataclass
+class SGRState:
+    """The graphics rendition of a terminal.
+
+    Args:
+        foreground: The parameters of the foreground color, e.g. `38;5;141`. An empty
+            string means the default color.
+        background: The parameters of the background color.
+        styles: A bitmask of the active style codes, each stored at `1 << code`.
+        untracked: The parameters not tracked otherwise (e.g. double underline, or an
+            underline color) applied since the last reset, in order.
+    """
+
+    foreground: str = ""
+    background: str = ""
+    styles: int = 0
+    untracked: Tuple[str, ...] = ()
+
+    def apply(self, params: str) -> None:
+        """Applies the parameters of an SGR sequence.
+
+        Args:
+            params: The parameters, e.g. `1;38;5;141`.
+        """
+
+        values = params.split(";")
+
+        i = 0
+        while i < len(values):
+            value = int(values[i] or 0)
+            i += 1
+
+            if value == 0:
+                self.foreground = self.background = ""
+                self.styles = 0
+                self.untracked = ()
+
+            elif value in STYLE_CODES:
+                self.styles |= 1 << value
+
+            elif value in STYLE_RESETS:
+                for style in STYLE_RESETS[value]:
+                    self.styles &= ~(1 << style)
+
+            elif value in EXTENDED_COLORS:
+                i = self._apply_extended_color(value, values, i)
+
+            elif 30 <= value <= 37 or 90 <= value <= 97:
+                self.foreground = str(value)
+
+            elif 40 <= value <= 47 or 100 <= value <= 107:
+                self.background = str(value)
+
+            elif value == 39:
+                self.foreground = ""
+
+            elif value == 49:
+                self.background = ""
+
+            else:
+                self.untracked += (str(value),)
+
+    def _apply_extended_color(self, code: int, values: list[str], index: int) -> int:
+        """Applies an indexed (`5;n`) or RGB (`2;r;g;b`) color.
+
+        Args:
+            code: The code introducing the color, one of `EXTENDED_COLORS`.
+            values: The parameters of the sequence.
+            index: The index of the parameter following the code.
+
+        Returns:
+            The index of the first parameter after the color.
+        """
+
+        if index < len(values) and values[index] == "5":
+            length = 2
+        elif index < len(values) and values[index] == "2":
+            length = 4
+        else:
+            return index
+
+        color = ";".join([str(code), *values[index : index + length]])
+
+        if code == 38:
+            self.foreground = color
+        elif code == 48:
+            self.background = color
+        else:
+            self.untracked += (color,)
+
+        return index + length
+
+    def get_params(self) -> list[str]:
+        """Returns the parameters that create this state from a reset terminal."""
+
+        params = [str(code) for code in STYLE_CODES if self.styles & (1 << code)]
+        params.extend(color for color in (self.foreground, self.background) if color)
+        params.extend(self.untracked)
+
+        return params
+
+    def get_delta(self, new: SGRState) -> list[str]:
+        """Returns the fewest parameters that turn this state into the new one."""
+
+        full = ["0", *new.get_params()]
+        untracked = len(self.untracked)
+
+        # Untracked attributes can only be turned off by a reset
+        if new.untracked[:untracked] != self.untracked:
+            return full
+
+        removed = self.styles & ~new.styles
+        styles = self.styles
+        params: list[str] = []
+
+        for code in STYLE_CODES:
+            if removed & (1 << code) and styles & (1 << code):
+                reset = STYLE_CLEARERS[code]
+                params.append(str(reset))
+
+                for style in STYLE_RESETS[reset]:
+                    styles &= ~(1 << style)
+
+        params.extend(
+            str(code)
+            for code in STYLE_CODES
+            if new.styles & (1 << code) and not styles & (1 << code)
+        )
+
+        if new.foreground != self.foreground:
+            params.append(new.foreground or "39")
+
+        if new.background != self.background:
+            params.append(new.background or "49")
+
+        params.extend(new.untracked[untracked:])
+
+        if len(";".join(full)) < len(";".join(params)):
+            return full
+
+        return params
+
+
+class SGREncoder:
+    """Rewrites ANSI-coded text to use the fewest SGR sequences possible.
+
+    The encoder is stateful; it assumes everything it returns is written to the same
+    terminal, in order.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the encoder, assuming the terminal is in its default style."""
+
+        self._current: SGRState | None = SGRState()
+        self._target = SGRState()
+
+    def reset(self) -> None:
+        """Marks the terminal's current style as unknown.
+
+        The next style change will start with a full reset. Use this when something
+        other than the encoder may have written to the terminal.
+        """
+
+        self._current = None
+
+    def flush(self) -> str:
+        """Returns the sequence that applies the pending style changes, if any."""
+
+        current = self._current
+        target = self._target
+
+        if current is None:
+            params = ["0", *target.get_params()]
+
+        elif current == target:
+            params = []
+
+        else:
+            params = current.get_delta(target)
+
+        self._current = replace(target)
+
+        if len(params) == 0:
+            return ""
+
+        return f"\x1b[{';'.join(params)}m"
+
+    def encode(self, text: str) -> str:
+        """Encodes the given text.
+
+        Style changes at the end of the text are only applied once more text is
+        encoded, or `flush` is called.
+
+        Args:
+            text: Some ANSI-coded text.
+
+        Returns:
+            The text, with its SGR sequences minimized.
+        """
+
+        output = []
+        cursor = 0
+
+        for match in RE_SEQUENCE.finditer(text):
+            start, end = match.span()
+
+            if cursor < start:
+                output.append(self.flush())
+                output.append(text[cursor:start])
+
+            cursor = end
+            params = match.group("sgr")
+
+            if params is not None:
+                self._target.apply(params)
+                continue
+
+            if match.group("other") is not None:
+                output.append(self.flush())
+
+            output.append(match.group())
+
+        if cursor < len(text):
+            output.append(self.flush())
+            output.append(text[cursor:])
+
+        return "".join(output)
+
+
+def minimize_sgr(text: str) -> str:
+    """Minimizes the SGR sequences within a string.
+
+    The text is assumed to start in the terminal's default style, and will leave the
+    terminal in the same style as the original would.
+
+    Args:
+        text: Some ANSI-coded text.
+
+    Returns:
+        The text, with its SGR sequences minimized.
+    """
+
+    encoder = SGREncoder()
+
+    return encoder.encode(text) + encoder.flush()
@@ -0,0 +1,351 @@
+"""Streaming versions of the HTML & SVG exporters.
+
+These write the exported document into a file as it is generated, so only the set
+of unique styles (and, for SVG, the current row) is kept in memory. This makes
+exporting very long inputs, like session recordings or log files, possible.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from math import isclose
+from typing import IO, Iterable, Iterator
+
+from .colors import Color
+from .exporters import (
+    FONT_HEIGHT,
+    FONT_SIZE,
+    FONT_WIDTH,
+    HTML_FORMAT,
+    SVG_FORMAT,
+    _escape_text,
+    _generate_html_lines,
+    _generate_stylesheet,
+    _get_data_lines,
+    _get_svg_frame,
+    _get_svg_style_attr,
+    _handle_tokens_svg,
+    _is_block,
+)
+from .markup import PlainToken, StyledText, Token, tim, tokenize_ansi
+from .term import get_terminal
+from .widgets import Widget
+
+__all__ = ["stream_html", "stream_svg"]
+
+
+def stream_html(  # pylint: disable=too-many-arguments, too-many-locals
+    obj: Widget | StyledText | str | Iterable[str],
+    file: IO[str],
+    prefix: str | None = None,
+    inline_styles: bool = False,
+    include_background: bool = True,
+    vertical_offset: float = 0.0,
+    horizontal_offset: float = 0.0,
+    formatter: str = HTML_FORMAT,
+    joiner: str = "\n",
+) -> int:
+    """Writes the HTML representation of the given object into a file, line by line.
+
+    Unlike `to_html`, the document is never built in memory; only the set of unique
+    styles is kept around. This makes it possible to export very long inputs, like
+    session recordings or log files, as long as they are given as an iterable of
+    lines (an open file works too).
+
+    Since the stylesheet is only known once all content has been written, it is
+    emitted after the content. If the formatter has a `{styles}` field after
+    `{content}` it is placed there, otherwise a `<style>` element is inserted before
+    the closing `</body>` tag (or at the end of the document, if there is none).
+
+    Args:
+        obj: The object to represent. Takes either a Widget, some markup text or an
+            iterable of ANSI lines.
+        file: The file-like object to write into.
+
+    For help on the rest of the arguments, see `to_html`.
+
+    Returns:
+        The number of characters written.
+    """
+
+    head, _, tail = formatter.partition("{content}")
+
+    fields = {
+        "foreground": Color.get_default_foreground().hex,
+        "background": (
+            Color.get_default_background().hex if include_background else ""
+        ),
+        "font_size": FONT_SIZE,
+    }
+
+    document_styles: dict[tuple[str, ...], int] = {}
+
+    written = file.write(head.format(styles="", **fields))
+
+    lines = _generate_html_lines(
+        _get_data_lines(obj),
+        document_styles,
+        prefix=prefix,
+        inline_styles=inline_styles,
+        include_background=include_background,
+        vertical_offset=vertical_offset,
+        horizontal_offset=horizontal_offset,
+    )
+
+    for i, line in enumerate(lines):
+        written += file.write(line if i == 0 else joiner + line)
+
+    stylesheet = ""
+    if not inline_styles:
+        stylesheet = _generate_stylesheet(document_styles, prefix)
+
+    if "{styles}" in tail:
+        return written + file.write(tail.format(styles=stylesheet, **fields))
+
+    tail = tail.format(**fields)
+
+    if stylesheet != "":
+        element = "<style>" + stylesheet + "\n        </style>\n    "
+
+        if "</body>" in tail:
+            tail = tail.replace("</body>", element + "</body>", 1)
+        else:
+            tail += element
+
+    return written + file.write(tail)
+
+
+
+def _group_styles_svg(
+    obj: Widget | StyledText | str | Iterable[str],
+) -> Iterator[StyledText]:
+    """Groups the given object's content into StyledTexts, lazily if possible.
+
+    Iterables of lines are tokenized one line at a time, but are grouped as one
+    stream so styles carry over line breaks, just like they do in a joined string.
+    """
+
+    if isinstance(obj, (str, StyledText)):
+        return tim.group_styles(str(obj))
+
+    lines = obj.get_lines() if isinstance(obj, Widget) else obj
+
+    def _tokenize(_: str) -> Iterator[Token]:
+        for i, line in enumerate(lines):
+            if i > 0:
+                yield PlainToken("\n")
+
+            yield from tokenize_ansi(line.rstrip("\r\n"))
+
+    return tim.group_styles("", tokenizer=_tokenize)
+
+
+@dataclass
+class _MergedRun:
+    """A rect or text of an SVG row, made up of one or more touching runs."""
+
+    x: float
+    y: float
+    width: float
+    key: str
+    text: str = ""
+
+    def extend(self, x: float, y: float, width: float, key: str, text: str) -> bool:
+        """Extends this run with the given one, if it touches it and looks the same.
+
+        Returns:
+            Whether the run could be extended.
+        """
+
+        if self.y != y or self.key != key or not isclose(self.x + self.width, x):
+            return False
+
+        self.width += width
+        self.text += text
+        return True
+
+
+def _render_svg_row(
+    runs: list[tuple[float, float, float, str, str, bool, str]], default_back: str
+) -> str:
+    """Renders a row of runs, merging the neighbouring ones where possible.
+
+    Touching runs of the same background are drawn as a single `rect`, and touching
+    runs of the same style as a single `text`. Backgrounds matching the default are
+    skipped entirely, as the frame behind the content is already filled with it.
+
+    Args:
+        runs: A list of (x, y, rect_y, fill, style_attr, decorated, text) tuples, in
+            the order they were written. `decorated` is set for runs that have some
+            text-decoration, which makes even their whitespace visible.
+        default_back: The default background color.
+
+    Returns:
+        The row's tags, rects first, one per line.
+    """
+
+    rects: list[_MergedRun] = []
+    texts: list[_MergedRun] = []
+
+    for x, y, rect_y, fill, attr, decorated, text in runs:
+        width = len(text) * FONT_WIDTH
+
+        if fill != default_back and not (
+            rects and rects[-1].extend(x, rect_y, width, fill, "")
+        ):
+            rects.append(_MergedRun(x, rect_y, width, fill))
+
+        if not decorated and text.strip() == "":
+            continue
+
+        if not (texts and texts[-1].extend(x, y, width, attr, text)):
+            texts.append(_MergedRun(x, y, width, attr, text))
+
+    height = round(FONT_HEIGHT * 1.08, 2)
+
+    row = ""
+    for run in rects:
+        row += (
+            f"\t\t<rect x='{round(run.x, 2)}' y='{round(run.y, 2)}'"
+            + f" fill='{run.key}' width='{round(run.width * 1.02, 2)}'"
+            + f" height='{height}'/>\n"
+        )
+
+    for run in texts:
+        row += (
+            f"\t\t<text dy='-0.25em' x='{round(run.x, 2)}' y='{round(run.y, 2)}'"
+            + f" textLength='{round(run.width, 2)}' {run.key}>"
+            + f"{_escape_text(run.text)}</text>\n"
+        )
+
+    return row
+
+
+def stream_svg(  # pylint: disable=too-many-locals, too-many-arguments, R0912, R0915
+    obj: Widget | StyledText | str | Iterable[str],
+    file: IO[str],
+    prefix: str | None = None,
+    chrome: bool = True,
+    inline_styles: bool = False,
+    title: str = "PyTermGUI",
+    formatter: str = SVG_FORMAT,
+) -> int:
+    """Writes an SVG screenshot of the given object into a file, one row at a time.
+
+    The result looks the same as the one of `to_svg`, but is generally a lot smaller
+    and cheaper to render: touching runs of the same background are merged into a
+    single `rect` (and skipped when they use the default background), and touching
+    runs of the same style into a single `text`. Only the current row and the unique
+    styles are kept in memory, and the output is not prettified.
+
+    Since the stylesheet is only known once all content has been written, it is
+    emitted after the content. If the formatter has a `{stylesheet}` field after
+    `{code}` it is placed there, otherwise a `style` element is inserted before the
+    closing `</svg>` tag.
+
+    Args:
+        obj: The object to represent. Takes either a Widget, some markup text or an
+            iterable of ANSI lines.
+        file: The file-like object to write into.
+
+    For help on the rest of the arguments, see `to_svg`.
+
+    Returns:
+        The number of characters written.
+    """
+
+    prefix = prefix if prefix is not None else "ptg"
+
+    terminal = get_terminal()
+    default_fore = Color.get_default_foreground().hex
+    default_back = Color.get_default_background().hex
+
+    transform, frame = _get_svg_frame(prefix, chrome, title, default_back)
+    head, _, tail = formatter.partition("{code}")
+
+    written = file.write(head.format(stylesheet="", **frame))
+    written += file.write(f"<g transform='{transform}'>\n")
+
+    lines = 1
+    cursor_x = cursor_y = 0.0
+    document_styles: dict[tuple[str, ...], int] = {}
+    runs: list[tuple[float, float, float, str, str, bool, str]] = []
+
+    # See `to_svg`.
+    baseline_offset = 0.17 * FONT_HEIGHT
+
+    for plain in _group_styles_svg(obj):
+        if "\x1b" in plain.plain:
+            continue
+
+        pos, back, styles = _handle_tokens_svg(plain, default_fore, default_back)
+        style_attr = _get_svg_style_attr(styles, document_styles, prefix, inline_styles)
+        decorated = any(style.startswith("text-decoration") for style in styles)
+
+        should_newline = False
+
+        # Manual positioning
+        if pos is not None:
+            written += file.write(_render_svg_row(runs, default_back))
+            runs = []
+
+            cursor_x = pos[0] * FONT_WIDTH - 10
+            cursor_y = pos[1] * FONT_HEIGHT - 15
+
+        for line in plain.plain.splitlines():
+            if should_newline:
+                written += file.write(_render_svg_row(runs, default_back))
+                runs = []
+
+                cursor_x, cursor_y = 0, cursor_y + FONT_HEIGHT
+
+                lines += 1
+                if lines > terminal.height:
+                    break
+
+            if line != "":
+                runs.append(
+                    (
+                        cursor_x,
+                        cursor_y + FONT_SIZE,
+                        cursor_y - (baseline_offset if not _is_block(line) else 0),
+                        back or default_back,
+                        style_attr,
+                        decorated,
+                        line,
+                    )
+                )
+
+            cursor_x += len(line) * FONT_WIDTH
+            should_newline = True
+
+        if lines > terminal.height:
+            break
+
+        if plain.plain.endswith("\n"):
+            written += file.write(_render_svg_row(runs, default_back))
+            runs = []
+
+            cursor_x, cursor_y = 0, cursor_y + FONT_HEIGHT
+
+            lines += 1
+
+    written += file.write(_render_svg_row(runs, default_back))
+    written += file.write("\t</g>\n")
+
+    stylesheet = "" if inline_styles else _generate_stylesheet(document_styles, prefix)
+
+    if "{stylesheet}" in tail:
+        return written + file.write(tail.format(stylesheet=stylesheet, **frame))
+
+    tail = tail.format(**frame)
+
+    if stylesheet != "":
+        element = '<style type="text/css">' + stylesheet + "\n    </style>\n"
+
+        if "</svg>" in tail:
+            tail = tail.replace("</svg>", element + "</svg>", 1)
+        else:
+            tail += element
+
+    return written + file.write(tail)
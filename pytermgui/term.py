@@ -15,24 +15,41 @@ from enum import Enum
 from functools import cached_property
 from io import StringIO
 from shutil import get_terminal_size
-from typing import TYPE_CHECKING, Any, Callable, Generator, TextIO
+from typing import TYPE_CHECKING, Any, Callable, Generator, Iterator, Protocol
 
 from .input import getch_timeout
 from .regex import RE_PIXEL_SIZE, has_open_sequence, real_length, strip_ansi
 
 if TYPE_CHECKING:
+    from .asciicast import AsciicastRecorder, PathOrFile
     from .fancy_repr import FancyYield
 
 __all__ = [
-    "terminal",
     "set_global_terminal",
     "get_terminal",
     "Terminal",
     "Recorder",
     "ColorSystem",
+    "TerminalStream",
 ]
 
 
+class TerminalStream(Protocol):
+    """The interface of the streams a `Terminal` writes to, e.g. `sys.stdout`.
+
+    Any object implementing it can be used, like a `pytermgui.emulator.ScreenEmulator`.
+    """
+
+    def write(self, data: str, /) -> int:
+        """Writes the given data, returning the number of characters written."""
+
+    def flush(self) -> None:
+        """Flushes the written data."""
+
+    def truncate(self, size: int | None = None, /) -> int:
+        """Truncates the stream to the given size."""
+
+
 class Recorder:
     """A class that records & exports terminal content."""
 
@@ -92,6 +109,27 @@ class Recorder:
             chrome=chrome,
         )
 
+    def save_asciicast(
+        self, filename: str, size: tuple[int, int] | None = None
+    ) -> None:
+        """Exports the recording as an asciicast (v2) file.
+
+        Args:
+            filename: The file to save to. If it ends with '.gz', the output will be
+                compressed.
+            size: The (width, height) of the recorded terminal. Defaults to the
+                size of the global terminal.
+        """
+
+        # pylint: disable-next=import-outside-toplevel
+        from .asciicast import AsciicastRecorder
+
+        with AsciicastRecorder(filename, size or get_terminal().size) as recorder:
+            for data, timestamp in self.recording:
+                recorder._write_event(  # pylint: disable=protected-access
+                    round(timestamp, 6), data
+                )
+
     def save_plain(self, filename: str) -> None:
         """Exports plain text content to the given file.
 
@@ -244,7 +282,7 @@ class Terminal:  # pylint: disable=too-many-instance-attributes
 
     def __init__(
         self,
-        stream: TextIO | None = None,
+        stream: TerminalStream | None = None,
         *,
         size: tuple[int, int] | None = None,
     ) -> None:
@@ -256,7 +294,7 @@ class Terminal:  # pylint: disable=too-many-instance-attributes
         self._size = size
         self._stream = stream or sys.stdout
 
-        self._recorder: Recorder | None = None
+        self._recorder: Recorder | AsciicastRecorder | None = None
 
         self.size: tuple[int, int] = self._get_size()
         self.forced_colorsystem: ColorSystem | None = _get_env_colorsys()
@@ -418,19 +456,47 @@ class Terminal:  # pylint: disable=too-many-instance-attributes
         return ColorSystem.STANDARD
 
     @contextmanager
-    def record(self) -> Generator[Recorder, None, None]:
-        """Records the terminal's stream."""
+    def record(
+        self,
+        file: PathOrFile | None = None,
+        *,
+        fps: float | None = None,
+        compress: bool | None = None,
+    ) -> Generator[Any, None, None]:
+        """Records the terminal's stream.
+
+        Args:
+            file: If given, the recording is streamed into this path or file as an
+                asciicast (v2) file using an `AsciicastRecorder`. Otherwise an
+                in-memory `Recorder` is used.
+            fps: Passed to `AsciicastRecorder`.
+            compress: Passed to `AsciicastRecorder`.
+
+        Yields:
+            The `Recorder` or `AsciicastRecorder` in use.
+        """
 
         if self._recorder is not None:
             raise RuntimeError(f"{self!r} is already recording.")
 
+        if file is None:
+            recorder: Recorder | AsciicastRecorder = Recorder()
+        else:
+            # pylint: disable-next=import-outside-toplevel
+            from .asciicast import AsciicastRecorder
+
+            recorder = AsciicastRecorder(file, self.size, fps=fps, compress=compress)
+
         try:
-            self._recorder = Recorder()
-            yield self._recorder
+            self._recorder = recorder
+            yield recorder
 
         finally:
             self._recorder = None
 
+            if not isinstance(recorder, Recorder):
+                recorder.close()
+
     @contextmanager
     def no_record(self) -> Generator[None, None, None]:
         """Pauses recording for the duration of the context."""
@@ -470,16 +536,40 @@ class Terminal:  # pylint: disable=too-many-instance-attributes
 
         return sys.stdin.isatty()
 
-    def replay(self, recorder: Recorder) -> None:
-        """Replays a recording."""
+    def replay(
+        self,
+        recorder: Recorder | str | os.PathLike,
+        start: float = 0.0,
+        speed: float = 1.0,
+    ) -> None:
+        """Replays a recording.
+
+        Args:
+            recorder: An in-memory `Recorder`, or the path to an asciicast file.
+            start: The timestamp to start playing from. Output before it is written
+                without any delay, starting from the closest keyframe.
+            speed: The playback speed multiplier.
+        """
+
+        if isinstance(recorder, Recorder):
+            events: Iterator[tuple[float, str]] = (
+                (delay, data) for data, delay in recorder.recording
+            )
+        else:
+            # pylint: disable-next=import-outside-toplevel
+            from .asciicast import AsciicastReader
+
+            events = AsciicastReader(recorder).events(start)
+
+        last_time = None
+        for delay, data in events:
+            if delay >= start:
+                if last_time is not None:
+                    time.sleep(max(delay - last_time, 0.0) / speed)
 
-        last_time = 0.0
-        for data, delay in recorder.recording:
-            if last_time > 0.0:
-                time.sleep(delay - last_time)
+                last_time = delay
 
-            self.write(data, flush=True)
-            last_time = delay
+            self.write(data, flush=delay >= start)
 
     def subscribe(self, event: int, callback: Callable[..., Any]) -> None:
         """Subcribes a callback to be called when event occurs.
@@ -601,17 +691,40 @@ class Terminal:  # pylint: disable=too-many-instance-attributes
         self._stream.flush()
 
 
-terminal = Terminal()  # pylint: disable=invalid-name
-"""Terminal instance that should be used pretty much always."""
+# Created on first use by `get_terminal`, so this isn't a constant
+_terminal: Terminal | None = None  # pylint: disable=invalid-name
 
 
 def set_global_terminal(new: Terminal) -> None:
     """Sets the terminal instance to be used by the module."""
 
-    globals()["terminal"] = new
+    global _terminal  # pylint: disable=global-statement
+
+    _terminal = new
 
 
 def get_terminal() -> Terminal:
-    """Gets the default terminal instance used by the module."""
+    """Gets the default terminal instance used by the module.
+
+    It is only created once it's first needed, as setting it up queries the size of
+    the terminal & installs a resize handler.
+    """
+
+    global _terminal  # pylint: disable=global-statement
+
+    if _terminal is None:
+        _terminal = Terminal()
+
+    return _terminal
+
+
+def __getattr__(name: str) -> Any:
+    """Provides the lazily created `terminal`, as returned by `get_terminal`.
+
+    `terminal` is the Terminal instance that should be used pretty much always.
+    """
+
+    if name == "terminal":
+        return get_terminal()
 
-    return terminal
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Optional, Type, Union
+from bisect import bisect_left
+from typing import Any, Optional, Type, Union
+from weakref import WeakKeyDictionary, WeakValueDictionary
 
+from ..enums import HorizontalAlignment
 from . import boxes
 from .base import *
 from .button import Button
@@ -17,6 +20,7 @@ from .inline import inline
 from .input_field import InputField
 from .keyboard_button import KeyboardButton
 from .pixel_matrix import *
+from .selectors import Selector, parse_selector
 from .slider import Slider
 from .styles import *
 from .toggle import Toggle
@@ -26,12 +30,28 @@ WidgetType = Union[Widget, Type[Widget]]
 
 class _IDManager:
     """Simple object to store all widgets in a program, and
-    allow referencing by id."""
+    allow referencing by id.
+
+    Widgets are only weakly referenced, so registering one doesn't keep it alive.
+    """
 
     def __init__(self) -> None:
-        """Initialize dict"""
+        """Initialize dicts & indices"""
+
+        self._widgets: WeakValueDictionary[str, WidgetType] = WeakValueDictionary()
+        self._ids: WeakKeyDictionary[WidgetType, str] = WeakKeyDictionary()
+
+        # These may hold ids of collected widgets, which are pruned when queried.
+        self._sorted_ids: list[str] = []
+        self._ids_by_type: dict[type, set[str]] = {}
+
+    def _unindex(self, key: str) -> None:
+        """Removes an id from the sorted index."""
 
-        self._widgets: dict[str, WidgetType] = {}
+        index = bisect_left(self._sorted_ids, key)
+
+        if index < len(self._sorted_ids) and self._sorted_ids[index] == key:
+            del self._sorted_ids[index]
 
     def register(self, other: Widget) -> None:
         """Add widget to self._widgets
@@ -43,32 +63,191 @@ class _IDManager:
         if objid is None:
             raise ValueError("Cannot register element with no ID!")
 
+        previous = self._widgets.get(objid)
+
+        if previous is None:
+            index = bisect_left(self._sorted_ids, objid)
+
+            if index == len(self._sorted_ids) or self._sorted_ids[index] != objid:
+                self._sorted_ids.insert(index, objid)
+
+        elif previous is not other:
+            self._ids.pop(previous, None)
+            self._ids_by_type.get(type(previous), set()).discard(objid)
+
         self._widgets[objid] = other
+        self._ids[other] = objid
+        self._ids_by_type.setdefault(type(other), set()).add(objid)
 
     def deregister(self, key: str) -> None:
         """Remove widget from self._widgets
 
         This method is meant to be called only internally by Widget."""
 
-        del self._widgets[key]
+        widget = self._widgets.pop(key)
+
+        self._ids.pop(widget, None)
+        self._unindex(key)
+        self._ids_by_type.get(type(widget), set()).discard(key)
 
     def get_id(self, other: Widget) -> Optional[str]:
         """Check if a widget has been registered"""
 
-        for key, widget in self._widgets.items():
-            if widget == other:
-                return key
-
-        return None
+        return self._ids.get(other)
 
     def get_widget(self, widget_id: str) -> Optional[WidgetType]:
         """Get widget by id"""
 
         return self._widgets.get(widget_id)
 
+    def find_widgets(
+        self, prefix: str = "", widget_type: Type[Widget] | None = None
+    ) -> list[WidgetType]:
+        """Finds all registered widgets matching the given filters.
+
+        Args:
+            prefix: Only widgets whose id starts with this are returned.
+            widget_type: If given, only instances of this type (or its subclasses)
+                are returned.
+
+        Returns:
+            The widgets found, ordered by their ids.
+        """
+
+        if widget_type is None:
+            ids = self._sorted_ids
+            start = bisect_left(ids, prefix)
+            end = start
+
+            while end < len(ids) and ids[end].startswith(prefix):
+                end += 1
+
+            candidates = ids[start:end]
+
+        else:
+            candidates = sorted(
+                key
+                for cls, type_ids in self._ids_by_type.items()
+                if issubclass(cls, widget_type)
+                for key in type_ids
+                if key.startswith(prefix)
+            )
+
+        widgets = []
+
+        for key in candidates:
+            widget = self._widgets.get(key)
+
+            if widget is None:
+                self._unindex(key)
+
+                for type_ids in self._ids_by_type.values():
+                    type_ids.discard(key)
+
+                continue
+
+            if widget_type is None or isinstance(widget, widget_type):
+                widgets.append(widget)
+
+        return widgets
+
 
 _manager = _IDManager()
 setattr(Widget, "_id_manager", _manager)
 
 get_widget = _manager.get_widget
 get_id = _manager.get_id
+find_widgets = _manager.find_widgets
+
+
+def auto(data: Any, **widget_args: Any) -> Optional[Widget | list[Splitter]]:
+    """Creates a widget from specific data structures.
+
+    This conversion includes various widget classes, as well as some shorthands for
+    more complex objects.  This method is called implicitly whenever a non-widget is
+    attempted to be added to a Widget.
+
+    You can read up on the syntacies for each builtin widget within the widget
+    [documentation](/widgets/builtins).
+
+    Args:
+        data: The structure to convert. See below for formats.
+        **widget_args: Arguments passed straight to the widget constructor.
+
+    Returns:
+        The widget or list of widgets created, or None if the passed structure could
+        not be converted.
+
+    Example:
+
+    ```python3
+    from pytermgui import Container
+    form = (
+        Container(id="form")
+        + "[157 bold]This is a title"
+        + ""
+        + {"[72 italic]Label1": "[210]Button1"}
+        + {"[72 italic]Label2": "[210]Button2"}
+        + {"[72 italic]Label3": "[210]Button3"}
+        + ""
+        + ["Submit", lambda _, button, your_submit_handler(button.parent)]
+    )
+    ```
+    """
+    # In my opinion, returning immediately after construction is much more readable.
+    # pylint: disable=too-many-return-statements
+
+    # Nothing to do.
+    if isinstance(data, Widget):
+        # Set all **widget_args
+        for key, value in widget_args.items():
+            setattr(data, key, value)
+
+        return data
+
+    # Label
+    if isinstance(data, str):
+        return Label(data, **widget_args)
+
+    # Splitter
+    if isinstance(data, tuple):
+        return Splitter(*data, **widget_args)
+
+    # buttons
+    if isinstance(data, list):
+        label = data[0]
+        onclick = None
+        if len(data) > 1:
+            onclick = data[1]
+
+        # Checkbox
+        if isinstance(label, bool):
+            return Checkbox(onclick, checked=label, **widget_args)
+
+        # Toggle
+        if isinstance(label, tuple):
+            assert len(label) == 2
+            return Toggle(label, onclick, **widget_args)
+
+        return Button(label, onclick, **widget_args)
+
+    # prompt splitter
+    if isinstance(data, dict):
+        rows: list[Splitter] = []
+
+        for key, value in data.items():
+            left = auto(key, parent_align=HorizontalAlignment.LEFT)
+            right = auto(value, parent_align=HorizontalAlignment.RIGHT)
+
+            rows.append(Splitter(left, right, **widget_args))
+
+        if len(rows) == 1:
+            return rows[0]
+
+        return rows
+
+    return None
+
+
+# Alternative binding for the `auto` method
+setattr(Widget, "from_data", staticmethod(auto))
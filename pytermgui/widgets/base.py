@@ -16,7 +16,7 @@ from unicodedata import lookup as u_lookup
 from ..ansi_interface import MouseAction, MouseEvent, reset
 from ..enums import HorizontalAlignment, SizePolicy, WidgetChange
 from ..fancy_repr import FancyYield
-from ..helpers import break_line
+from ..helpers import reflow_cache
 from ..input import keys
 from ..markup import get_markup
 from ..regex import real_length
@@ -134,6 +134,7 @@ class Widget:  # pylint: disable=too-many-public-methods
 
         self.parent: Widget | None = None
         self.selected_index: int | None = None
+        self.classes: set[str] = set()
 
         self._selectables_length = 0
         self._id: Optional[str] = None
@@ -788,10 +789,11 @@ class Label(Widget):
 
         lines = []
         limit = self.width - self.padding
-        broken = break_line(
+        broken = reflow_cache.wrap(
             self.styles.value(self.value),
             limit=limit,
             non_first_limit=limit - self.non_first_padding,
+            words=True,
         )
 
         for i, line in enumerate(broken):
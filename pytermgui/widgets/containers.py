@@ -25,6 +25,7 @@ from ..regex import real_length, strip_markup
 from . import boxes
 from . import styles as w_styles
 from .base import ScrollableWidget, Widget
+from .selectors import get_type_names, select
 
 
 class Container(ScrollableWidget):
@@ -65,6 +66,7 @@ class Container(ScrollableWidget):
             self.width = 40
 
         self._widgets: list[Widget] = []
+        self._index: dict[str, dict[Widget, None]] = {}
         self.dirty_widgets: list[Widget] = []
         self.centered_axis: CenteringPolicy | None = None
 
@@ -293,7 +295,12 @@ class Container(ScrollableWidget):
             value: The new widget at this index.
         """
 
+        old = self._widgets[index]
+        self._update_index(old, add=False)
+
         self._widgets[index] = value
+        value.parent = self
+        self._update_index(value, add=True)
 
     def __contains__(self, other: object) -> bool:
         """Determines if self._widgets contains other widget.
@@ -346,12 +353,69 @@ class Container(ScrollableWidget):
 
         other.get_lines()
         other.parent = self
+        self._update_index(other, add=True)
 
         if run_get_lines:
             self.get_lines()
 
         return other
 
+    def _update_index(self, widget: Widget, add: bool) -> None:
+        """Adds or removes a widget & its descendants in the indices of all ancestors.
+
+        Args:
+            widget: The widget that was added to, or removed from this container.
+            add: Whether the widget should be added. Otherwise it is removed.
+        """
+
+        widgets = [widget]
+        if isinstance(widget, Container):
+            widgets.extend(widget.get_descendants())
+
+        node: Widget | None = self
+        while isinstance(node, Container):
+            index = node._index  # pylint: disable=protected-access
+
+            for item in widgets:
+                for name in get_type_names(type(item)):
+                    if add:
+                        index.setdefault(name, {})[item] = None
+                        continue
+
+                    index.get(name, {}).pop(item, None)
+
+            node = node.parent
+
+    def get_descendants(self, type_name: str = "Widget") -> list[Widget]:
+        """Returns all widgets within this container, recursively.
+
+        This uses an index that is kept up to date as widgets are added & removed, so
+        it doesn't need to traverse the widget tree.
+
+        Args:
+            type_name: The name of the widget type to look for. Instances of its
+                subclasses are included as well.
+
+        Returns:
+            The widgets, in the order they were added in.
+        """
+
+        return list(self._index.get(type_name, ()))
+
+    def query(self, selector: str) -> list[Widget]:
+        """Returns all widgets within this container that match a selector.
+
+        See `pytermgui.widgets.selectors` for the selector syntax.
+
+        Args:
+            selector: A CSS-like selector, e.g. `Container > Button.primary`.
+
+        Returns:
+            The matching widgets.
+        """
+
+        return select([self], selector)
+
     def _get_aligners(
         self, widget: Widget, borders: tuple[str, str]
     ) -> tuple[Callable[[str], str], int]:
@@ -612,6 +676,9 @@ class Container(ScrollableWidget):
             new: The new widget list.
         """
 
+        for widget in self._widgets:
+            self._update_index(widget, add=False)
+
         self._widgets = []
         for widget in new:
             self._add_widget(widget)
@@ -645,7 +712,10 @@ class Container(ScrollableWidget):
             The widget that was popped off the list.
         """
 
-        return self._widgets.pop(index)
+        widget = self._widgets.pop(index)
+        self._update_index(widget, add=False)
+
+        return widget
 
     def remove(self, other: Widget) -> None:
         """Remove widget from self._widgets
@@ -656,7 +726,8 @@ class Container(ScrollableWidget):
             other: The widget to remove.
         """
 
-        return self._widgets.remove(other)
+        self._widgets.remove(other)
+        self._update_index(other, add=False)
 
     def set_recursive_depth(self, value: int) -> None:
         """Set depth for this Container and all its children.
@@ -989,27 +1060,139 @@ class Splitter(Container):
 
     parent_align = HorizontalAlignment.RIGHT
 
-    def _align_line(
-        self, alignment: HorizontalAlignment, target_width: int, line: str
-    ) -> tuple[int, str]:
-        """Align a line
+    def __init__(self, *widgets: Any, **attrs: Any) -> None:
+        """Initializes the Splitter & its render caches."""
 
-        r/wordavalanches"""
+        # These have to exist before `Container.__init__`, as adding widgets
+        # calls `get_lines`.
+        self._render_key: tuple[Any, str] | None = None
+        self._padding_cache: dict[int, str] = {}
+        self._line_cache: dict[str, tuple[int, str]] = {}
 
-        available = target_width - real_length(line)
-        fill_style = self._get_style("fill")
+        super().__init__(*widgets, **attrs)
+
+    def _get_fill(self) -> tuple[w_styles.DepthlessStyleType, str]:
+        """Gets the fill style and its styled padding character.
 
+        The padding & line caches are only valid for a single fill style, so they are
+        dropped whenever the style, or what it renders to, changes.
+
+        Returns:
+            The fill style, and the result of calling it on a single space.
+        """
+
+        fill_style = self._get_style("fill")
         char = fill_style(" ")
-        line = fill_style(line)
+
+        key = (getattr(fill_style, "method", fill_style), char)
+
+        if self._render_key is None or not (
+            self._render_key[0] is key[0] and self._render_key[1] == key[1]
+        ):
+            self._render_key = key
+            self._padding_cache = {}
+            self._line_cache = {}
+
+        return fill_style, char
+
+    def _get_padding(self, char: str, count: int) -> str:
+        """Gets `count` styled padding characters, caching the result per width."""
+
+        if count <= 0:
+            return ""
+
+        padding = self._padding_cache.get(count)
+
+        if padding is None:
+            padding = self._padding_cache[count] = count * char
+
+        return padding
+
+    def _align_styled(  # pylint: disable=too-many-arguments
+        self,
+        alignment: HorizontalAlignment,
+        target_width: int,
+        length: int,
+        line: str,
+        char: str,
+    ) -> tuple[int, str]:
+        """Aligns an already styled line of known length.
+
+        Args:
+            alignment: The alignment to use.
+            target_width: The width to pad the line to.
+            length: The display length of `line`.
+            line: The line to align, with the fill style already applied.
+            char: The styled padding character.
+
+        Returns:
+            The left-hand padding used, and the aligned line.
+        """
+
+        available = target_width - length
 
         if alignment == HorizontalAlignment.CENTER:
             padding, offset = divmod(available, 2)
-            return padding, padding * char + line + (padding + offset) * char
+            return padding, (
+                self._get_padding(char, padding)
+                + line
+                + self._get_padding(char, padding + offset)
+            )
 
         if alignment == HorizontalAlignment.RIGHT:
-            return available, available * char + line
+            return available, self._get_padding(char, available) + line
+
+        return 0, line + self._get_padding(char, available)
 
-        return 0, line + available * char
+    def _render_column(
+        self,
+        widget: Widget,
+        width: int,
+        fill: tuple[w_styles.DepthlessStyleType, str],
+        line_cache: dict[str, tuple[int, str]],
+    ) -> tuple[int, int, list[str]]:
+        """Renders the lines of a single child, aligned within `width`.
+
+        Lines are measured & styled only the first time they are seen; afterwards their
+        length & styled form are looked up from the previous frame's cache.
+
+        Args:
+            widget: The child widget to render.
+            width: The width of the column.
+            fill: The fill style & styled padding character, as given by `_get_fill`.
+            line_cache: The cache of the frame currently being built. Every line used
+                by this column is stored in it.
+
+        Returns:
+            The left-hand padding of the last line, the display width of the column
+            (0 if it is empty) and the list of aligned lines.
+        """
+
+        fill_style, char = fill
+
+        # See `enums.py` for information about this cast
+        alignment = cast(HorizontalAlignment, widget.parent_align)
+
+        padding = 0
+        column_width = 0
+        column = []
+
+        for line in widget.get_lines():
+            if line not in line_cache:
+                line_cache[line] = self._line_cache.get(line) or (
+                    real_length(line),
+                    fill_style(line),
+                )
+
+            length, styled = line_cache[line]
+
+            padding, aligned = self._align_styled(
+                alignment, width, length, styled, char
+            )
+            column.append(aligned)
+            column_width = max(width, length)
+
+        return padding, column_width, column
 
     @property
     def content_dimensions(self) -> tuple[int, int]:
@@ -1028,13 +1211,14 @@ class Splitter(Container):
             self.width - (len(self._widgets) - 1) * separator_length, len(self._widgets)
         )
 
+        fill = self._get_fill()
+        line_cache: dict[str, tuple[int, str]] = {}
+
         self.positioned_line_buffer = []
         vertical_lines = []
         total_offset = 0
 
         for widget in self._widgets:
-            inner = []
-
             if widget.size_policy is SizePolicy.STATIC:
                 target_width += target_width - widget.width
                 width = widget.width
@@ -1043,13 +1227,9 @@ class Splitter(Container):
                 width = widget.width
                 error = 0
 
-            aligned: str | None = None
-            for line in widget.get_lines():
-                # See `enums.py` for information about this ignore
-                padding, aligned = self._align_line(
-                    cast(HorizontalAlignment, widget.parent_align), width, line
-                )
-                inner.append(aligned)
+            padding, column_width, inner = self._render_column(
+                widget, width, fill, line_cache
+            )
 
             new_pos = (
                 self.pos[0] + padding + total_offset,
@@ -1068,14 +1248,19 @@ class Splitter(Container):
 
             widget.positioned_line_buffer = []
 
-            if aligned is not None:
-                total_offset += real_length(inner[-1]) + separator_length
+            if len(inner) > 0:
+                total_offset += column_width + separator_length
 
             vertical_lines.append(inner)
 
-        lines = []
-        for horizontal in zip_longest(*vertical_lines, fillvalue=" " * target_width):
-            lines.append((reset() + separator).join(horizontal))
+        # Only keep the lines used in this frame around.
+        self._line_cache = line_cache
+
+        joiner = reset() + separator
+        lines = [
+            joiner.join(horizontal)
+            for horizontal in zip_longest(*vertical_lines, fillvalue=" " * target_width)
+        ]
 
         self.height = max(widget.height for widget in self)
         return lines
@@ -11,8 +11,10 @@ from wcwidth import wcwidth
 
 from ..ansi_interface import MouseAction, MouseEvent
 from ..enums import HorizontalAlignment
-from ..helpers import break_line
+from ..helpers import LineWrapper
+from ..highlighters import Highlighter
 from ..input import keys
+from ..term import get_terminal
 from . import styles as w_styles
 from .base import Widget
 
@@ -68,7 +70,7 @@ class InputField(Widget):  # pylint: disable=too-many-instance-attributes
 
     parent_align = HorizontalAlignment.LEFT
 
-    def __init__( # pylint: disable=too-many-arguments
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         value: str = "",
         *,
@@ -76,12 +78,23 @@ class InputField(Widget):  # pylint: disable=too-many-instance-attributes
         tablength: int = 4,
         multiline: bool = False,
         cursor: Cursor | None = None,
+        highlighter: Highlighter | None = None,
         **attrs: Any,
     ) -> None:
-        """Initialize object"""
+        """Initialize object
+
+        Args:
+            highlighter: If given, the value style is set to a `HighlighterStyle` of it.
+                Highlighters with a `highlight_line` method (such as
+                `pytermgui.highlighters.RegexHighlighter`) will only re-highlight edited
+                lines, and the ones whose multi-line state changed as a result.
+        """
 
         super().__init__(**attrs)
 
+        if highlighter is not None:
+            self.styles(value=w_styles.HighlighterStyle(highlighter))
+
         if "width" not in attrs:
             self.width = len(value)
 
@@ -98,9 +111,14 @@ class InputField(Widget):  # pylint: disable=too-many-instance-attributes
         self._lines = value.splitlines() or [""]
         self._selection_length = 1
 
-        self._styled_cache: list[str] | None = self._style_and_break_lines()
+        self._value_cache: str | None = None
+        self._line_cache: list[
+            tuple[str, Any, LineWrapper | None, Any, int, list[str]] | None
+        ] = []
+        self._cached_state: tuple[Any, ...] | None = None
 
-        self._cached_state: int = self.width
+        self._styled_width = self.width
+        self._styled_cache: list[str] | None = self._style_and_break_lines()
         self._drag_start: tuple[int, int] | None = None
 
     @property
@@ -113,7 +131,10 @@ class InputField(Widget):  # pylint: disable=too-many-instance-attributes
     def value(self) -> str:
         """Returns the internal value of this field."""
 
-        return "\n".join(self._lines)
+        if self._value_cache is None:
+            self._value_cache = "\n".join(self._lines)
+
+        return self._value_cache
 
     @property
     def selection(self) -> str:
@@ -122,25 +143,126 @@ class InputField(Widget):  # pylint: disable=too-many-instance-attributes
         start, end = sorted([self.cursor.col, self.cursor.col + self._selection_length])
         return self._lines[self.cursor.row][start:end]
 
+    def _get_cache_state(self) -> tuple[Any, ...]:
+        """Returns everything the styled line cache depends on, besides the lines."""
+
+        return (
+            self.prompt,
+            self.styles.prompt.method,
+            self.styles.value.method,
+            get_terminal().colorsystem,
+        )
+
     def _cache_is_valid(self) -> bool:
         """Determines if the styled line cache is still usable."""
 
-        return self.width == self._cached_state
+        if self._cached_state is None:
+            return False
+
+        return all(
+            new is old or new == old
+            for new, old in zip(self._get_cache_state(), self._cached_state)
+        )
+
+    def _mark_dirty(self) -> None:
+        """Signals that the contents of `_lines` have changed.
+
+        Only the lines that were actually changed will be re-styled on the next
+        `get_lines` call.
+        """
+
+        self._styled_cache = None
+        self._value_cache = None
+
+    def _insert_line(self, row: int, line: str) -> None:
+        """Inserts a new line at the given row, keeping the line cache aligned."""
+
+        self._lines.insert(row, line)
+        self._line_cache.insert(row, None)
+
+        # The prompt is only ever styled into the first line
+        if row == 0 and len(self._line_cache) > 1:
+            self._line_cache[1] = None
+
+        self._mark_dirty()
+
+    def _pop_line(self, row: int) -> str:
+        """Removes the line at the given row, keeping the line cache aligned."""
+
+        if row < len(self._line_cache):
+            self._line_cache.pop(row)
+
+        # The prompt is only ever styled into the first line
+        if row == 0 and len(self._line_cache) > 0:
+            self._line_cache[0] = None
+
+        self._mark_dirty()
+        return self._lines.pop(row)
 
     def _style_and_break_lines(self) -> list[str]:
-        """Styles and breaks self._lines."""
+        """Styles and breaks self._lines.
+
+        Every line is styled & broken on its own, and the result is cached until
+        that line changes. A change in prompt, styles or color system invalidates
+        all lines. Each styled line keeps its `LineWrapper`, so a change in width
+        only re-breaks them.
+
+        When the value style is a `HighlighterStyle`, lines are highlighted using
+        its `highlight_line`, and the state each line ends with is passed on to
+        the next one. A line is re-highlighted when either its content or its
+        starting state changes.
+        """
 
-        document = (
-            self.styles.prompt(self.prompt) + self.styles.value(self.value)
-        ).splitlines()
+        if not self._cache_is_valid():
+            self._line_cache = []
+            self._cached_state = self._get_cache_state()
+
+        cache = self._line_cache
+        difference = len(self._lines) - len(cache)
+
+        if difference > 0:
+            cache.extend([None] * difference)
+
+        elif difference < 0:
+            del cache[difference:]
 
         lines: list[str] = []
-        width = self.width
-        extend = lines.extend
+        width = self._styled_width = self.width
+
+        style_value = self.styles.value
+        highlighter: w_styles.HighlighterStyle | None = None
+
+        if isinstance(style_value.method, w_styles.HighlighterStyle):
+            highlighter = style_value.method
 
-        for line in document:
-            extend(break_line(line.replace("\n", "\\n"), width, fill=" "))
-            extend("")
+        state = None
+
+        for row, line in enumerate(self._lines):
+            cached = cache[row]
+
+            # Edits always create new string objects, so an identity check
+            # is enough to know whether a line has changed.
+            if cached is None or cached[0] is not line or cached[1] != state:
+                start_state = state
+
+                if highlighter is None:
+                    styled = style_value(line)
+                else:
+                    styled, state = highlighter.highlight_line(line, state)
+
+                if row == 0:
+                    styled = self.styles.prompt(self.prompt) + styled
+
+                wrapper = None if styled in ["", "\x1b[0m"] else LineWrapper(styled)
+                cached = cache[row] = (line, start_state, wrapper, state, -1, [""])
+
+            if cached[4] != width:
+                wrapper = cached[2]
+                broken = [""] if wrapper is None else wrapper.wrap(width, fill=" ")
+                cached = cache[row] = (*cached[:4], width, broken)
+
+            state = cached[3]
+            lines.extend(cached[5])
 
         return lines
 
@@ -183,12 +305,12 @@ class InputField(Widget):  # pylint: disable=too-many-instance-attributes
         start = max(0, start)
         self._lines[row] = line[:start] + line[end:]
 
-        self._styled_cache = None
+        self._mark_dirty()
 
         if self._lines[row] == "":
             self.move_cursor((0, -2))
 
-            return self._lines.pop(row)
+            return self._pop_line(row)
 
         if count > 0:
             self.move_cursor((0, -count))
@@ -201,14 +323,14 @@ class InputField(Widget):  # pylint: disable=too-many-instance-attributes
         row, col = self.cursor
 
         if len(self._lines) <= row:
-            self._lines.insert(row, "")
+            self._insert_line(row, "")
 
         line = self._lines[row]
 
         self._lines[row] = line[:col] + text + line[col:]
         self.move_cursor((0, len(text)))
 
-        self._styled_cache = None
+        self._mark_dirty()
 
     def get_word_pos(self, direction: Literal[-1, 1]) -> int:
         """Gets the column offset to the next word in the given direction.
@@ -273,7 +395,7 @@ class InputField(Widget):  # pylint: disable=too-many-instance-attributes
             row, col = cursors[action]
 
             if self.cursor.row + row > len(self._lines):
-                self._lines.append("")
+                self._insert_line(len(self._lines), "")
 
             col += self._selection_length
             if self._selection_length > 0:
@@ -333,16 +455,15 @@ class InputField(Widget):  # pylint: disable=too-many-instance-attributes
                     return False
 
                 if len(self._lines) <= self.cursor.row:
-                    self._lines.append("")
+                    self._insert_line(len(self._lines), "")
 
                 line = self._lines[self.cursor.row]
                 left, right = line[: self.cursor.col], line[self.cursor.col :]
 
                 self._lines[self.cursor.row] = left
-                self._lines.insert(self.cursor.row + 1, right)
+                self._insert_line(self.cursor.row + 1, right)
 
                 self.move_cursor((1, -self.cursor.col))
-                self._styled_cache = None
 
             else:
                 self.insert_text(key)
@@ -360,7 +481,7 @@ class InputField(Widget):  # pylint: disable=too-many-instance-attributes
                 self.delete_back(-self._selection_length)
 
             self._selection_length = 1
-            self._styled_cache = None
+            self._mark_dirty()
 
             return True
 
@@ -461,7 +582,11 @@ class InputField(Widget):  # pylint: disable=too-many-instance-attributes
     def get_lines(self) -> list[str]:
         """Builds the input field's lines."""
 
-        if not self._cache_is_valid() or self._styled_cache is None:
+        if (
+            self._styled_cache is None
+            or self._styled_width != self.width
+            or not self._cache_is_valid()
+        ):
             self._styled_cache = self._style_and_break_lines()
 
         lines = self._styled_cache
@@ -5,16 +5,35 @@ pixel-based data.
 
 from __future__ import annotations
 
+import re
+from typing import Any, Iterator, Tuple
+
 from ..ansi_interface import MouseEvent
+from ..colors import str_to_color
 from ..markup import tim
+from ..quantize import quantize_rgb
 from ..regex import real_length
+from ..term import ColorSystem, get_terminal
 from .base import Widget
 
 __all__ = [
     "PixelMatrix",
     "DensePixelMatrix",
+    "RGBPixelMatrix",
+    "DenseRGBPixelMatrix",
 ]
 
+RGB = Tuple[int, int, int]
+
+# Patterns matching runs of identical cells, keyed by the cell's size in bytes. As
+# every byte matches `.`, consecutive matches always stay aligned to cell boundaries.
+RUN_PATTERNS = {
+    size: re.compile(rb"(.{%d})\1*" % size, flags=re.DOTALL) for size in (1, 2, 3, 6)
+}
+
+PARAMETER_CACHE_SIZE = 2**16
+"""The amount of colors an RGB matrix remembers the SGR parameters of."""
+
 
 class PixelMatrix(Widget):
     """A matrix of pixels.
@@ -215,3 +234,311 @@ class DensePixelMatrix(PixelMatrix):
         self._update_dimensions(lines)
 
         return lines
+
+
+def _get_parameters(key: bytes, system: ColorSystem) -> tuple[str, str]:
+    """Gets the foreground & background SGR parameters of a pixel.
+
+    Args:
+        key: Either 3 bytes of RGB, or a single byte of palette index as returned by
+            `pytermgui.colors.quantize_rgb`.
+        system: The color system the index was quantized to.
+    """
+
+    if len(key) == 1:
+        index = key[0]
+
+        if system is ColorSystem.STANDARD:
+            code = index + 30 if index < 8 else index + 82
+            return str(code), str(code + 10)
+
+        return f"38;5;{index}", f"48;5;{index}"
+
+    params = f"2;{key[0]};{key[1]};{key[2]}"
+    return "38;" + params, "48;" + params
+
+
+class RGBPixelMatrix(Widget):  # pylint: disable=too-many-instance-attributes
+    """A matrix of pixels, backed by a flat buffer of RGB bytes.
+
+    Unlike `PixelMatrix`, which stores a color string for every pixel and parses
+    markup on every build, this widget converts its buffer straight into SGR
+    sequences. Runs of identically colored pixels are merged into a single sequence,
+    and only rows whose data changed since the previous build are re-encoded.
+
+    Whole frames can be given as any object supporting the buffer protocol, e.g. a
+    `bytearray`, an `array.array("B")` or a C-contiguous `numpy.ndarray` of shape
+    `(height, width, 3)` and dtype `uint8`. No copy is made:
+
+    ```python3
+    import numpy as np
+    from pytermgui import RGBPixelMatrix
+
+    frame = np.zeros((100, 200, 3), dtype=np.uint8)
+    matrix = RGBPixelMatrix(200, 100)
+    matrix.set_frame(frame)
+
+    # Later changes to `frame` are picked up on the next `get_lines` call.
+    frame[10:20, :, 0] = 255
+    ```
+
+    Single pixels can be accessed with the same syntax as `PixelMatrix`, using
+    either (red, green, blue) tuples or color strings.
+    """
+
+    pixel = "  "
+    """The characters used to draw a single pixel."""
+
+    def __init__(
+        self, width: int, height: int, default: RGB | str = (0, 0, 0), **attrs: Any
+    ) -> None:
+        """Initializes an RGBPixelMatrix.
+
+        Args:
+            width: The amount of columns the matrix will have.
+            height: The amount of rows the matrix will have.
+            default: The color to fill the matrix with.
+        """
+
+        super().__init__(**attrs)
+
+        self.rows = height
+        self.columns = width
+
+        fill = bytes(self._to_rgb(default))
+        self._buffer = memoryview(bytearray(fill * (width * height)))
+
+        self._row_data: list[bytes | None] = []
+        self._lines: list[str] = []
+        self._parameters: dict[bytes, tuple[str, str]] = {}
+        self._colorsystem = get_terminal().colorsystem
+
+        self.build()
+
+    @staticmethod
+    def _to_rgb(value: RGB | str) -> RGB:
+        """Converts a color string or RGB triplet into an RGB triplet."""
+
+        if isinstance(value, str):
+            rgb = str_to_color(value, localize=False).rgb
+            return int(rgb[0]), int(rgb[1]), int(rgb[2])
+
+        return value
+
+    @property
+    def buffer(self) -> memoryview:
+        """Returns the flat, row-major RGB buffer of this matrix.
+
+        Modifying it in-place is allowed; changes are shown on the next build.
+        """
+
+        return self._buffer
+
+    @property
+    def row_count(self) -> int:
+        """Returns the amount of lines this matrix is displayed as."""
+
+        return self.rows
+
+    def set_frame(self, frame: Any) -> None:
+        """Sets the buffer of this matrix to the given frame, without copying it.
+
+        Args:
+            frame: Any C-contiguous object supporting the buffer protocol, containing
+                `rows * columns` RGB triplets of unsigned bytes.
+
+        Raises:
+            ValueError: The frame is not contiguous, or its size doesn't match the
+                matrix.
+        """
+
+        view = memoryview(frame)
+
+        if not view.c_contiguous or view.itemsize != 1:
+            raise ValueError(
+                "Frames must be C-contiguous buffers of single bytes, got format"
+                + f" {view.format!r} (contiguous: {view.c_contiguous})."
+            )
+
+        view = view.cast("B")
+        expected = self.rows * self.columns * 3
+
+        if view.nbytes != expected:
+            raise ValueError(
+                f"Frame of {view.nbytes} bytes does not fit matrix of"
+                + f" {self.columns}x{self.rows} ({expected} bytes)."
+            )
+
+        self._buffer = view
+
+    def _get_row_data(self, row: int) -> bytes:
+        """Gets the bytes that make up the given line."""
+
+        width = self.columns * 3
+        return self._buffer[row * width : (row + 1) * width].tobytes()
+
+    def _get_parameters(self, key: bytes) -> tuple[str, str]:
+        """Gets the (cached) foreground & background parameters of some RGB bytes."""
+
+        parameters = self._parameters.get(key)
+
+        if parameters is None:
+            # Keep noisy frames from growing the cache forever
+            if len(self._parameters) >= PARAMETER_CACHE_SIZE:
+                self._parameters.clear()
+
+            parameters = _get_parameters(key, self._colorsystem)
+            self._parameters[key] = parameters
+
+        return parameters
+
+    def _iter_runs(self, data: bytes, pixels: int) -> Iterator[tuple[bytes, int]]:
+        """Yields runs of identical cells within some RGB data.
+
+        When the terminal doesn't support true color, the whole row is quantized into
+        palette indices first.
+
+        Args:
+            data: The RGB bytes to look through.
+            pixels: The amount of pixels that make up a single cell.
+
+        Yields:
+            The cell's bytes (either RGB, or palette indices), and the amount of times
+            it is repeated.
+        """
+
+        size = 3 * pixels
+
+        if self._colorsystem is not ColorSystem.TRUE:
+            data = quantize_rgb(data, self._colorsystem)
+            size = pixels
+
+        for run in RUN_PATTERNS[size].finditer(data):
+            start, end = run.span()
+            yield run.group(1), (end - start) // size
+
+    def _encode_row(self, data: bytes) -> str:
+        """Encodes a row of RGB bytes into a terminal-ready line."""
+
+        line = ""
+        pixel = self.pixel
+
+        for cell, count in self._iter_runs(data, 1):
+            _, background = self._get_parameters(cell)
+            line += f"\x1b[{background}m" + pixel * count
+
+        return line + "\x1b[0m"
+
+    def build(self) -> list[str]:
+        """Builds the lines of this matrix, re-encoding only the rows that changed.
+
+        Returns:
+            The lines that this object will return, until a subsequent `build` call.
+        """
+
+        colorsystem = get_terminal().colorsystem
+
+        if colorsystem is not self._colorsystem:
+            self._colorsystem = colorsystem
+            self._parameters.clear()
+            self._row_data = []
+
+        count = self.row_count
+
+        if len(self._row_data) != count:
+            self._row_data = [None] * count
+            self._lines = [""] * count
+
+        for row in range(count):
+            data = self._get_row_data(row)
+
+            if data == self._row_data[row]:
+                continue
+
+            self._row_data[row] = data
+            self._lines[row] = self._encode_row(data)
+
+        self.static_width = self.columns * len(self.pixel)
+        self.height = count
+
+        return self._lines
+
+    def get_lines(self) -> list[str]:
+        """Returns the lines of this matrix, rebuilding the rows that changed."""
+
+        return self.build()
+
+    def __getitem__(self, indices: tuple[int, int]) -> RGB:
+        """Gets the RGB value of a pixel."""
+
+        posy, posx = indices
+        start = (posy * self.columns + posx) * 3
+
+        red, green, blue = self._buffer[start : start + 3]
+        return red, green, blue
+
+    def __setitem__(self, indices: tuple[int, int], value: RGB | str) -> None:
+        """Sets the color of a pixel."""
+
+        posy, posx = indices
+        start = (posy * self.columns + posx) * 3
+
+        self._buffer[start : start + 3] = bytes(self._to_rgb(value))
+
+
+class DenseRGBPixelMatrix(RGBPixelMatrix):
+    """A more dense (2x) RGBPixelMatrix, using half-block characters.
+
+    Every line displays two rows of pixels, the top one as the foreground and
+    the bottom one as the background of an upper half-block.
+    """
+
+    pixel = "▀"
+
+    @property
+    def row_count(self) -> int:
+        """Returns the amount of lines this matrix is displayed as."""
+
+        return (self.rows + 1) // 2
+
+    def _get_row_data(self, row: int) -> bytes:
+        """Interleaves the two pixel rows of a line into (top, bottom) cells."""
+
+        width = self.columns * 3
+        top = self._buffer[2 * row * width : (2 * row + 1) * width]
+
+        # An odd number of rows leaves the last line without a bottom half
+        if 2 * row + 1 >= self.rows:
+            return top.tobytes()
+
+        bottom = self._buffer[(2 * row + 1) * width : (2 * row + 2) * width]
+
+        data = bytearray(width * 2)
+        for i in range(3):
+            data[i::6] = top[i::3]
+            data[i + 3 :: 6] = bottom[i::3]
+
+        return bytes(data)
+
+    def _encode_row(self, data: bytes) -> str:
+        """Encodes a line of interleaved (top, bottom) cells."""
+
+        line = ""
+        pixel = self.pixel
+
+        if len(data) == self.columns * 3:
+            for cell, count in self._iter_runs(data, 1):
+                foreground, _ = self._get_parameters(cell)
+                line += f"\x1b[{foreground};49m" + pixel * count
+
+            return line + "\x1b[0m"
+
+        for cell, count in self._iter_runs(data, 2):
+            half = len(cell) // 2
+
+            foreground, _ = self._get_parameters(cell[:half])
+            _, background = self._get_parameters(cell[half:])
+
+            line += f"\x1b[{foreground};{background}m" + pixel * count
+
+        return line + "\x1b[0m"
@@ -0,0 +1,308 @@
+"""A small, CSS-like selector engine for querying widget trees.
+
+Selectors are made up of compound selectors, joined by combinators:
+
+- `Button`: Instances of the widget type named `Button`, including subclasses.
+- `*`: Any widget.
+- `#my-id`: The widget with the id `my-id`.
+- `.primary`: Widgets that have `primary` in their `classes`.
+- `[parent_align=left]`: Widgets whose attribute matches the value. Besides `=`, the
+    `!=`, `^=` (starts with), `$=` (ends with) and `*=` (contains) operators are
+    supported, and `[attr]` matches any truthy attribute. Enum attributes match
+    either their name (case-insensitively) or their value.
+- `A B`: `B`-s that are descendants of an `A`.
+- `A > B`: `B`-s whose parent is an `A`.
+- `A, B`: Both `A`-s and `B`-s.
+
+For example:
+
+```python3
+manager.query("Window > Container Button.primary")
+container.query("InputField[parent_align=left], #submit")
+```
+
+Containers keep an index of their descendants by type, which is updated as widgets
+are added & removed. Queries use these indices to find the candidates for the last
+part of a selector, and only walk upwards from them to check the rest, so they never
+need to traverse the whole tree.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Iterable
+
+from .base import Widget
+
+__all__ = ["Selector", "parse_selector", "select"]
+
+RE_TOKEN = re.compile(
+    r"""
+    (?P<space>\s*>\s*|\s*,\s*|\s+)
+    | (?P<type>\*|[A-Za-z_][\w]*)
+    | \#(?P<id>[\w\-.:]+)
+    | \.(?P<class>[\w\-]+)
+    | \[\s*(?P<attr>\w+)\s*
+        (?:(?P<op>[\^$*!]?=)\s*(?P<value>"[^"]*"|'[^']*'|[^\]\s]*)\s*)?\]
+    """,
+    re.VERBOSE,
+)
+
+ATTRIBUTE_OPERATORS: dict[str, Callable[[str, str], bool]] = {
+    "=": lambda actual, expected: actual == expected,
+    "!=": lambda actual, expected: actual != expected,
+    "^=": lambda actual, expected: actual.startswith(expected),
+    "$=": lambda actual, expected: actual.endswith(expected),
+    "*=": lambda actual, expected: expected in actual,
+}
+
+
+@dataclass
+class Compound:
+    """A compound selector, e.g. `Button.primary[parent_align=left]`."""
+
+    type_name: str | None = None
+    widget_id: str | None = None
+    classes: list[str] = field(default_factory=list)
+    attributes: list[tuple[str, str | None, str]] = field(default_factory=list)
+
+    def matches(self, widget: Widget) -> bool:
+        """Determines whether the widget matches this compound."""
+
+        if self.type_name is not None and self.type_name not in get_type_names(
+            type(widget)
+        ):
+            return False
+
+        if self.widget_id is not None and widget.id != self.widget_id:
+            return False
+
+        if self.classes and not set(self.classes).issubset(widget.classes):
+            return False
+
+        return all(
+            _match_attribute(widget, name, operator, value)
+            for name, operator, value in self.attributes
+        )
+
+
+@dataclass
+class Selector:
+    """A complex selector, e.g. `Window > Container Button`.
+
+    `parts` holds (combinator, compound) pairs from left to right. The combinator of
+    the first part is always an empty string.
+    """
+
+    parts: list[tuple[str, Compound]]
+
+    def matches(self, widget: Widget) -> bool:
+        """Determines whether the widget matches the selector."""
+
+        return _match_parts(widget, len(self.parts) - 1, self.parts)
+
+
+@lru_cache(maxsize=None)
+def get_type_names(cls: type) -> frozenset[str]:
+    """Returns the names of all the classes a widget type is an instance of."""
+
+    return frozenset(
+        base.__name__ for base in cls.__mro__ if hasattr(base, "get_lines")
+    )
+
+
+def _match_attribute(
+    widget: Widget, name: str, operator: str | None, expected: str
+) -> bool:
+    """Matches the `[name<operator>expected]` attribute selector."""
+
+    value = getattr(widget, name, None)
+
+    if operator is None:
+        return bool(value)
+
+    if isinstance(value, Enum):
+        if expected.lower() == value.name.lower():
+            actual = expected
+        else:
+            actual = str(value.value)
+
+    else:
+        actual = str(value)
+
+    return ATTRIBUTE_OPERATORS[operator](actual, expected)
+
+
+def _match_parts(widget: Widget, index: int, parts: list[tuple[str, Compound]]) -> bool:
+    """Matches the parts of a selector up to `index`, right to left."""
+
+    combinator, compound = parts[index]
+
+    if not compound.matches(widget):
+        return False
+
+    if index == 0:
+        return True
+
+    parent = widget.parent
+
+    if combinator == ">":
+        return parent is not None and _match_parts(parent, index - 1, parts)
+
+    while parent is not None:
+        if _match_parts(parent, index - 1, parts):
+            return True
+
+        parent = parent.parent
+
+    return False
+
+
+def _parse_compound(text: str, tokens: list[re.Match]) -> Compound:
+    """Creates a compound from the tokens that make it up."""
+
+    compound = Compound()
+
+    for token in tokens:
+        kind = token.lastgroup
+
+        if kind == "type":
+            if compound.type_name is not None:
+                raise ValueError(f"Multiple types in compound selector of {text!r}.")
+
+            name = token.group("type")
+            compound.type_name = None if name == "*" else name
+
+        elif kind == "id":
+            compound.widget_id = token.group("id")
+
+        elif kind == "class":
+            compound.classes.append(token.group("class"))
+
+        else:
+            value = token.group("value") or ""
+
+            if value[:1] in "\"'" and len(value) > 1:
+                value = value[1:-1]
+
+            compound.attributes.append((token.group("attr"), token.group("op"), value))
+
+    return compound
+
+
+@lru_cache(maxsize=256)
+def parse_selector(text: str) -> tuple[Selector, ...]:
+    """Parses a selector string.
+
+    Args:
+        text: The selector. See the module documentation for the syntax.
+
+    Returns:
+        A tuple of the comma-separated selectors within the text.
+
+    Raises:
+        ValueError: The selector is invalid.
+    """
+
+    selectors: list[Selector] = []
+    parts: list[tuple[str, Compound]] = []
+    compound: list[re.Match] = []
+    combinator = ""
+    position = 0
+    text = text.strip()
+
+    def _finish_compound() -> None:
+        if len(compound) == 0:
+            raise ValueError(f"Expected a selector at index {position} of {text!r}.")
+
+        parts.append((combinator, _parse_compound(text, compound)))
+        compound.clear()
+
+    while position < len(text):
+        token = RE_TOKEN.match(text, position)
+
+        if token is None:
+            raise ValueError(f"Invalid selector {text!r} at index {position}.")
+
+        position = token.end()
+
+        if token.lastgroup != "space":
+            compound.append(token)
+            continue
+
+        _finish_compound()
+        separator = token.group().strip()
+
+        if separator == ",":
+            selectors.append(Selector(parts))
+            parts = []
+            combinator = ""
+            continue
+
+        combinator = separator or " "
+
+    _finish_compound()
+    selectors.append(Selector(parts))
+
+    return tuple(selectors)
+
+
+def _get_candidates(root: Any, compound: Compound) -> Iterable[Widget]:
+    """Returns the indexed descendants of root that may match the compound."""
+
+    if compound.widget_id is not None:
+        widget = getattr(Widget, "_id_manager").get_widget(compound.widget_id)
+        return [] if widget is None else [widget]
+
+    return root.get_descendants(compound.type_name or "Widget")
+
+
+def _is_within(widget: Widget, root: Widget) -> bool:
+    """Determines whether root is an ancestor of widget."""
+
+    parent = widget.parent
+
+    while parent is not None:
+        if parent is root:
+            return True
+
+        parent = parent.parent
+
+    return False
+
+
+def select(
+    roots: Iterable[Any], selector: str, include_roots: bool = False
+) -> list[Widget]:
+    """Returns all widgets within the roots that match the selector.
+
+    Args:
+        roots: The containers to search in.
+        selector: The selector to match widgets against.
+        include_roots: Whether the roots themselves can be matched.
+
+    Returns:
+        The matching widgets. Each root's widgets are in the order they were added in.
+    """
+
+    selectors = parse_selector(selector)
+    found: dict[Widget, None] = {}
+
+    for root in roots:
+        for item in selectors:
+            compound = item.parts[-1][1]
+
+            if include_roots and item.matches(root):
+                found[root] = None
+
+            for widget in _get_candidates(root, compound):
+                if widget in found or not item.matches(widget):
+                    continue
+
+                if compound.widget_id is None or _is_within(widget, root):
+                    found[widget] = None
+
+    return list(found)
@@ -132,6 +132,28 @@ class HighlighterStyle:
 
         return tim.parse(self.highlighter(item))
 
+    def highlight_line(self, line: str, state: Any = None) -> tuple[str, Any]:
+        """Highlights a single line of a document, carrying state between lines.
+
+        Highlighters that don't support line-by-line highlighting (i.e. ones without
+        a `highlight_line` method) are called on the line on its own.
+
+        Args:
+            line: The line to highlight.
+            state: The state returned for the previous line, or None for the first.
+
+        Returns:
+            The highlighted & parsed line, and the state to pass to the next one.
+        """
+
+        highlight_line = getattr(self.highlighter, "highlight_line", None)
+
+        if highlight_line is None:
+            return tim.parse(self.highlighter(line)), None
+
+        markup, state = highlight_line(line, state)
+        return tim.parse(markup), state
+
 
 # There is only a single ancestor here.
 class StyleManager(UserDict):  # pylint: disable=too-many-ancestors
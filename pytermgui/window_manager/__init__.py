@@ -8,9 +8,13 @@ as possible, and follow a given target framerate.
 
 WindowManager is what ties the two together. It manages its list of Windows, transmits
 and handles mouse input and more.
+
+FrameProfiler collects the timings of every frame the Compositor draws, which can be
+displayed live using `WindowManager.toggle_profiler`, or exported as JSON.
 """
 
 from .compositor import Compositor
 from .layouts import Layout
 from .manager import WindowManager
+from .profiler import FrameProfiler, FrameStats, ProfilerOverlay, WidgetStats
 from .window import Window
@@ -10,8 +10,10 @@ from typing import Iterator, List, Tuple
 
 from ..animations import animator
 from ..enums import WidgetChange
+from ..sgr import SGREncoder
 from ..term import Terminal, get_terminal
 from ..widgets import Widget
+from .profiler import FrameProfiler
 from .window import Window
 
 PositionedLineList = List[Tuple[Tuple[int, int], str]]
@@ -46,6 +48,12 @@ class Compositor:
         self.fps = 0
         self.framerate = framerate
 
+        self.profiler = FrameProfiler()
+        """Collects per-frame timings while running. See `FrameProfiler`."""
+
+        self.encoder: SGREncoder | None = SGREncoder()
+        """Minimizes the style sequences of each frame. Set to `None` to disable."""
+
     @property
     def terminal(self) -> Terminal:
         """Returns the current global terminal."""
@@ -53,21 +61,31 @@ class Compositor:
         return get_terminal()
 
     def _draw_loop(self) -> None:
-        """A loop that draws at regular intervals."""
+        """A loop that draws at regular intervals.
+
+        Frames are also drawn when an animation finishes or turns around, so its
+        final state shows up on time.
+        """
 
         framecount = 0
         last_frame = fps_start_time = time.perf_counter()
 
         while self._is_running:
-            elapsed = time.perf_counter() - last_frame
+            delay = last_frame + self._frametime - time.perf_counter()
 
-            if elapsed < self._frametime:
-                time.sleep(self._frametime - elapsed)
-                continue
+            deadline = animator.next_deadline
+            if deadline is not None:
+                delay = min(delay, deadline - animator.clock())
 
-            animator.step(elapsed)
+            if delay > 0:
+                time.sleep(delay)
+                continue
 
             last_frame = time.perf_counter()
+
+            with self.profiler.phase("animator"):
+                animator.update()
+
             self.draw()
 
             framecount += 1
@@ -241,28 +259,55 @@ class Compositor:
                 previous ones, and everything will be redrawn.
         """
 
+        profiler = self.profiler
+        if profiler.is_running:
+            profiler.begin_frame()
+
         # if self._should_redraw or force:
         lines: PositionedLineList = []
 
         for window in reversed(self._windows):
+            if not profiler.is_running:
+                lines.extend(self._iter_positioned(window))
+                continue
+
+            start = time.perf_counter()
             lines.extend(self._iter_positioned(window))
+            profiler.add_window(window, time.perf_counter() - start)
 
         self._should_redraw = False
 
         # else:
         # lines = self.composite()
 
-        if not force and self._previous == lines:
+        with profiler.phase("diff"):
+            unchanged = not force and self._previous == lines
+
+        if unchanged:
+            profiler.end_frame()
             return
 
-        self.terminal.clear_stream()
-        with self.terminal.frame() as frame:
-            frame_write = frame.write
+        with profiler.phase("write"):
+            self.terminal.clear_stream()
+            with self.terminal.frame() as frame:
+                frame_write = frame.write
+                encoder = self.encoder
+
+                if encoder is None:
+                    for pos, line in lines:
+                        frame_write(f"\x1b[{pos[1]};{pos[0]}H{line}")
+
+                else:
+                    # Other writers may have changed the style since the last frame
+                    encoder.reset()
+
+                    for pos, line in lines:
+                        frame_write(encoder.encode(f"\x1b[{pos[1]};{pos[0]}H{line}"))
 
-            for pos, line in lines:
-                frame_write(f"\x1b[{pos[1]};{pos[0]}H{line}")
+                    frame_write(encoder.flush())
 
         self._previous = lines
+        profiler.end_frame()
 
     def redraw(self) -> None:
         """Force-redraws the buffer."""
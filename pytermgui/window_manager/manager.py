@@ -14,12 +14,13 @@ from ..context_managers import MouseTranslator, alt_buffer, mouse_handler
 from ..enums import Overflow
 from ..input import getch, feed
 from ..regex import real_length
-from ..term import terminal
 from ..widgets import Container, Widget
 from ..widgets.base import BoundCallback
+from ..widgets.selectors import select
 from ..win32console import enable_virtual_processing
 from .compositor import Compositor
 from .layouts import Layout
+from .profiler import FrameProfiler, ProfilerOverlay
 from .window import Window
 
 
@@ -82,11 +83,12 @@ class WindowManager(Widget):  # pylint: disable=too-many-instance-attributes
         self._focus_index = 0
         self._drag_offsets: tuple[int, int] = (0, 0)
         self._drag_target: tuple[Window, Edge] | None = None
+        self._profiler_overlay: ProfilerOverlay | None = None
 
         # This isn't quite implemented at the moment.
         self.restrict_within_bounds = True
 
-        terminal.subscribe(terminal.RESIZE, self.on_resize)
+        self.terminal.subscribe(self.terminal.RESIZE, self.on_resize)
 
     def __iadd__(self, other: object) -> WindowManager:
         """Adds a window to the manager."""
@@ -127,6 +129,12 @@ class WindowManager(Widget):  # pylint: disable=too-many-instance-attributes
 
         return iter(self._windows)
 
+    @property
+    def profiler(self) -> FrameProfiler:
+        """Returns the profiler of this manager's compositor."""
+
+        return self.compositor.profiler
+
     def _run_input_loop(self) -> None:
         """The main input loop of the WindowManager."""
 
@@ -324,6 +332,20 @@ class WindowManager(Widget):  # pylint: disable=too-many-instance-attributes
 
         return window
 
+    def query(self, selector: str) -> list[Widget]:
+        """Returns all windows & widgets within them that match a selector.
+
+        See `pytermgui.widgets.selectors` for the selector syntax.
+
+        Args:
+            selector: A CSS-like selector, e.g. `Window > Container Button.primary`.
+
+        Returns:
+            The matching widgets, in the order of the windows they are in.
+        """
+
+        return select(self._windows, selector, include_roots=True)
+
     def handle_key(self, key: str) -> bool:
         """Processes a keypress.
 
@@ -358,6 +380,7 @@ class WindowManager(Widget):  # pylint: disable=too-many-instance-attributes
         """
 
         window: Window
+        terminal = self.terminal
 
         def _clamp_pos(pos: tuple[int, int], index: int) -> int:
             """Clamp a value using index to address x/y & width/height"""
@@ -565,6 +588,42 @@ class WindowManager(Widget):  # pylint: disable=too-many-instance-attributes
 
         getch()
 
+    def toggle_profiler(self, widgets: bool = True) -> bool:
+        """Toggles the profiler, and a window displaying its statistics live.
+
+        Args:
+            widgets: Whether the render time of each widget class should be tracked.
+
+        Returns:
+            Whether the profiler is now running.
+        """
+
+        overlay = self._profiler_overlay
+
+        if overlay is not None:
+            self._profiler_overlay = None
+            self.profiler.stop()
+
+            if overlay in self._windows:
+                self.remove(overlay, autostop=False, animate=False)
+
+            return False
+
+        self.profiler.reset()
+        self.profiler.start(widgets=widgets)
+
+        overlay = self._profiler_overlay = ProfilerOverlay(self.profiler)
+        overlay.pos = (self.terminal.width - overlay.width + 1, 1)
+
+        # The overlay shouldn't steal focus from the window being profiled
+        focused = self.focused
+        self.add(overlay, assign=False, animate=False)
+
+        if focused is not None:
+            self.focus(focused)
+
+        return True
+
     def alert(self, *items: Any, center: bool = True, **attributes: Any) -> Window:
         """Creates a modal popup of the given elements and attributes.
 
@@ -0,0 +1,392 @@
+"""The FrameProfiler class, which instruments the Compositor's frames.
+
+Every frame is broken down into the following phases:
+
+- `animator`: Stepping `pytermgui.animations.animator`.
+- `windows`: Calling `get_lines` on every window, also tracked per window.
+- `diff`: Comparing the new frame to the previous one.
+- `write`: Writing the frame to the terminal.
+
+Optionally, the `get_lines` method of every widget class can be instrumented as well,
+which tracks the cumulative render time of each widget type. This patches the
+classes while the profiler is running, so it costs nothing when disabled.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from functools import wraps
+from typing import IO, Any, Callable, Deque, Iterator
+
+from ..regex import strip_markup
+from ..widgets import Label, Widget
+from .window import Window
+
+PHASES = ("animator", "windows", "diff", "write")
+
+# The profiler whose wrappers are installed, not a constant. Only one may patch the
+# widget classes at a time, as their wrappers would otherwise nest.
+_active: FrameProfiler | None = None  # pylint: disable=invalid-name
+
+
+@dataclass
+class FrameStats:
+    """The timings of a single frame, in seconds."""
+
+    phases: dict[str, float] = field(default_factory=lambda: dict.fromkeys(PHASES, 0.0))
+    windows: dict[str, float] = field(default_factory=dict)
+    total: float = 0.0
+
+
+@dataclass
+class WidgetStats:
+    """The cumulative render timings of a widget class, in seconds.
+
+    `total` includes the time spent rendering children, `own` does not.
+    """
+
+    calls: int = 0
+    total: float = 0.0
+    own: float = 0.0
+
+
+def _get_window_name(window: Window) -> str:
+    """Returns the name a window's timings are stored under."""
+
+    if window.id is not None:
+        return window.id
+
+    title = strip_markup(window.title).strip()
+
+    return title or f"{type(window).__name__}@{id(window):x}"
+
+
+def _iter_subclasses(cls: type) -> Iterator[type]:
+    """Yields every subclass of `cls`, recursively."""
+
+    subclass: type
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _iter_subclasses(subclass)
+
+
+class FrameProfiler:
+    """Collects per-frame & per-widget timings of a `Compositor`.
+
+    Usage:
+
+    ```python3
+    manager = WindowManager()
+    profiler = manager.compositor.profiler
+
+    profiler.start(widgets=True)
+    ...
+    profiler.save_json("frames.json")
+    ```
+    """
+
+    def __init__(self, history: int = 120) -> None:
+        """Initializes the profiler.
+
+        Args:
+            history: The number of most recent frames to keep.
+        """
+
+        self.is_running = False
+        self.frames: Deque[FrameStats] = deque(maxlen=history)
+        self.widgets: dict[str, WidgetStats] = {}
+
+        self._current: FrameStats | None = None
+        self._frame_start = 0.0
+        self._patched: dict[type, Callable[..., list[str]]] = {}
+        self._widget_stack: list[list[Any]] = []
+
+    @property
+    def last_frame(self) -> FrameStats | None:
+        """Returns the most recently completed frame, if there is one."""
+
+        if len(self.frames) == 0:
+            return None
+
+        return self.frames[-1]
+
+    def begin_frame(self) -> FrameStats:
+        """Returns the frame being recorded, starting a new one if needed."""
+
+        if self._current is None:
+            self._current = FrameStats()
+            self._frame_start = time.perf_counter()
+
+        return self._current
+
+    def _patch_widgets(self) -> None:
+        """Wraps the `get_lines` of every widget class to track render times."""
+
+        global _active  # pylint: disable=global-statement
+
+        if _active is not None and _active is not self:
+            raise RuntimeError("Another profiler is already instrumenting widgets.")
+
+        _active = self
+
+        for cls in (Widget, *_iter_subclasses(Widget)):
+            method = cls.__dict__.get("get_lines")
+
+            if method is None or cls in self._patched:
+                continue
+
+            self._patched[cls] = method
+            setattr(cls, "get_lines", self._wrap_get_lines(method))
+
+    def _unpatch_widgets(self) -> None:
+        """Restores the original `get_lines` of every instrumented class."""
+
+        global _active  # pylint: disable=global-statement
+
+        for cls, method in self._patched.items():
+            setattr(cls, "get_lines", method)
+
+        self._patched.clear()
+        self._widget_stack.clear()
+
+        if _active is self:
+            _active = None
+
+    def _wrap_get_lines(
+        self, method: Callable[..., list[str]]
+    ) -> Callable[..., list[str]]:
+        """Returns a version of the method that records its timings."""
+
+        stack = self._widget_stack
+
+        @wraps(method)
+        def _get_lines(widget: Widget, *args: Any, **kwargs: Any) -> list[str]:
+            # Calls to `super().get_lines` are part of the outer call's timing
+            if len(stack) > 0 and stack[-1][0] is widget:
+                return method(widget, *args, **kwargs)
+
+            # The widget, and the time spent rendering its children
+            frame: list[Any] = [widget, 0.0]
+            stack.append(frame)
+
+            start = time.perf_counter()
+            try:
+                return method(widget, *args, **kwargs)
+
+            finally:
+                elapsed = time.perf_counter() - start
+                stack.pop()
+
+                if len(stack) > 0:
+                    stack[-1][1] += elapsed
+
+                name = type(widget).__name__
+                stats = self.widgets.get(name)
+
+                if stats is None:
+                    stats = self.widgets[name] = WidgetStats()
+
+                stats.calls += 1
+                stats.total += elapsed
+                stats.own += elapsed - frame[1]
+
+        return _get_lines
+
+    def start(self, widgets: bool = False) -> None:
+        """Starts recording frames.
+
+        Args:
+            widgets: Whether the render time of each widget class should be tracked.
+                Only one profiler can track widgets at a time.
+        """
+
+        if widgets:
+            self._patch_widgets()
+
+        self.is_running = True
+
+    def stop(self) -> None:
+        """Stops recording, and removes any widget instrumentation."""
+
+        self.is_running = False
+        self._current = None
+        self._unpatch_widgets()
+
+    def reset(self) -> None:
+        """Clears all recorded statistics."""
+
+        self.frames.clear()
+        self.widgets.clear()
+        self._current = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Times the code within the context as one of `PHASES`."""
+
+        if not self.is_running:
+            yield
+            return
+
+        current = self.begin_frame()
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            current.phases[name] += time.perf_counter() - start
+
+    def add_window(self, window: Window, elapsed: float) -> None:
+        """Adds the time it took to get the lines of a window to the current frame."""
+
+        current = self.begin_frame()
+        name = _get_window_name(window)
+
+        current.windows[name] = current.windows.get(name, 0.0) + elapsed
+        current.phases["windows"] += elapsed
+
+    def end_frame(self) -> None:
+        """Finishes the current frame, and adds it to the history."""
+
+        if not self.is_running or self._current is None:
+            return
+
+        self._current.total = time.perf_counter() - self._frame_start
+        self.frames.append(self._current)
+        self._current = None
+
+    def get_averages(self) -> FrameStats:
+        """Returns the average timings of all frames in the history."""
+
+        averages = FrameStats()
+        count = len(self.frames)
+
+        if count == 0:
+            return averages
+
+        for frame in list(self.frames):
+            averages.total += frame.total / count
+
+            for name, elapsed in frame.phases.items():
+                averages.phases[name] += elapsed / count
+
+            windows = averages.windows
+            for name, elapsed in frame.windows.items():
+                windows[name] = windows.get(name, 0.0) + elapsed / count
+
+        return averages
+
+    def as_dict(self) -> dict[str, Any]:
+        """Returns all statistics as a JSON-serializable dictionary."""
+
+        last_frame = self.last_frame
+
+        return {
+            "frames": len(self.frames),
+            "average": asdict(self.get_averages()),
+            "last_frame": None if last_frame is None else asdict(last_frame),
+            "widgets": {
+                name: asdict(stats)
+                for name, stats in sorted(
+                    self.widgets.items(), key=lambda item: -item[1].own
+                )
+            },
+        }
+
+    def save_json(self, file: str | IO[str]) -> None:
+        """Writes the result of `as_dict` into the given file, or path."""
+
+        if isinstance(file, str):
+            with open(file, "w", encoding="utf-8") as output:
+                json.dump(self.as_dict(), output, indent=4)
+
+            return
+
+        json.dump(self.as_dict(), file, indent=4)
+
+
+class ProfilerOverlay(Window):
+    """A window displaying the live statistics of a `FrameProfiler`.
+
+    Its content is updated every time it is drawn.
+    """
+
+    is_noblur = True
+    is_persistent = True
+    is_noresize = True
+
+    def __init__(self, profiler: FrameProfiler, max_items: int = 5, **attrs) -> None:
+        """Initializes the overlay.
+
+        Args:
+            profiler: The profiler whose statistics are displayed.
+            max_items: The maximum number of windows & widget classes to display.
+        """
+
+        self.profiler = profiler
+        self.max_items = max_items
+        self._labels: list[Label] = []
+
+        super().__init__(**{"title": "Profiler", "width": 44, **attrs})
+
+    def _get_rows(self) -> list[str]:
+        """Returns the markup of each line displayed."""
+
+        averages = self.profiler.get_averages()
+        total = averages.total
+
+        def _row(name: str, elapsed: float) -> str:
+            label = name[:18].replace("[", r"\[")
+            percent = elapsed / total * 100 if total > 0 else 0.0
+
+            return f"{label:<18}[/dim] {elapsed * 1000:>8.3f}ms {percent:>5.1f}%"
+
+        rows = [f"[bold]{'frame':<18} {total * 1000:>8.3f}ms"]
+        rows.extend(f"[dim]{_row(name, averages.phases[name])}" for name in PHASES)
+
+        windows = sorted(averages.windows.items(), key=lambda item: -item[1])
+        rows.extend(
+            f"[dim]{_row('  ' + name, value)}"
+            for name, value in windows[: self.max_items]
+        )
+
+        if len(self.profiler.widgets) > 0:
+            count = max(len(self.profiler.frames), 1)
+            rows.append("")
+            rows.append("[bold]widgets (own time / frame)")
+
+            widgets = sorted(
+                self.profiler.widgets.items(), key=lambda item: -item[1].own
+            )
+            rows.extend(
+                f"[dim]{_row(name, stats.own / count)}"
+                for name, stats in widgets[: self.max_items]
+            )
+
+        return rows
+
+    def get_lines(self) -> list[str]:
+        """Updates the displayed statistics, and returns the window's lines."""
+
+        rows = self._get_rows()
+        labels = self._labels
+
+        # Labels are only created or dropped when the number of rows changes
+        if len(labels) != len(rows):
+            del labels[len(rows) :]
+            labels.extend(Label(parent_align=0) for _ in range(len(rows) - len(labels)))
+
+            self.set_widgets([])
+            for label in labels:
+                self._add_widget(label, run_get_lines=False)
+
+        for label, row in zip(labels, rows):
+            label.value = row
+
+        # Overflow is hidden, so the height has to follow the content's
+        self.height = len(rows) + 2
+
+        return super().get_lines()
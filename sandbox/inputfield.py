@@ -124,9 +124,11 @@ def main(argv: list[str] | None = None, tim: ptg.MarkupLanguage = ptg.tim) -> No
         print("Please provide either a file or a string to edit.")
         return
 
-    field = ptg.InputField(content, multiline=True)
-    if args.highlight:
-        field.styles.value = lambda _, text: ptg.tim.parse(ptg.highlight_python(text))
+    field = ptg.InputField(
+        content,
+        multiline=True,
+        highlighter=ptg.highlight_python if args.highlight else None,
+    )
 
     tim.define("!cursor", get_watcher(field.cursor, "row", "col"))
     tim.define("!select_len", get_watcher(field, ("select_len", "_selection_length")))
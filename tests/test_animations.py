@@ -1,7 +1,16 @@
+from dataclasses import dataclass
+
 import pytest
 
 import pytermgui as ptg
-from pytermgui.animations import Animation, Direction, _remove_flag
+from pytermgui.animations import (
+    Animation,
+    Animator,
+    Direction,
+    FloatAnimation,
+    _remove_flag,
+    ease_in,
+)
 
 
 class MyTarget:
@@ -9,7 +18,7 @@ class MyTarget:
 
 
 def _reset():
-    ptg.animator._animations = []
+    ptg.animator.clear()
 
 
 def test_flags():
@@ -104,6 +113,8 @@ def test_animation_finishes_on_step():
     ptg.animator.animate_attr(
         target=MyTarget(),
         attr="test_attr",
+        start=0,
+        end=10,
         duration=1000,
         loop=True,
         on_step=_on_step,
@@ -112,3 +123,112 @@ def test_animation_finishes_on_step():
 
     ptg.animator.step(1)
     assert not ptg.animator.is_active
+
+
+def test_easing_and_keyframes():
+    _reset()
+
+    target = MyTarget()
+    eased = ptg.animator.animate_float(duration=1000, easing="ease_in")
+    backward = ptg.animator.animate_attr(
+        target=target, attr="test_attr", start=100, end=0, duration=1000, easing=ease_in
+    )
+    frames = ptg.animator.animate_attr(
+        target=MyTarget(),
+        attr="test_attr",
+        keyframes=[(1.0, 30), (0.0, 10), (0.5, 50)],
+        duration=1000,
+    )
+
+    ptg.animator.step(0.25)
+    assert frames.target.test_attr == 30
+
+    ptg.animator.step(0.25)
+    assert eased.state == ease_in(0.5)
+    assert target.test_attr == int(100 - 100 * ease_in(0.5))
+    assert frames.target.test_attr == 50
+
+    ptg.animator.step(0.5)
+    assert (target.test_attr, frames.target.test_attr) == (0, 30)
+    assert not ptg.animator.is_active
+
+    with pytest.raises(ValueError):
+        ptg.animator.animate_float(duration=100, easing="bounce")
+
+
+def test_animation_subclass():
+    _reset()
+
+    @dataclass
+    class Counter(Animation):
+        steps: int
+
+        def step(self, elapsed: float) -> bool:
+            self.steps += 1
+            return super().step(elapsed)
+
+    counter = Counter(100, Direction.FORWARD, False, None, None, 0, 0, steps=0)
+    ptg.animator.schedule(counter)
+
+    ptg.animator.step(0.05)
+    assert (counter.state, counter.steps) == (0.5, 1)
+
+    ptg.animator.step(0.05)
+    assert not ptg.animator.is_active
+
+
+def test_animator_batch():
+    _reset()
+
+    class Counted(FloatAnimation):
+        def step(self, elapsed: float) -> bool:
+            self.steps = getattr(self, "steps", 0) + 1
+            return super().step(elapsed)
+
+    finished = []
+    for i in range(20):
+        ptg.animator.animate_float(duration=100 * (i % 5), on_finish=finished.append)
+
+    custom = Counted(duration=350)
+    ptg.animator.schedule(custom)
+
+    for _ in range(3):
+        ptg.animator.step(0.1)
+        assert ptg.animator.last_step_time > 0
+
+    assert len(finished) == 16
+    assert all(anim.duration < 400 and anim.state == 1.0 for anim in finished)
+    assert custom in ptg.animator and custom.steps == 3
+
+    ptg.animator.step(0.1)
+    assert not ptg.animator.is_active
+    assert len(finished) == 20
+
+
+def test_animator_clock():
+    now = 10.0
+    engine = Animator(clock=lambda: now)
+
+    animation = engine.animate_float(duration=1000, loop=True)
+    assert engine.next_deadline == 10.0
+
+    engine.update()
+    assert animation.state == 0.0
+    assert engine.next_deadline == 11.0
+
+    now = 10.4
+    engine.update()
+    assert animation.state == pytest.approx(0.4)
+
+    # Time past the end carries over into the next loop
+    engine.update(11.25)
+    assert animation.direction is Direction.BACKWARD
+    assert engine.next_deadline == pytest.approx(12.0)
+
+    for now in (11.5, 11.75):
+        engine.update()
+
+    assert animation.state == pytest.approx(0.25)
+
+    animation.pause()
+    assert engine.next_deadline is None
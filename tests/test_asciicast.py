@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import io
+import json
+
+from pytermgui.asciicast import AsciicastReader, AsciicastRecorder
+from pytermgui.emulator import ScreenEmulator
+from pytermgui.term import Recorder, Terminal
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _read_events(file: io.StringIO) -> list[list]:
+    return [json.loads(line) for line in file.getvalue().splitlines()[1:]]
+
+
+def test_asciicast_stream():
+    clock = FakeClock()
+    file = io.StringIO()
+
+    recorder = AsciicastRecorder(file, (80, 24), title="Test", clock=clock)
+    header = json.loads(file.getvalue().splitlines()[0])
+
+    assert header["version"] == 2
+    assert (header["width"], header["height"], header["title"]) == (80, 24, "Test")
+
+    recorder.write("Hello")
+    clock.now = 0.5
+    recorder.write("\x1b[2JThere")
+    recorder.close()
+
+    assert _read_events(file) == [
+        [0.0, "o", "Hello"],
+        [0.5, "o", "\x1b[2JThere"],
+    ]
+
+
+def test_asciicast_coalesce():
+    clock = FakeClock()
+    file = io.StringIO()
+
+    recorder = AsciicastRecorder(file, (80, 24), fps=10, clock=clock)
+
+    recorder.write("first")
+
+    for i in range(5):
+        clock.now += 0.01
+        recorder.write(f"\x1b[2J\x1b[Hframe {i}")
+
+    # Mode changes must never be dropped
+    clock.now += 0.01
+    recorder.write("\x1b[?25l")
+    clock.now += 0.01
+    recorder.write("\x1b[2J\x1b[Hlast")
+
+    clock.now = 1.0
+    recorder.write("late")
+    recorder.close()
+
+    assert _read_events(file) == [
+        [0.0, "o", "first"],
+        [0.07, "o", "\x1b[2J\x1b[Hframe 4\x1b[?25l\x1b[2J\x1b[Hlast"],
+        [1.0, "o", "late"],
+    ]
+
+
+def _coalesce(*writes: str) -> str:
+    clock = FakeClock()
+    file = io.StringIO()
+
+    with AsciicastRecorder(file, (80, 24), fps=10, clock=clock) as recorder:
+        recorder.write("first")
+
+        for data in writes:
+            clock.now += 0.01
+            recorder.write(data)
+
+    return _read_events(file)[-1][2]
+
+
+def test_asciicast_coalesce_keeps_state():
+    # The cursor position at the clear is unknown, so nothing can be dropped
+    assert _coalesce("\x1b[1;31m", "\x1b[3;3H", "x\x1b[2J", "hello") == (
+        "\x1b[1;31m\x1b[3;3Hx\x1b[2Jhello"
+    )
+
+    assert _coalesce("\x1b[1m", "\x1b[0;32m", "x\x1b[3;3H", "\x1b[2J", "hello") == (
+        "\x1b[0;32m\x1b[3;3H\x1b[2Jhello"
+    )
+    assert _coalesce("\x1b[1m", "x", "\x1b[2J\x1b[4m\x1b[H", "hello") == (
+        "\x1b[1m\x1b[2J\x1b[4m\x1b[Hhello"
+    )
+
+
+def test_asciicast_seek(tmp_path):
+    clock = FakeClock()
+    path = tmp_path / "session.cast.gz"
+
+    writes = []
+
+    # Nothing is cleared, so the screen at each point depends on every write before
+    for i in range(10):
+        if i % 3 == 0:
+            writes.append(f"\x1b[{i + 1};2H\x1b[1;3{i % 8}mscreen {i}")
+        else:
+            writes.append(f" update {i}\x1b[?25l\x1b[{i};{i}H\x1b[0;4m")
+
+    with AsciicastRecorder(path, (20, 12), keyframe_interval=1, clock=clock) as rec:
+        for i, data in enumerate(writes):
+            clock.now = i * 0.5
+            rec.write(data)
+
+    with open(path, "rb") as file:
+        assert file.read(2) == b"\x1f\x8b"
+
+    reader = AsciicastReader(path)
+
+    assert reader.size == (20, 12)
+    assert [time for time, _ in reader.keyframes] == [1.0, 2.0, 3.0, 4.0]
+    assert [data for _, data in reader.events()] == writes
+
+    events = list(reader.events(start=3.7))
+    assert [time for time, _ in events] == [3.0, 3.0, 3.5, 4.0, 4.5]
+
+    # Replaying from the snapshot recreates the screen, cursor & style
+    full, seeked = ScreenEmulator((20, 12)), ScreenEmulator((20, 12))
+
+    for screen, data in ((full, "".join(writes)), (seeked, "\x1b[31mx\x1b[H")):
+        screen.write(data)
+
+    for _, data in events:
+        seeked.write(data)
+
+    for screen in (full, seeked):
+        screen.write("styled")
+
+    assert full.cells == seeked.cells
+    assert (full.cursor, full.cursor_visible) == (seeked.cursor, seeked.cursor_visible)
+
+
+def test_terminal_record_replay(tmp_path, monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda _: None)
+
+    path = tmp_path / "session.cast"
+    terminal = Terminal(io.StringIO(), size=(20, 5))
+
+    with terminal.record(path) as recorder:
+        assert isinstance(recorder, AsciicastRecorder)
+        terminal.write("Hello")
+        terminal.write(" there")
+
+    with terminal.record() as memory:
+        assert isinstance(memory, Recorder)
+
+    output = io.StringIO()
+    Terminal(output, size=(20, 5)).replay(path)
+
+    assert output.getvalue() == "Hello there"
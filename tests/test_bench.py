@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from pytermgui import bench
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(bench, "BENCHMARKS", {})
+    monkeypatch.setattr(bench, "MIN_ROUND_TIME", 0.001)
+    monkeypatch.setattr(bench, "ROUNDS", 1)
+
+    return bench.BENCHMARKS
+
+
+def test_bench_run(registry):
+    calls = []
+
+    @bench.benchmark("test: appending")
+    def _bench_append():
+        calls.append("setup")
+        data = []
+
+        return lambda: data.append(bytearray(1024))
+
+    @bench.benchmark("test: other")
+    def _bench_other():
+        calls.append("other")
+
+        return lambda: None
+
+    assert list(registry) == ["test: appending", "test: other"]
+
+    results = bench.run_benchmarks("APPEND")
+
+    assert calls == ["setup"]
+    assert [result.name for result in results] == ["test: appending"]
+    assert results[0].ops_per_sec > 0
+    assert results[0].retained_memory >= 1024
+    assert results[0].peak_memory >= results[0].retained_memory
+
+
+def test_bench_baseline(registry, tmp_path):
+    path = tmp_path / "baseline.json"
+
+    fast = bench.BenchmarkResult("fast", 100.0, 10, 0)
+    slow = bench.BenchmarkResult("slow", 10.0, 10, 0)
+    bench.save_results([fast, slow], path)
+    bench.save_results([bench.BenchmarkResult("slow", 20.0, 10, 0)], path)
+
+    data = json.loads(path.read_text())
+    assert data["results"]["fast"]["ops_per_sec"] == 100.0
+    assert data["results"]["slow"]["ops_per_sec"] == 20.0
+
+    new = bench.BenchmarkResult("new", 1.0, 10, 0)
+    changes = bench.compare_results([fast, slow, new], path)
+
+    assert changes == {"fast": 0.0, "slow": -0.5, "new": None}
+
+    @bench.benchmark("slow")
+    def _bench_slow():
+        return lambda: sum(range(100_000))
+
+    bench.save_results([bench.BenchmarkResult("slow", 1e12, 0, 0)], path)
+
+    assert not bench.main("slow", compare=str(path))
@@ -1,14 +1,18 @@
+import random
 from contextlib import contextmanager
 
 from pytermgui import (
+    COLOR_TABLE,
     ColorSystem,
     HEXColor,
     IndexedColor,
     RGBColor,
     StandardColor,
+    quantize_rgb,
     str_to_color,
     terminal,
 )
+from pytermgui.quantize import _get_color_difference
 
 terminal.forced_colorsystem = ColorSystem.TRUE
 
@@ -111,3 +115,37 @@ def test_bg_hex():
     assert color.name == "#abcdef"
     assert color.sequence == "\x1b[38;2;171;205;239m"
     assert color.sequence == "\x1b[38;2;171;205;239m"
+
+
+def _get_closest(rgb):
+    return min(range(16), key=lambda i: _get_color_difference(rgb, COLOR_TABLE[i]))
+
+
+def test_quantize_rgb():
+    colors = [(0, 0, 0), (255, 0, 0), (95, 135, 175), (255, 255, 255)]
+    data = bytes(component for rgb in colors for component in rgb)
+
+    assert quantize_rgb(colors, ColorSystem.EIGHT_BIT) == bytes([16, 196, 109, 231])
+    assert quantize_rgb(data, ColorSystem.EIGHT_BIT) == bytes([16, 196, 109, 231])
+
+    standard = list(COLOR_TABLE[:16])
+    assert quantize_rgb(standard, ColorSystem.STANDARD) == bytes(range(16))
+
+    with set_colorsystem(terminal, ColorSystem.EIGHT_BIT):
+        assert IndexedColor.from_rgb((95, 135, 175)).value == "109"
+
+    rand = random.Random(0)
+    for _ in range(500):
+        rgb = (rand.uniform(0, 255), rand.randint(0, 255), rand.randint(0, 255))
+        closest = _get_closest(rgb)
+        code = closest + (82 if closest > 7 else 30)
+
+        assert StandardColor.from_rgb(rgb).value == str(code)
+
+        rounded = (round(rgb[0]), rgb[1], rgb[2])
+        assert quantize_rgb([rgb], ColorSystem.STANDARD)[0] == _get_closest(rounded)
+
+    with set_colorsystem(terminal, ColorSystem.EIGHT_BIT):
+        for rgb in [(254.6, 0.4, 127.5), (94.5, 135.49, 175.5)]:
+            index = quantize_rgb([rgb], ColorSystem.EIGHT_BIT)[0]
+            assert IndexedColor.from_rgb(rgb).value == str(index)
@@ -0,0 +1,29 @@
+import pytermgui as ptg
+
+
+def test_splitter_render_cache():
+    splitter = ptg.Splitter(
+        ptg.Label("[bold]Hello", parent_align=0),
+        ptg.Label("A label that needs to be broken into lines", parent_align=1),
+        ptg.Splitter("one", "[141]two", "three"),
+        width=60,
+    )
+
+    first = splitter.get_lines()
+    assert splitter.get_lines() == first
+    assert all(ptg.real_length(line) == 60 for line in first)
+
+    splitter.styles.fill = "@141"
+    styled = splitter.get_lines()
+
+    assert styled != first
+    assert splitter.styles.fill(" ") in styled[0]
+
+    calls = []
+    splitter.styles.fill = lambda _, item: calls.append(item) or item
+
+    first = splitter.get_lines()
+    calls.clear()
+
+    assert splitter.get_lines() == first
+    assert calls == [" "]
@@ -0,0 +1,24 @@
+from pytermgui import MarkupLanguage, Palette, palette
+from pytermgui.default_tables import DEFAULT_ALIAS_TABLE, DEFAULT_PALETTE_TABLE
+from pytermgui.markup.aliases import DEFAULT_ALIASES
+from pytermgui.palettes import DEFAULT_PRIMARY
+
+
+def test_alias_table_is_current():
+    lang = MarkupLanguage(default_aliases=False)
+    lang.alias_multiple(**DEFAULT_ALIASES)
+
+    # If this fails, run `python3 utils/generate_tables.py`
+    assert lang.aliases == DEFAULT_ALIAS_TABLE
+    assert MarkupLanguage().aliases == DEFAULT_ALIAS_TABLE
+
+
+def test_palette_table_is_current():
+    # If this fails, run `python3 utils/generate_tables.py`
+    assert Palette(primary=DEFAULT_PRIMARY).data == DEFAULT_PALETTE_TABLE
+
+    loaded = Palette.from_data(DEFAULT_PALETTE_TABLE)
+
+    assert loaded.data == DEFAULT_PALETTE_TABLE
+    assert loaded.data is not DEFAULT_PALETTE_TABLE
+    assert loaded.base_keys() == palette.base_keys()
@@ -0,0 +1,112 @@
+import pytermgui as ptg
+from pytermgui.window_manager.compositor import Compositor
+
+
+def test_emulator_text():
+    screen = ptg.ScreenEmulator((5, 3))
+
+    screen.write("abcdefgh\r\nij\tk")
+    assert screen.get_lines() == ["abcde", "fgh", "ij  k"]
+    assert screen.cursor == (4, 2)
+
+    # Writing past the last line scrolls the screen
+    screen.write("\nlm")
+    assert screen.get_lines() == ["fgh", "ij  k", "lm"]
+
+    screen.write("\x1b[1;1H界x")
+    assert screen.cell(0, 0) == ptg.Cell("界")
+    assert screen.cell(1, 0).char == ""
+    assert screen.get_lines()[0] == "界x"
+
+
+def test_emulator_sequences():
+    screen = ptg.ScreenEmulator((10, 4))
+
+    screen.write("\x1b[2;3H\x1b[38;5;141;1mab\x1b[22;48;2;1;2;3mc")
+    assert screen.cell(2, 1) == ptg.Cell("a", "1;38;5;141")
+    assert screen.cell(4, 1) == ptg.Cell("c", "38;5;141;48;2;1;2;3")
+
+    screen.write("\x1b[0m\x1b[A\x1b[2Dd\x1b[6Ge")
+    assert screen.get_lines()[0] == "   d e"
+
+    # Sequences split between writes are still understood
+    screen.write("\x1b[3")
+    screen.write("1mf\x1b[0m")
+    assert screen.cell(6, 0) == ptg.Cell("f", "31")
+
+    screen.write("\x1b[1;5H\x1b[K\x1b[2;6H\x1b[1K\x1b[3;1H\x1b[J")
+    assert screen.get_lines() == ["   d", "", "", ""]
+
+    screen.write("\x1b[?25l\x1b[?1049h")
+    assert not screen.cursor_visible
+    assert screen.alt_buffer and screen.get_lines() == [""] * 4
+
+    screen.write("\x1b[?1049l")
+    assert screen.get_lines()[0] == "   d"
+
+    screen.write("\x1b[2J")
+    assert str(screen) == "\n\n\n"
+
+
+def test_emulator_sgr_sub_parameters():
+    screen = ptg.ScreenEmulator((10, 2))
+
+    screen.write("\x1b[1;38:2::1:2:3ma\x1b[48:5:4;4:3mb\x1b[4:0;58;5;9mc")
+    assert screen.cell(0, 0) == ptg.Cell("a", "1;38;2;1;2;3")
+    assert screen.cell(1, 0) == ptg.Cell("b", "1;4;38;2;1;2;3;48;5;4")
+    assert screen.cell(2, 0) == ptg.Cell("c", "1;38;2;1;2;3;48;5;4")
+
+    screen.write("\x1b[0;38:2:4:5:6md")
+    assert screen.cell(3, 0) == ptg.Cell("d", "38;2;4;5;6")
+
+
+def test_emulator_erase():
+    screen = ptg.ScreenEmulator((4, 2))
+
+    screen.write("ab\r\ncd\x1b[3J")
+    assert screen.get_lines() == ["ab", "cd"]
+
+    # Erased cells keep the current background
+    screen.write("\x1b[1;41m\x1b[1;2H\x1b[K\x1b[0m")
+    assert screen.cells[0] == [ptg.Cell("a")] + [ptg.Cell(" ", "41")] * 3
+
+    screen.write("\x1b[48;5;2m\x1b[2J")
+    assert screen.cell(0, 1) == ptg.Cell(" ", "48;5;2")
+
+
+def test_emulator_terminal():
+    screen = ptg.ScreenEmulator((24, 6))
+    terminal = ptg.Terminal(screen, size=screen.size)
+    previous = ptg.get_terminal()
+    terminal.forced_colorsystem = previous.colorsystem
+
+    try:
+        ptg.set_global_terminal(terminal)
+
+        label = ptg.Label("Hello")
+        label.styles.value = "bold"
+
+        # Explicit styles keep the output independent from any loaded config
+        window = ptg.Window(label, width=12, box="SINGLE")
+        window.styles.border__corner = "bold"
+        window.styles.fill = ""
+        window.pos = (3, 2)
+
+        compositor = Compositor([window], 60)
+        compositor.draw()
+
+    finally:
+        ptg.set_global_terminal(previous)
+
+    assert screen.get_lines() == [
+        "",
+        "  ┌──────────┐",
+        "  │   Hello  │",
+        "  └──────────┘",
+        "",
+        "",
+    ]
+
+    assert screen.frames == 1
+    assert not screen.synchronized
+    assert screen.bytes_written > screen.cells_changed > 0
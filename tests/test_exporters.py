@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import io
+import xml.dom.minidom as md
+
+import pytest
 from testfixtures import compare
 
 import pytermgui
-from pytermgui import Color, DensePixelMatrix, str_to_color, tim
+from pytermgui import Color, DensePixelMatrix, MarkupLanguage, str_to_color, tim
+from pytermgui.exporters import export_many, to_html, to_svg
+from pytermgui.stream_exporters import stream_html, stream_svg
 from pytermgui.term import Recorder, Terminal, terminal
 
 try:
@@ -982,7 +988,16 @@ class SizedTerminal(Terminal):
         return (80, 25)
 
 
+@pytest.fixture(autouse=True)
+def _restore_terminal():
+    previous = pytermgui.get_terminal()
+    yield
+    pytermgui.set_global_terminal(previous)
+
+
 def _generate_stressor(term: Terminal = terminal) -> Recorder:
+    # Colors are localized by the global terminal, so it has to match the previous one
+    term.forced_colorsystem = pytermgui.get_terminal().colorsystem
     pytermgui.set_global_terminal(term)
 
     with term.record() as recording:
@@ -1031,6 +1046,38 @@ def test_export_html():
     compare(output, HTML_TARGET)
 
 
+def test_stream_html():
+    recording = _generate_stressor()
+
+    Color.default_background = str_to_color("#000000")
+    Color.default_foreground = str_to_color("#ffffff")
+
+    content = recording._content
+    expected = to_html(content)
+
+    file = io.StringIO()
+    written = stream_html(iter(content.splitlines(keepends=True)), file)
+    output = file.getvalue()
+
+    assert written == len(output)
+
+    # The same spans & classes are generated, only the stylesheet is moved to the
+    # end of the body.
+    head = expected.partition("\n        </style>")[0]
+    styles = head[head.index(".ptg-position") :].split("}", 1)[1][1:]
+
+    compare(
+        output,
+        expected.replace(styles, "", 1).replace(
+            "</body>", "<style>" + styles + "\n        </style>\n    </body>"
+        ),
+    )
+
+    file = io.StringIO()
+    stream_html(content, file, inline_styles=True)
+    compare(file.getvalue(), to_html(content, inline_styles=True))
+
+
 def test_export_svg():
     terminal = SizedTerminal()
 
@@ -1047,6 +1094,53 @@ def test_export_svg():
     compare(output, SVG_TARGET)
 
 
+def test_stream_svg():
+    terminal = SizedTerminal()
+
+    recording = _generate_stressor(terminal)
+
+    Color.default_background = str_to_color("#000000")
+    Color.default_foreground = str_to_color("#ffffff")
+
+    content = recording._content
+
+    file = io.StringIO()
+    written = stream_svg(content, file)
+    output = file.getvalue()
+
+    assert written == len(output)
+    assert written < len(to_svg(content))
+
+    # The result must be valid XML, with the stylesheet placed after the content
+    md.parseString(output)
+    assert output.rindex("<style") > output.rindex("</text>")
+    assert output.count("<rect") < SVG_TARGET.count("<rect")
+
+    # Lines of styled text must be handled the same as one joined string
+    file = io.StringIO()
+    stream_svg(iter(content.splitlines(keepends=True)), file)
+    compare(file.getvalue(), output)
+
+
+def test_export_many():
+    lang = MarkupLanguage()
+    lang.alias("report-title", "bold 141")
+
+    items = [
+        f"[report-title]Report {i}[/] [!gradient(#ff0000:#0000ff)]abc" for i in range(9)
+    ]
+    expected = [to_html(lang.parse(item)) for item in items]
+
+    compare(list(export_many(items, workers=1, lang=lang)), expected)
+    compare(list(export_many(iter(items), workers=2, lang=lang, chunksize=2)), expected)
+
+    svgs = list(export_many(items[:2], format="svg", workers=2, lang=lang, title="Hi"))
+    compare(svgs, [to_svg(lang.parse(item), title="Hi") for item in items[:2]])
+
+    with pytest.raises(ValueError):
+        export_many(items, format="png")
+
+
 def regenerate_targets():
     Color.default_background = str_to_color("#000000")
     Color.default_foreground = str_to_color("#ffffff")
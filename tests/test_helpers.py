@@ -1,4 +1,15 @@
-from pytermgui import break_line, real_length, tim
+from pytermgui import (
+    ColorSystem,
+    InputField,
+    Label,
+    LineWrapper,
+    ReflowCache,
+    break_line,
+    get_terminal,
+    real_length,
+    reflow_cache,
+    tim,
+)
 
 
 def test_break_plain():
@@ -18,9 +29,9 @@ def test_break_fancy():
         "\x1b[38;5;141m\x1b[1mlo \x1b[0m",
         "\x1b[38;5;141m\x1b[1mthe\x1b[0m",
         "\x1b[38;5;141m\x1b[1mre\x1b[0m\x1b[3m\x1b[38;5;4m \x1b[0m",
-        "\x1b[0m\x1b[3m\x1b[38;5;4mwha\x1b[0m",
-        "\x1b[0m\x1b[3m\x1b[38;5;4mts \x1b[0m",
-        "\x1b[0m\x1b[3m\x1b[38;5;4mup\x1b[38;5;6m\x1b[1m?\x1b[0m",
+        "\x1b[3m\x1b[38;5;4mwha\x1b[0m",
+        "\x1b[3m\x1b[38;5;4mts \x1b[0m",
+        "\x1b[3m\x1b[38;5;4mup\x1b[38;5;6m\x1b[1m?\x1b[0m",
     ]
 
 
@@ -31,6 +42,102 @@ def test_break_newline():
     assert list(broken) == ["this is too short", "sike"]
 
 
+def test_break_words():
+    text = "the quick brown fox jumps over the lazy dog"
+
+    assert list(break_line(text, 10, words=True)) == [
+        "the quick",
+        "brown fox",
+        "jumps over",
+        "the lazy",
+        "dog",
+    ]
+
+    text = "well-known supercalifragilistic"
+    broken = break_line(text, 8, words=True, hyphenate=True)
+    assert list(broken) == ["well-", "known", "superca-", "lifragi-", "listic"]
+
+    broken = list(break_line("日本語のテキスト", 5, words=True, fill="."))
+    assert broken == ["日本.", "語の.", "テキ.", "スト."]
+    assert all(real_length(line) == 5 for line in broken)
+
+
+def test_break_keeps_state():
+    text = tim.parse("[bold]one [~https://example.com]two three[/~] four")
+    lines = list(break_line(text, 5, words=True))
+
+    link = "\x1b]8;;https://example.com\x1b\\"
+
+    assert [real_length(line) for line in lines] == [3, 3, 5, 4]
+    assert lines[1] == f"\x1b[1m{link}two\x1b]8;;\x1b\\\x1b[0m"
+    assert lines[2].startswith(f"\x1b[1m{link}three")
+    assert lines[3] == "\x1b[1mfour\x1b[0m"
+
+
+def test_line_wrapper():
+    wrapper = LineWrapper(tim.parse("[141]Some text [bold]that wraps[/] a lot"))
+
+    for width in (4, 8, 12):
+        assert wrapper.wrap(width) == list(break_line(wrapper.line, width))
+        assert wrapper.wrap(width, words=True) == list(
+            break_line(wrapper.line, width, words=True)
+        )
+
+    assert wrapper.wrap(8) is not wrapper.wrap(8)
+
+
+def test_reflow_cache():
+    cache = ReflowCache(size=2)
+
+    assert cache.wrap("one two", 3, words=True) == ["one", "two"]
+    cache.wrap("a", 1)
+    cache.wrap("one two", 4)
+    cache.wrap("b", 1)
+
+    assert len(cache) == 2
+    assert "one two" in cache and "a" not in cache
+
+    label = Label("[bold]Some wrapped text")
+    label.width = 8
+
+    styled = label.styles.value(label.value)
+
+    assert label.get_lines() == list(break_line(styled, 8, words=True))
+    assert styled in reflow_cache
+
+    styled = []
+    field = InputField("Some value\nMore", multiline=True)
+    field.styles.value = lambda _, item: styled.append(item) or item
+    field.styles.prompt = lambda _, item: item
+    cached = len(reflow_cache)
+
+    field.get_lines()
+    field.width = 4
+    assert field.get_lines()[:3] == ["Some", " val", "ue  "]
+    assert styled == ["Some value", "More"]
+
+    # Fields keep their own wrappers
+    assert len(reflow_cache) == cached
+
+
+def test_reflow_cache_color_system():
+    cache = ReflowCache()
+    text = "\x1b[38;2;255;0;0mred"
+    terminal = get_terminal()
+    forced = terminal.forced_colorsystem
+
+    try:
+        for system in (ColorSystem.TRUE, ColorSystem.STANDARD):
+            terminal.forced_colorsystem = system
+
+            assert cache.wrap(text, 5) == list(break_line(text, 5))
+
+    finally:
+        terminal.forced_colorsystem = forced
+
+    assert len(cache) == 2
+
+
 # NOTE: This is no longer a part of PTG. It might come back in the future, which is
 #       why the tests are going to stay for now.
 # def test_get_applied_sequences_full_unset():
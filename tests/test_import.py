@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytermgui as ptg
+
+ROOT = Path(__file__).parents[1]
+
+EXPORTED_NAMES = """
+ASCII ASCII_O ASCII_X AliasToken Animator AnsiSyntaxError Any AttrAnimation Button
+COLOR_TABLE Callable CenteringPolicy CharType Checkbox ClearToken Collapsible Color
+ColorPicker ColorSystem ColorToken Compositor Container ContextDict CursorToken
+DensePixelMatrix DepthlessStyleType Double FancyReprWidget FileLoader FloatAnimation
+Frame Frameless HEXColor HLinkToken Heavy Highlighter HighlighterStyle
+HorizontalAlignment IndexedColor InputField Inspector Iterator JsonLoader
+KeyboardButton Keys Label Layout Light LineLengthError MacroToken MarkupFormatter
+MarkupLanguage MarkupSyntaxError MouseAction MouseEvent NAMED_COLORS Optional
+Overflow Padded Palette PixelMatrix PlainToken PseudoToken RGBColor Recorder
+RegexHighlighter Rounded ScrollableWidget Serializer SizePolicy Slider Splitter
+StandardColor StyleCall StyleManager StyleToken StyleType StyledText
+SupportsFancyRepr Terminal Toggle Token Type Union VerticalAlignment Widget
+WidgetChange WidgetNamespace WidgetType WidthExceededError Window WindowManager
+XTERM_NAMED_COLORS YamlLoader aliases alt_buffer analogous animations animator
+annotations ansi_interface auto background base blink bold boxes break_line
+build_fancy_repr button cast checkbox clear clear_color_cache collapsible color_info
+color_picker colors compositor consume_tag containers context_managers
+create_context_dict cursor_at cursor_column cursor_down cursor_home cursor_left
+cursor_next_line cursor_prev_line cursor_right cursor_up dim enums escape
+escape_markup exceptions exporters fancy_repr feed file_loaders foreground frames
+get_id get_markup get_terminal get_widget getch getch_timeout helpers hide_cursor
+highlight_python highlight_tim highlighters inline input input_field inspect
+inspector inverse invisible is_animated italic keyboard_button keys language layouts
+macros manager markup mouse_handler move_cursor optimize_markup optimize_tokens
+overline palette palettes parse parse_tokens parsing pixel_matrix prettifiers
+prettify print_to real_length regex report_cursor report_mouse reset restore_cursor
+restore_screen save_cursor save_screen serialization serializer set_alt_buffer
+set_echo set_global_terminal set_mode show_cursor slider str_to_color strikethrough
+strip_ansi strip_markup style_maps styles supports_fancy_repr sys term terminal tim
+to_html toggle token_to_css tokenize_ansi tokenize_markup tokens tokens_to_markup
+translate_mouse triadic underline unset_alt_buffer unset_echo w_styles widgets
+win32console window window_manager zip_longest
+""".split()
+"""The public names of the package from before lazy loading was introduced."""
+
+IMPORT_BUDGET = 0.5
+"""The maximum time, in seconds, spent in pytermgui's own modules on import.
+
+This is a lot more generous than the one in `benchmarks/import_time.py`, so that it
+only fails on regressions like a heavy module no longer being imported lazily.
+"""
+
+LAZY_MODULES = [
+    "yaml",
+    "pytermgui.animations",
+    "pytermgui.exporters",
+    "pytermgui.file_loaders",
+    "pytermgui.highlighters",
+    "pytermgui.inspector",
+    "pytermgui.serialization",
+    "pytermgui.widgets",
+    "pytermgui.window_manager",
+]
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        check=True,
+        cwd=ROOT,
+        text=True,
+    )
+
+
+def _get_import_time() -> float:
+    """Returns the self time of all pytermgui modules during `import pytermgui`."""
+
+    output = _run("import pytermgui", "-X", "importtime").stderr
+    total = 0
+
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        self_time, _, name = line[len("import time:") :].split("|")
+
+        if name.strip().startswith("pytermgui"):
+            total += int(self_time)
+
+    return total / 1_000_000
+
+
+def test_import_is_lazy():
+    code = (
+        "import sys, pytermgui;"
+        + "print(*sorted(name for name in sys.modules if name in {modules!r}))"
+    )
+    output = _run(code.format(modules=set(LAZY_MODULES))).stdout
+
+    assert output.split() == []
+
+
+def test_import_time_budget():
+    best = min(_get_import_time() for _ in range(3))
+
+    assert best < IMPORT_BUDGET
+
+
+def test_lazy_names():
+    assert ptg.Window is ptg.window_manager.Window
+    assert ptg.auto("Hello").value == "Hello"
+    assert ptg.terminal is ptg.get_terminal()
+    assert "WindowManager" in dir(ptg)
+
+    for module, names in ptg._LAZY_EXPORTS.items():
+        submodule = getattr(ptg, module)
+        public = getattr(submodule, "__all__", names)
+
+        assert set(public) <= set(names), module
+
+        for name in names:
+            assert getattr(ptg, name) is getattr(submodule, name)
+
+    assert set(ptg.__all__) >= set(ptg._LAZY_NAMES)
+
+
+def test_exported_names():
+    names = dir(ptg)
+
+    for name in EXPORTED_NAMES:
+        assert name in names
+        assert getattr(ptg, name) is not None
@@ -0,0 +1,63 @@
+import pytermgui as ptg
+
+
+def test_incremental_restyle():
+    field = ptg.InputField("first\nsecond\nthird", prompt="> ", multiline=True)
+    field.width = 20
+
+    before = field.get_lines()
+    assert len(before) == 3
+
+    field.move_cursor((1, 0), absolute=True)
+    field.handle_key("x")
+
+    after = field.get_lines()
+    assert after[0] is before[0]
+    assert after[2] is before[2]
+    assert ptg.strip_ansi(after[1]).rstrip() == "xsecond"
+    assert field.value == "first\nxsecond\nthird"
+
+
+def test_prompt_follows_first_line():
+    field = ptg.InputField("first\nsecond", prompt="> ", multiline=True)
+    field.width = 20
+    field.get_lines()
+
+    field.move_cursor((0, 0), absolute=True)
+    field.handle_key(ptg.keys.ENTER)
+
+    lines = [ptg.strip_ansi(line).rstrip() for line in field.get_lines()]
+    assert lines == [">", "first", "second"]
+
+
+def test_incremental_highlighting():
+    field = ptg.InputField(
+        "x = 1\ny = 2\nz = 3",
+        multiline=True,
+        highlighter=ptg.highlight_python,
+        width=20,
+    )
+
+    before = field.get_lines()
+
+    field.move_cursor((0, 0), absolute=True)
+    for char in '"""':
+        field.handle_key(char)
+
+    after = field.get_lines()
+    string_style = ptg.tim.parse("[code.multiline_str]y").split("y")[0]
+
+    assert all(line.startswith(string_style) for line in after[1:])
+    assert after[1:] != before[1:]
+
+
+def test_highlight_line_state():
+    lines = ['text = """first', "second", 'third""" + str(1)']
+
+    state = None
+    states = []
+    for line in lines:
+        _, state = ptg.highlight_python.highlight_line(line, state)
+        states.append(state)
+
+    assert states == ["multiline_str", "multiline_str", None]
@@ -7,7 +7,11 @@ from itertools import zip_longest
 import pytest
 
 from pytermgui import (
+    ColorSystem,
+    MarkupLanguage,
+    ScreenEmulator,
     StyledText,
+    get_terminal,
     pretty,
     tim,
     tokenize_ansi,
@@ -17,8 +21,10 @@ from pytermgui import (
 from pytermgui.colors import Color, str_to_color
 from pytermgui.markup import StyledText, Token
 from pytermgui.markup import tokens as tkns
-from pytermgui.markup.parsing import parse_tokens
+from pytermgui.markup.macros import PURE_MACROS
+from pytermgui.markup.parsing import optimize_tokens, parse_tokens
 from pytermgui.markup.style_maps import CLEARERS, STYLES
+from pytermgui.regex import RE_LINK
 
 
 def random_plain() -> tkns.PlainToken:
@@ -132,11 +138,102 @@ class TestFunctionality:
         tim.alias("test", "141")
         assert tim.parse("[test]Test") == tim.parse("[141]Test")
 
+    def test_alias_invalidation(self):
+        lang = MarkupLanguage(default_aliases=False)
+        lang.alias("base", "141")
+        lang.alias("title", "base bold")
+
+        assert lang.parse("[title]Test") == lang.parse("[141 bold]Test")
+        assert lang.parse("[later]Test") == "[later]Test\x1b[0m"
+        unrelated = lang.parse("[bold]Unrelated")
+
+        lang.alias("base", "@61")
+        lang.alias("later", "italic")
+
+        assert lang.resolve_alias("title") == lang.resolve_alias("base") + [
+            tkns.StyleToken("bold")
+        ]
+        assert lang.parse("[title]Test") == lang.parse("[@61 bold]Test")
+        assert lang.parse("[later]Test") == lang.parse("[italic]Test")
+        assert lang.parse("[bold]Unrelated") is unrelated
+
     def test_define(self):
         tim.define("!upper", lambda item: item.upper())
         assert tim.parse("[!upper]test", append_reset=False) == "TEST"
         assert tim.parse("[!upper 141]test") == tim.parse("[141]TEST")
 
+    def test_define_pure(self):
+        lang = MarkupLanguage(default_aliases=False)
+        calls = []
+
+        def _count(item: str) -> str:
+            calls.append(item)
+            return str(len(calls))
+
+        lang.define("!count", _count, pure=True)
+        lang.alias("counted", "!count bold")
+
+        assert lang.parse("[!count]a") == lang.parse("[!count]a") == "1\x1b[0m"
+        assert lang.parse("[counted]b") == lang.parse("[counted]b")
+        assert calls == ["a", "b"]
+
+        lang.define("!count", _count)
+        assert lang.parse("[!count]a") == "3\x1b[0m"
+        assert lang.parse("[!count]a") == "4\x1b[0m"
+        assert lang.parse("[counted]b") != lang.parse("[counted]b")
+
+        lang.define("!wrap", lambda char, item: char + item + char, pure=True)
+        lang.alias("wrapped", "!wrap(x)")
+        assert lang.parse("[wrapped]hi", append_reset=False) == "xhix"
+
+        lang.define("!wrap", lambda _, item: item, pure=True)
+        assert lang.parse("[wrapped]hi", append_reset=False) == "hi"
+
+    def test_color_macros(self):
+        expected = tim.parse("[red]a[orange]b[/fg]") + "\x1b[0m"
+        assert tim.parse("[!rainbow]ab") == expected
+
+        assert (
+            tim.parse("[!gradient(#ff0000:#0000ff)]abc")
+            == tim.parse("[#ff0000]a[127;0;127]b[#0000ff]c[/fg]") + "\x1b[0m"
+        )
+
+    def test_color_macros_follow_color_system(self):
+        terminal = get_terminal()
+        forced = terminal.forced_colorsystem
+        expected = {
+            ColorSystem.TRUE: "\x1b[38;2;255;0;0ma",
+            ColorSystem.EIGHT_BIT: "\x1b[38;5;196ma",
+            ColorSystem.STANDARD: "\x1b[31ma",
+        }
+
+        lang = MarkupLanguage(default_aliases=False)
+        calls = []
+
+        def _system(item: str) -> str:
+            calls.append(item)
+            return get_terminal().colorsystem.name
+
+        lang.define("!system", _system, pure=True)
+        lang.alias("system", "!system")
+
+        try:
+            for system, start in expected.items():
+                terminal.forced_colorsystem = system
+
+                assert tim.parse("[!rainbow]ab").startswith(start)
+                assert tim.parse("[!gradient(#ff0000:#0000ff)]ab").startswith(start)
+
+                for _ in range(2):
+                    assert lang.parse("[!system]a", append_reset=False) == system.name
+                    assert lang.parse("[system]b", append_reset=False) == system.name
+
+        finally:
+            terminal.forced_colorsystem = forced
+
+        assert {"!rainbow", "!gradient"} <= PURE_MACROS
+        assert len(calls) == 6
+
     def test_pprint_works(self):
         for obj in [{1, 2, 3}, "test", set, list(range(10)), {"abc": "efg"}]:
             pretty.pprint(obj)
@@ -177,3 +274,28 @@ def test_random_tokens() -> None:
         assert expected == real, f"Expected {expected}, got {real}"
 
     assert tokens == reverse
+
+
+def test_optimized_tokens_render_identically() -> None:
+    generators = [random_plain, random_color, random_style, random_clear, random_hlink]
+    rand_state = random.getstate()
+
+    def _render(tokens: list[tkns.Token]) -> tuple[list, list]:
+        output = parse_tokens(tokens, append_reset=False)
+
+        screen = ScreenEmulator((1000, 1))
+        screen.write(output)
+
+        return screen.cells[0], RE_LINK.findall(output)
+
+    try:
+        for seed in range(200):
+            random.seed(seed)
+            tokens = [random.choice(generators)() for _ in range(40)]
+            optimized = list(optimize_tokens(tokens))
+
+            assert _render(tokens) == _render(optimized), tokens_to_markup(tokens)
+            assert len(optimized) <= len(tokens)
+
+    finally:
+        random.setstate(rand_state)
@@ -0,0 +1,56 @@
+import array
+
+import pytest
+
+import pytermgui as ptg
+
+
+@pytest.fixture(autouse=True)
+def _true_color():
+    previous = ptg.terminal.forced_colorsystem
+    ptg.terminal.forced_colorsystem = ptg.ColorSystem.TRUE
+
+    yield
+
+    ptg.terminal.forced_colorsystem = previous
+
+
+def test_rgb_matrix_runs():
+    matrix = ptg.RGBPixelMatrix(4, 2, default=(255, 0, 0))
+    matrix[1, 2] = "#00ff00"
+
+    assert matrix.get_lines() == [
+        "\x1b[48;2;255;0;0m        \x1b[0m",
+        "\x1b[48;2;255;0;0m    \x1b[48;2;0;255;0m  \x1b[48;2;255;0;0m  \x1b[0m",
+    ]
+    assert matrix[1, 2] == (0, 255, 0)
+
+
+def test_rgb_matrix_set_frame():
+    matrix = ptg.RGBPixelMatrix(2, 2)
+    first = matrix.get_lines()
+
+    frame = array.array("B", [0] * 6 + [1, 2, 3] * 2)
+    matrix.set_frame(frame)
+    lines = matrix.get_lines()
+
+    assert lines[0] is first[0]
+    assert lines[1] == "\x1b[48;2;1;2;3m    \x1b[0m"
+
+    # The frame is not copied
+    frame[0] = 255
+    assert matrix[0, 0] == (255, 0, 0)
+
+    with pytest.raises(ValueError):
+        matrix.set_frame(bytearray(3))
+
+
+def test_dense_rgb_matrix():
+    matrix = ptg.DenseRGBPixelMatrix(2, 3, default=(0, 0, 0))
+    matrix[1, 1] = (1, 1, 1)
+
+    assert matrix.get_lines() == [
+        "\x1b[38;2;0;0;0;48;2;0;0;0m▀\x1b[38;2;0;0;0;48;2;1;1;1m▀\x1b[0m",
+        "\x1b[38;2;0;0;0;49m▀▀\x1b[0m",
+    ]
+    assert matrix.height == 2
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import io
+import json
+
+import pytermgui as ptg
+from pytermgui.window_manager.profiler import PHASES
+
+
+def test_profiler_frames():
+    screen = ptg.ScreenEmulator((60, 20))
+    terminal = ptg.Terminal(screen, size=screen.size)
+    previous = ptg.get_terminal()
+    terminal.forced_colorsystem = previous.colorsystem
+
+    original = ptg.Container.get_lines
+
+    try:
+        ptg.set_global_terminal(terminal)
+
+        window = ptg.Window(ptg.Container("Nested", ptg.Label("Label")), title="Main")
+        compositor = ptg.Compositor([window], 60)
+
+        compositor.draw()
+        assert len(compositor.profiler.frames) == 0
+
+        compositor.profiler.start(widgets=True)
+        assert ptg.Container.get_lines is not original
+
+        compositor.redraw()
+        compositor.draw()
+
+    finally:
+        compositor.profiler.stop()
+        ptg.set_global_terminal(previous)
+
+    assert ptg.Container.get_lines is original
+
+    profiler = compositor.profiler
+    first, second = profiler.frames
+
+    assert list(first.phases) == list(PHASES)
+    assert first.phases["write"] > 0
+    assert second.phases["write"] == 0
+    assert list(first.windows) == ["Main"]
+    assert first.total >= sum(first.phases.values())
+
+    widgets = profiler.widgets
+    assert widgets["Window"].calls == 2
+    assert widgets["Container"].calls == 2
+    assert widgets["Label"].calls >= 2
+    assert widgets["Window"].total >= widgets["Container"].total
+    assert widgets["Window"].own < widgets["Window"].total
+
+    file = io.StringIO()
+    profiler.save_json(file)
+
+    data = json.loads(file.getvalue())
+    assert data["frames"] == 2
+    assert data["last_frame"]["windows"]["Main"] >= 0
+    assert set(data["widgets"]) >= {"Window", "Container", "Label"}
+
+
+def test_profiler_overlay():
+    profiler = ptg.FrameProfiler()
+    profiler.start()
+
+    with profiler.phase("diff"):
+        pass
+
+    profiler.add_window(ptg.Window(title="Editor"), 0.002)
+    profiler.end_frame()
+    profiler.stop()
+
+    overlay = ptg.ProfilerOverlay(profiler)
+    text = "\n".join(ptg.strip_ansi(line) for line in overlay.get_lines())
+
+    assert "Profiler" in text
+    assert "frame" in text
+    assert "Editor" in text
+    assert "2.000ms" in text
+
+    # Labels are kept between frames
+    labels = list(overlay._widgets)
+    overlay.get_lines()
+    assert overlay._widgets == labels
+    assert all(a is b for a, b in zip(overlay._widgets, labels))
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import pytest
+
+import pytermgui as ptg
+from pytermgui.widgets.selectors import parse_selector
+
+
+def _build_form() -> tuple[ptg.Window, ptg.Button, ptg.Button]:
+    submit = ptg.Button("Submit", id="query-submit")
+    submit.classes.add("primary")
+
+    cancel = ptg.Button("Cancel")
+
+    window = ptg.Window(
+        ptg.Label("Title"),
+        ptg.Container(
+            ptg.InputField("name", parent_align=ptg.HorizontalAlignment.RIGHT),
+            ptg.InputField("email"),
+            ptg.Splitter(submit, cancel),
+        ),
+        ptg.Button("Help"),
+    )
+
+    return window, submit, cancel
+
+
+def test_query_selectors():
+    window, submit, cancel = _build_form()
+    manager = ptg.WindowManager()
+    manager.add(window)
+
+    assert window.query("Button.primary") == [submit]
+    assert window.query("#query-submit") == [submit]
+    assert window.query("Window > Container Button") == [submit, cancel]
+    assert len(window.query("Window > Button")) == 1
+    assert len(window.query("InputField[parent_align=right]")) == 1
+    assert len(window.query("InputField[parent_align=2]")) == 1
+    assert len(window.query("InputField[value^=na], Label")) == 2
+
+    assert manager.query("Window > Container Button.primary") == [submit]
+    assert manager.query("Window") == [window]
+
+    with pytest.raises(ValueError):
+        parse_selector("Button >")
+
+
+def test_query_index_updates():
+    window, submit, cancel = _build_form()
+    splitter = submit.parent
+
+    splitter.remove(submit)
+    assert window.query("Button.primary") == []
+
+    splitter.parent.pop()
+    assert window.query("Splitter Button") == []
+    assert window.get_descendants("Splitter") == []
+
+    inner = ptg.Container(ptg.Container(submit))
+    window[0] = inner
+    assert window.query("Container Container > Button") == [submit]
+    assert len(window.get_descendants("Button")) == 2
+
+    window.set_widgets([cancel])
+    assert window.get_descendants() == [cancel]
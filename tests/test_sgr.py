@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import random
+
+import pytermgui as ptg
+from pytermgui.sgr import SGREncoder, minimize_sgr
+from pytermgui.window_manager.compositor import Compositor
+
+CODES = ["0", "", "1", "2", "3", "4", "7", "9", "22", "23", "24", "27", "29"]
+CODES += ["31", "39", "42", "49", "38;5;141", "48;2;1;2;3", "53", "55"]
+
+
+def _render(text: str) -> list[list[ptg.Cell]]:
+    screen = ptg.ScreenEmulator((40, 3))
+    screen.write(text)
+
+    return screen.cells
+
+
+def test_sgr_encoder():
+    encoder = SGREncoder()
+
+    assert encoder.encode("\x1b[1m\x1b[31mhi\x1b[0m\x1b[1;31m there\x1b[0m") == (
+        "\x1b[1;31mhi there"
+    )
+    assert encoder.encode("\x1b[0m\x1b[1m\x1b[2K") == "\x1b[39m\x1b[2K"
+    assert encoder.flush() == ""
+    assert encoder.encode("\x1b[0m") == ""
+    assert encoder.flush() == "\x1b[0m"
+
+    encoder.reset()
+    assert encoder.encode("\x1b[3;3Hx") == "\x1b[3;3H\x1b[0mx"
+    assert minimize_sgr("\x1b[1m\x1b[0m\x1b[4ma\x1b[0m") == "\x1b[4ma\x1b[0m"
+
+
+def test_sgr_untracked_params():
+    assert minimize_sgr("\x1b[58;5;196mA") == "\x1b[58;5;196mA"
+    assert minimize_sgr("\x1b[58;2;1;2;3;4mA") == "\x1b[4;58;2;1;2;3mA"
+
+    # A reset form must re-emit the double underline, which is not tracked
+    assert minimize_sgr("\x1b[21;1;38;2;1;2;3mA\x1b[22;39;3mB") == (
+        "\x1b[1;38;2;1;2;3;21mA\x1b[0;3;21mB"
+    )
+    assert minimize_sgr("\x1b[21mA\x1b[0;1mB") == "\x1b[21mA\x1b[0;1mB"
+
+
+def test_sgr_encoder_renders_identically():
+    rand_state = random.getstate()
+
+    try:
+        for seed in range(200):
+            random.seed(seed)
+            text = ""
+
+            for _ in range(30):
+                if random.random() < 0.3:
+                    text += random.choice(["ab", "c", "\x1b[2;5H", "\x1b[K", "\n"])
+                    continue
+
+                text += f"\x1b[{random.choice(CODES)}m"
+
+            assert _render(text) == _render(minimize_sgr(text)), repr(text)
+
+    finally:
+        random.setstate(rand_state)
+
+
+def test_compositor_encoder():
+    screens = []
+
+    for encode in (False, True):
+        screen = ptg.ScreenEmulator((80, 30))
+        terminal = ptg.Terminal(screen, size=screen.size)
+        terminal.forced_colorsystem = ptg.get_terminal().colorsystem
+
+        window = ptg.Window(
+            "[bold]Title",
+            ptg.Splitter("[@60] Left ", "[141]Center", "[@57 bold]Right"),
+            ptg.InputField("Value", prompt="Input: "),
+            ptg.Checkbox(),
+            width=50,
+        )
+        compositor = Compositor([window], framerate=60)
+
+        if not encode:
+            compositor.encoder = None
+
+        previous = ptg.get_terminal()
+        ptg.set_global_terminal(terminal)
+
+        try:
+            compositor.draw()
+        finally:
+            ptg.set_global_terminal(previous)
+
+        screens.append(screen)
+
+    raw, encoded = screens
+
+    assert raw.cells == encoded.cells
+    assert encoded.bytes_written < raw.bytes_written
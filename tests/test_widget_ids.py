@@ -0,0 +1,55 @@
+import gc
+
+import pytermgui as ptg
+
+
+def test_id_lookup():
+    label = ptg.Label("Hello", id="ids-label")
+
+    assert ptg.get_widget("ids-label") is label
+    assert ptg.get_id(label) == "ids-label"
+
+    label.id = "ids-renamed"
+
+    assert ptg.get_widget("ids-label") is None
+    assert ptg.get_widget("ids-renamed") is label
+    assert ptg.get_id(label) == "ids-renamed"
+
+    other = ptg.Button("There")
+    other.id = "ids-renamed"
+
+    assert ptg.get_widget("ids-renamed") is other
+    assert ptg.get_id(label) is None
+
+    ids_by_type = ptg.widgets._manager._ids_by_type
+    assert "ids-renamed" not in ids_by_type[ptg.Label]
+    assert "ids-renamed" in ids_by_type[ptg.Button]
+    assert ptg.get_id(ptg.Label("Not registered")) is None
+
+
+def test_ids_are_weak():
+    ptg.Label("Temporary", id="ids-temporary")
+    gc.collect()
+
+    assert ptg.get_widget("ids-temporary") is None
+    assert ptg.find_widgets("ids-temporary") == []
+
+
+def test_find_widgets():
+    widgets = [
+        ptg.Label("A", id="form.name"),
+        ptg.InputField("B", id="form.input"),
+        ptg.Button("C", id="form.submit"),
+        ptg.Label("D", id="formless"),
+        ptg.Container(id="form-container"),
+    ]
+
+    assert [w.id for w in ptg.find_widgets("form.")] == [
+        "form.input",
+        "form.name",
+        "form.submit",
+    ]
+    assert ptg.find_widgets("form.", widget_type=ptg.Label) == [widgets[0]]
+    assert ptg.find_widgets("form", widget_type=ptg.Container) == [widgets[-1]]
+    assert set(ptg.find_widgets(widget_type=ptg.Label)) >= {widgets[0], widgets[3]}
+    assert ptg.find_widgets("not-an-id") == []
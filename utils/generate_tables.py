@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Generates `pytermgui/default_tables.py`.
+
+Run this after changing `DEFAULT_ALIASES` or the default palette:
+
+    python3 utils/generate_tables.py
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from pytermgui.markup import MarkupLanguage
+from pytermgui.markup.aliases import DEFAULT_ALIASES
+from pytermgui.palettes import DEFAULT_PRIMARY, Palette
+
+OUTPUT = Path(__file__).parent.parent / "pytermgui" / "default_tables.py"
+
+HEADER = '''\
+"""The default alias & palette tables, loaded as-is on import.
+
+This file is generated by `utils/generate_tables.py`, don't edit it by hand.
+"""
+'''
+
+
+def generate_alias_table() -> dict[str, str]:
+    """Returns `DEFAULT_ALIASES` together with their generated unsetters."""
+
+    lang = MarkupLanguage(default_aliases=False)
+    lang.alias_multiple(**DEFAULT_ALIASES)
+
+    return lang.aliases
+
+
+def generate_palette_table() -> dict[str, str]:
+    """Returns the data of the palette generated from `DEFAULT_PRIMARY`."""
+
+    return Palette(primary=DEFAULT_PRIMARY).data
+
+
+def main() -> None:
+    """Writes the generated tables into `OUTPUT`."""
+
+    tables = {
+        "DEFAULT_ALIAS_TABLE": generate_alias_table(),
+        "DEFAULT_PALETTE_TABLE": generate_palette_table(),
+    }
+
+    content = HEADER
+
+    for name, table in tables.items():
+        content += f"\n{name} = {{\n"
+
+        for key, value in table.items():
+            content += f"    {json.dumps(key)}: {json.dumps(value)},\n"
+
+        content += "}\n"
+
+    OUTPUT.write_text(content, encoding="utf-8")
+    print(f"Generated {OUTPUT}.")
+
+
+if __name__ == "__main__":
+    main()